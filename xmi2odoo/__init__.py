@@ -21,6 +21,7 @@
 ##############################################################################
 
 import uml
+import memory
 import model
 import builder
 import validation
@@ -20,17 +20,20 @@
 #
 ##############################################################################
 
-import pkg_resources, os, sys, shutil
+import pkg_resources, os, sys, shutil, fnmatch
+import multiprocessing
 from xmi2odoo import uml
-from xmi2odoo.model import Model
+from xmi2odoo.model import Model, package_selected
 from datetime import date
 from pprint import PrettyPrinter
 import logging
 from xml.sax.saxutils import escape as xmlescape
-from mako.template import Template
+from mako.template import Template, ModuleTemplate
 from mako.exceptions import RichTraceback
-
-import itertools
+from mako import codegen
+import md5
+import types
+import re
 
 def escape(s, entities={}):
     if isinstance(s, unicode):
@@ -55,6 +58,182 @@ def stereotype_dict(items, attribute, dictmap, default=None, prefix=None, suffix
             r[k] = default
     return r
 
+# Compiled templates of the process, by md5 of their source. See TemplateCache.
+_templates = {}
+
+# Templates of the files read by the process, or None for static files.
+_files = {}
+
+# Mako expressions, tags, control lines, comments and line continuations.
+_syntax_re = re.compile(r'\$\{|</?%|^[ \t]*%|##|\\$', re.M)
+
+def _replace(filename, write):
+    """Create filename calling write with a temporary file name, and rename it at once."""
+    tmpfilename = '%s.%i.tmp' % (filename, os.getpid())
+    write(tmpfilename)
+    os.rename(tmpfilename, filename)
+
+class TemplateCache:
+    """Compiled templates by their source text.
+
+    Each source is compiled once per process, whatever the file it renders.
+    If module_directory is given, the code generated for each source is
+    stored there by the md5 of the source, and later builds load it instead
+    of compiling again.
+
+    >>> import tempfile; tmpdir = tempfile.mkdtemp()
+    >>> cache = TemplateCache(tmpdir)
+    >>> cache.get_template('Hello ${name}!').render(name='world')
+    u'Hello world!'
+    >>> cache.get_template('Hello ${name}!') is cache.get_template('Hello ${name}!')
+    True
+    >>> _templates.clear()
+    >>> TemplateCache(tmpdir).get_template('Hello ${name}!').module.__name__.startswith('xmi2odoo_template_')
+    True
+    >>> shutil.rmtree(tmpdir)
+
+    Files without Mako syntax are static.
+
+    >>> source = pkg_resources.resource_filename(__name__, 'data/template/8.0')
+    >>> cache.get_file(os.path.join(source, 'test/README')) is None
+    True
+    >>> cache.get_file(os.path.join(source, 'README')).render(LICENSE_HEADER='', MODULE_NAME='sale', MODULE_DESCRIPTION='Sales.').split()
+    [u'sale', u'Sales.']
+    """
+
+    def __init__(self, module_directory=None):
+        self.module_directory = module_directory and os.path.expanduser(module_directory)
+
+    def get_template(self, text, filename=None):
+        """Return the Template of the source text. filename is used in error messages."""
+        digest = md5.md5(str(codegen.MAGIC_NUMBER))
+        digest.update(text)
+        key = digest.hexdigest()
+        tmpl = _templates.get(key)
+        if tmpl is None:
+            path = self.module_directory and os.path.join(self.module_directory, '%s.py' % key)
+            if path and os.path.exists(path):
+                tmpl = self._load(key, path, text, filename)
+            else:
+                tmpl = Template(text, filename=filename)
+                if path:
+                    self._store(path, tmpl.code)
+            _templates[key] = tmpl
+        return tmpl
+
+    def get_file(self, filename):
+        """Return the Template of the file filename, or None if it is static.
+
+        Each file is read once per process.
+        """
+        if filename not in _files:
+            text = open(filename).read()
+            static = (os.path.basename(filename)[0] == '.' or filename[-4:] == '.swp'
+                      or not _syntax_re.search(text))
+            _files[filename] = None if static else self.get_template(text, filename)
+        return _files[filename]
+
+    def _load(self, key, path, text, filename):
+        """Return the Template of the module stored in path."""
+        source = open(path, 'rb').read().decode('utf-8')
+        module = types.ModuleType('xmi2odoo_template_%s' % key)
+        exec compile(source, path, 'exec') in module.__dict__
+        logging.debug('Template %s loaded from %s.' % (filename, path))
+        return ModuleTemplate(module, module_filename=path, template_filename=filename,
+                              module_source=source, template_source=text)
+
+    def _store(self, path, source):
+        """Write the generated module source to path, replacing it at once."""
+        if not os.path.exists(self.module_directory):
+            os.makedirs(self.module_directory)
+        def write(tmpfilename):
+            with open(tmpfilename, 'wb') as out:
+                out.write(source.encode('utf-8') if isinstance(source, unicode) else source)
+        _replace(path, write)
+
+class MenuGraph:
+    """Index of the use cases reached from the menues of a package.
+
+    The next use cases of each one are listed once. Each group of menues is
+    ordered from its roots, every use case after the ones leading to it.
+
+    >>> model = Model("xmi2odoo/test/data/test_005.xmi")
+    >>> menues = [ model['test_005:menu:orders'], model['test_005:menu:sales'] ]
+    >>> [ m.name for m in MenuGraph(menues, model.uml.CUseCase).order() ]
+    [u'sales', u'orders']
+    """
+
+    def __init__(self, menues, ctype):
+        self.menues = menues
+        self.ctype = ctype
+        self._nexts = {}
+
+    def nexts(self, usecase):
+        """Use cases reached from usecase."""
+        nexts = self._nexts.get(usecase)
+        if nexts is None:
+            nexts = self._nexts[usecase] = usecase.nexts(self.ctype)
+        return nexts
+
+    def group(self, menu):
+        """Return the use cases reached from the roots of menu in topological order.
+
+        Roots keep the order of prev_leafs, and the others are sorted by their
+        longest distance to a root and then by name. Raise RuntimeError if
+        there is a loop.
+        """
+        roots = menu.prev_leafs(self.ctype, self.ctype)
+        reached = list(roots)
+        level = dict((r, 0) for r in roots)
+        for usecase in reached:
+            for n in self.nexts(usecase):
+                if n not in level:
+                    level[n] = 0
+                    reached.append(n)
+        indegree = dict((u, 0) for u in reached)
+        for usecase in reached:
+            for n in self.nexts(usecase):
+                indegree[n] += 1
+        ready = [ r for r in roots if indegree[r] == 0 ]
+        while ready:
+            usecase = ready.pop()
+            for n in self.nexts(usecase):
+                level[n] = max(level[n], level[usecase] + 1)
+                indegree[n] -= 1
+                if indegree[n] == 0:
+                    ready.append(n)
+        loop = [ u.name for u in reached if indegree[u] ]
+        if loop:
+            raise RuntimeError, 'Loop in menues. Repeat for %s.' \
+                    'Check if they have undirected association ' \
+                    'or exists a loop in directed associations.' % loop
+        return sorted(reached, key=lambda u: (level[u], u.name if level[u] else None))
+
+    def order(self):
+        """Return the menues grouped by their roots, in topological order.
+
+        Groups are solved from the first menu not sorted yet, keeping the
+        use cases of the package of that menu.
+        """
+        sorted_items = []
+        sorted_xmi_ids = set()
+        menues_xmi_id = set([ i.xmi_id for i in self.menues ])
+        take_first = 0
+
+        while len(sorted_items) != len(self.menues):
+            first = self.menues[take_first]
+            r = [ m for m in self.group(first) if m.package.xmi_id == first.package.xmi_id ]
+            sorted_items += r
+            sorted_xmi_ids.update(m.xmi_id for m in r)
+
+            # If exists other groups of menues, prepare them to solve.
+            problematic_menues_xmi_id = menues_xmi_id - sorted_xmi_ids
+            if not problematic_menues_xmi_id:
+                break
+            take_first = self.menues.index([ i for i in self.menues if i.xmi_id in problematic_menues_xmi_id ][0])
+
+        return sorted_items
+
 class Builder:
     """Builder engine for addons.
 
@@ -73,26 +252,65 @@ class Builder:
     >>> builder = Builder(tmpdir, model)
     >>> builder.build('8.0')
     >>> shutil.rmtree(tmpdir)
+
+    Build the packages with two processes.
+
+    >>> model = Model("xmi2odoo/test/data/test_006.xmi")
+    >>> tmpdir = tempfile.mkdtemp()
+    >>> Builder(tmpdir, model).build('8.0', jobs=2)
+    >>> sorted(os.listdir(tmpdir))
+    ['account', 'base', 'sale', 'stock']
+    >>> shutil.rmtree(tmpdir)
+
+    Build only the selected packages. They can be selected by their clean
+    names, with the packages nested in them.
+
+    >>> model = Model("xmi2odoo/test/data/test_006.xmi", packages=['Sale'])
+    >>> tmpdir = tempfile.mkdtemp()
+    >>> Builder(tmpdir, model).build('8.0')
+    >>> sorted(os.listdir(tmpdir))
+    ['sale']
+    >>> shutil.rmtree(tmpdir)
+
+    Each package nested in a selected one is built as an addon, with the
+    classes declared in it.
+
+    >>> model = Model("xmi2odoo/test/data/test_007.xmi", packages=['sale'])
+    >>> tmpdir = tempfile.mkdtemp()
+    >>> Builder(tmpdir, model).build('8.0')
+    >>> sorted(os.listdir(tmpdir))
+    ['sale', 'stock']
+    >>> sorted(f for f in os.listdir(os.path.join(tmpdir, 'sale')) if f.endswith('.py'))
+    ['__init__.py', '__openerp__.py', 'order.py', 'partner.py', 'quotation.py']
+    >>> sorted(f for f in os.listdir(os.path.join(tmpdir, 'stock')) if f.endswith('.py'))
+    ['__init__.py', '__openerp__.py', 'picking.py', 'warehouse.py']
+    >>> shutil.rmtree(tmpdir)
     """
 
-    def __init__(self, path, model):
+    def __init__(self, path, model, template_cache=None):
         self.path = path
         self.model = model
+        self.templates = TemplateCache(template_cache)
         self.variables = None
         self.pp = PrettyPrinter(indent=4)
         self.t = 0
 
-    def update(self, tags, filename):
-        if filename[0] == "." or filename[-4:] == ".swp":
-           return
-        logging.info('Updating %s' % filename)
+    def render(self, tags, source, target):
+        """Write the file target rendering the template source with tags.
+
+        Static sources are copied. The target is written to a temporary file
+        and renamed, so it is created once and never left half written.
+        """
+        tmpl = self.templates.get_file(source)
+        if tmpl is None:
+            logging.info('Copying %s' % target)
+            _replace(target, lambda tmpfilename: shutil.copy2(source, tmpfilename))
+            return
+        logging.info('Updating %s' % target)
         try:
-            tmpl = Template(filename=filename, module_directory='/tmp/mako_modules')
-            with open(filename, 'w') as out:
-                s = tmpl.render(**tags)
-                out.write(s.encode('utf-8'))
+            s = tmpl.render(**tags).encode('utf-8')
         except UnicodeEncodeError, e:
-            print "Error in file %s.\nMessage: %s" % (filename, e)
+            print "Error in file %s.\nMessage: %s" % (target, e)
             raise
         except:
             traceback = RichTraceback()
@@ -102,6 +320,27 @@ class Builder:
                 m += line + "\n"
             m += "%s: %s\n" % (str(traceback.error.__class__.__name__), traceback.error)
             raise RuntimeError(m)
+        def write(tmpfilename):
+            with open(tmpfilename, 'w') as out:
+                out.write(s)
+            shutil.copymode(source, tmpfilename)
+        _replace(target, write)
+
+    def render_tree(self, tags, source, target, ignore=[]):
+        """Render the files of the directory source to the new directory target.
+
+        Files matching a pattern of ignore are skipped. Python files are
+        named .py_ in source and renamed to .py.
+        """
+        logging.info("Copy template structure from: %s to %s" % ( source, target) )
+        for root, dirs, files in os.walk(source):
+            path = os.path.join(target, os.path.relpath(root, source))
+            os.makedirs(os.path.normpath(path))
+            for f in files:
+                if any(fnmatch.fnmatch(f, pattern) for pattern in ignore):
+                    continue
+                name = f[:-4]+'.py' if f[-4:] == '.py_' else f
+                self.render(tags, os.path.join(root, f), os.path.join(path, name))
 
     def reset(self):
         """
@@ -109,56 +348,40 @@ class Builder:
         """
         for k in self.model.iterclass(uml.CPackage):
             package = self.model[k]
-            if package.is_stereotype('external'):
+            if package.is_stereotype('external') or not self.is_selected(package):
                 continue
             target = os.path.join(self.path, package.name)
             if os.path.exists(target): shutil.rmtree(target)
 
+    def is_selected(self, package):
+        """
+        True if the package was selected to be loaded, or if all of them were loaded.
+        """
+        if not self.model.packages:
+            return True
+        names = []
+        while package is not None:
+            names.append(package.name)
+            package = package.package
+        return package_selected(names, self.model.packages)
+
     def sort_menues(self, menues):
         if len(menues)==0:
             return []
-        sorted_items = []
-        take_first = 0
-
-        while len(sorted_items) != len(menues):
-            # Solve group of menues taking one and iterating to the leafs.
-            r = []
-
-            items = [ m for m in menues[take_first].prev_leafs(uml.CUseCase, uml.CUseCase) ]
-
-            while items:
-                repeated_menues = (set([ i.xmi_id for i in items ]) & set([ ri.xmi_id for ri in r ]))
-                if repeated_menues != set():
-                    raise RuntimeError, 'Loop in menues. Repeat for %s.' \
-                            'Check if they have undirected association ' \
-                            'or exists a loop in directed associations.' \
-                            % [ i.name for i in items if i.xmi_id in repeated_menues ]
-                r.extend( m for m in items if m.package.xmi_id == menues[take_first].package.xmi_id )
-                items = sorted(set(itertools.chain(*[ i.nexts(uml.CUseCase) for i in items ])), key=lambda a: a.name)
-
-            sorted_items += r
-
-            # If exists other groups of menues, prepare them to solve.
-            menues_xmi_id = set([ i.xmi_id for i in menues ])
-            items_xmi_id = set([ ri.xmi_id for ri in r ])
-            problematic_menues_xmi_id = menues_xmi_id - items_xmi_id
-
-            if problematic_menues_xmi_id:
-                take_first = menues.index([ i for i in menues if i.xmi_id in problematic_menues_xmi_id ][0])
-
-        return sorted_items
+        return MenuGraph(menues, self.model.uml.CUseCase).order()
 
     def sort_by_gen(self, entities):
         tree = {}
         obj = {}
+        oerp_ids = uml.oerp_ids(entities)
         for ent in entities:
-            obj[ent.oerp_id()] = ent
-            tree[ent.oerp_id()] = (ent.parents(), ent.childs())
+            obj[oerp_ids[ent]] = ent
+            tree[oerp_ids[ent]] = (ent.parents(), ent.childs())
         roots = [ obj[k] for k in tree.keys() if len(tree[k][0]) == 0 ]
 
         # Sorting algorithm
         def sorttree(root, tree):
-            root_name = root.oerp_id()
+            root_name = oerp_ids[root]
             if root in tree[root_name][0]:
                 logging.warning('Preventing infinite recursion for %s.' % root_name)
                 tree[root_name][0].remove(root)
@@ -207,12 +430,22 @@ class Builder:
             logging.info("Copy template structure from: %s to %s" % ( source, target) )
             shutil.copytree(source, target, ignore=ignore)
 
-    def build(self, version, logfile=sys.stderr):
+    def build(self, version, logfile=sys.stderr, jobs=1):
+        """Build the addons of the selected packages.
+
+        With jobs greater than one, packages are built by a pool of that many
+        processes. Workers of a model in memory share it with the builder as
+        forked by the pool. Workers of a model stored in a database file open
+        it again readonly, without creating or migrating its tables, once the
+        builder committed the model. Circular dependencies are checked once
+        every package was built.
+        """
 #         import sys;sys.path.append(r'/home/nacho/liclipse/plugins/org.python.pydev_5.3.1.201610311347/pysrc')
 #         import pydevd;pydevd.settrace()        
         logging.info("Starting Building")
-        # Store dependencies to check circular ones.
-        dependencies_map = {}
+        # Classes of the backend of the model, to select its entities by type.
+        uml = self.model.uml
+        packages = []
         # Por cada paquete generar un directorio de addon.
         for k in self.model.iterclass(uml.CPackage):
             package = self.model[k]
@@ -220,289 +453,35 @@ class Builder:
             if package.is_stereotype('external'):
                 logging.debug("Ignoring external package %s" % package.name)
                 continue
-            logging.debug("Building package %s" % package.name)
-            # Configuro las variables y tags para este paquete
-            ptag = package.tag
-            root_classes_obj = package.get_entities(uml.CClass, no_stereotypes=["wizard", "report"])
-            wizard_classes_obj = package.get_entities(uml.CClass, stereotypes=["wizard"])
-            report_classes_obj = package.get_entities(uml.CClass, stereotypes=["report"])
-            root_classes = [ (c.xmi_id, c.name) for c in root_classes_obj ]
-            wizard_classes = [ (c.xmi_id, c.name) for c in wizard_classes_obj ]
-            report_classes = [ (c.xmi_id, c.name) for c in report_classes_obj ]
-            #view_files = [ 'view/%s_view.xml' % name for xml_id, name in root_classes ]
-            view_files = [ "view/%s_view.xml" % n for n in self.sort_classes(root_classes_obj) ]
-            wizard_view_files = [ "wizard/%s_view.xml" % n for n in self.sort_classes(wizard_classes_obj) ]
-            wizard_workflow_files = [ 'wizard/%s_workflow.xml' % name for xml_id, name in wizard_classes if len(list(self.model[xml_id].iter_over_inhereted_attrs('statemachines'))[0:1])>0 ]
-            menu_files = ['view/%s_menuitem.xml' % package.name,
-                          'view/%s_actions.xml' % package.name]
-            properties_files = [ "data/%s_properties.xml" % n for n in self.sort_classes(root_classes_obj) ]
-            track_files = [ "data/%s_track.xml" % n for n in self.sort_classes(root_classes_obj) ]
-            group_files = [ 'security/%s_group.xml' % package.name ]
-            workflow_files = [ 'workflow/%s_workflow.xml' % name for xml_id, name in root_classes if len(list(self.model[xml_id].iter_over_inhereted_attrs('statemachines'))[0:1])>0 ]
-            app_files = [ '%s_app.xml' % package.name ]
-            security_files = [ 'security/ir.model.access.csv' ]
-            # Calcula dependencias
-            att_depends = [ self.model[a].datatype.package.name for a in self.model.iterclass(uml.CAttribute)
-                           if self.model[a].package.xmi_id == package.xmi_id and self.model[a].datatype.package ]
-            ass_depends = [ self.model[a].participant.package.name for a in self.model.iterclass(uml.CAssociationEnd)
-                           if self.model[a].swap[0].isNavigable
-                           and self.model[a].swap[0].participant.package.xmi_id == package.xmi_id
-                           and self.model[a].participant.package ]
-            gen_depends = [ self.model[a].parent.package.name for a in self.model.iterclass(uml.CGeneralization)
-                           if self.model[a].child.package.name == package.name ]
-            exp_depends = package.tag.get('depends','').split(',')
-            dependencies = set(att_depends + ass_depends + gen_depends + exp_depends) - set(['', 'res', 'ir', package.name])
-            dependencies_map[package.name] = dependencies
-            # Construyo los tags
-            tags = {
-                'stereotype_dict': stereotype_dict,
-                'names': names,
-                'unicode': unicode,
-                'escape': escape,
-                'quote': lambda s: escape(s, {'"':'&quot;', "'":'&quot;'}),
-                'doublequote': lambda s: escape(s, {"'":'"'}),
-                'uml': uml,
-                'PACKAGE': package,
-                'YEAR': str(date.today().year),
-                'MODULE_NAME': package.name,
-                'MODULE_LABEL': ptag.get('label', package.name),
-                'MODULE_SHORT_DESCRIPTION': ptag.get('label','\n').split('\n')[0],
-                'MODULE_DESCRIPTION': ptag.get('documentation', 'No documented'),
-                'MODULE_AUTHOR': ptag.get('author', 'No author.'),
-                'MODULE_AUTHOR_EMAIL': ptag.get('email','No email'),
-                'MODULE_VERSION': ptag.get('version', 'No version'),
-                'MODULE_CATEGORY': ptag.get('category', 'base.module_category_hidden'),
-                'MODULE_WEBSITE': ptag.get('website', ''),
-                'MODULE_LICENSE': ptag.get('license', 'AGPL-3'),
-                'MODULE_DEPENDS': ptag.get('depends', ''),
-                'MENUES': self.sort_menues([ cu for cu in self.model.session.query(uml.CUseCase)
-                                            if cu.is_stereotype('menu') and
-                                               cu.package and
-                                               cu.package.xmi_id == k]),
-                'SERVER_ACTIONS': [ cu for cu in self.model.session.query(uml.CUseCase)
-                                            if cu.is_stereotype('server_action') and
-                                               cu.package and
-                                               cu.package.xmi_id == k],
-                'GROUPS': self.sort_by_gen([ ac for ac in self.model.session.query(uml.CActor)
-                                            if ac.is_stereotype('group') and
-                                               ac.package and
-                                               ac.package.xmi_id == k]),
-                'ROOT_IMPORT': '\n'.join([ "import %s" % n
-                                          for n in self.sort_classes(root_classes_obj) ]),
-                'WIZARD_IMPORT': '\n'.join([ "import %s" % n
-                                            for n in self.sort_classes(wizard_classes_obj) ]),
-                'REPORT_IMPORT': '\n'.join([ "import %s" % n
-                                            for n in self.sort_classes(report_classes_obj) ]),
-            }
-            if version=='8.0':
-                tags.update({
-                    'datatype': {
-                        'Selection': 'Selection',
-                        'Many2many': 'Many2many',
-                        'One2many': 'One2many',
-                        'Many2one': 'Many2one',
-                        'Boolean': 'Boolean',
-                        'Integer': 'Integer',
-                        'Float':   'Float',
-                        'Char':    'Char',
-                        'Text':    'Text',
-                        'Date':    'Date',
-                        'Datetime':'Datetime',
-                        'Binary':  'Binary',
-                        'HTML':    'Html',
-                    },
-                })
-            else:
-                tags.update({
-                    'datatype': {
-                        'Boolean': 'boolean',
-                        'Integer': 'integer',
-                        'Float':   'float',
-                        'Char':    'char',
-                        'Text':    'text',
-                        'Date':    'date',
-                        'Datetime':'datetime',
-                        'Binary':  'binary',
-                        'HTML':    'html',
-                    },
-                })                
-            tags.update({
-                'uml': uml,
-                'LICENSE_HEADER': str(Template(
-                    pkg_resources.resource_stream(__name__,
-                                                  os.path.join('data',
-                                                               'licenses',
-                                                               filter(lambda c: c.isalpha() or c.isdigit(), tags['MODULE_LICENSE'].lower())+'-header.txt')
-                                                 ).read()).render(**tags)),
-                'MODULE_DICTIONARY': self.pp.pformat({
-                    'name': tags['MODULE_SHORT_DESCRIPTION'],
-                    'version': tags['MODULE_VERSION'],
-                    'author': tags['MODULE_AUTHOR'],
-                    'category': tags['MODULE_CATEGORY'],
-                    'website': tags['MODULE_WEBSITE'],
-                    'license': tags['MODULE_LICENSE'],
-                    'description': tags['MODULE_DESCRIPTION'],
-                    'depends': list(dependencies),
-                    'data': group_files + view_files + properties_files + track_files + workflow_files + security_files + wizard_view_files + wizard_workflow_files + menu_files,
-                    'test': [],
-                    'active': False,
-                    'installable': True,
-                }),
-            })
-            # Copio la estructura basica al nuevo directorio.
-            source = pkg_resources.resource_filename(__name__, os.path.join('data', 'template', version))
-            target = os.path.join(self.path, package.name)
-            logging.info("Copy template structure from: %s to %s" % ( source, target) )
-            shutil.copytree(source, target,
-                            ignore=shutil.ignore_patterns('*CLASS*',
-                                                          '*PACKAGE_*'))
-
-            # Rename python files from .py_ to .py.
-            for root, dirs, files in os.walk(target):
-                for f in files:
-                    if f[-4:] == '.py_':
-                        # Renombrar este archivo
-                        os.rename(os.path.join(root, f), os.path.join(root, f[:-4]+'.py'))
-
-            # Generate menu file
-            source_code = os.path.join(source, 'view/PACKAGE_menuitem.xml')
-            target_code = os.path.join(target, 'view/%s_menuitem.xml' % package.name)
-            shutil.copy(source_code, target_code)
-            self.update(tags, target_code)
-
-            # Generate actions file
-            source_code = os.path.join(source, 'view/PACKAGE_actions.xml')
-            target_code = os.path.join(target, 'view/%s_actions.xml' % package.name)
-            shutil.copy(source_code, target_code)
-            self.update(tags, target_code)
-
-            # Generate groups file
-            source_code = os.path.join(source, 'security/PACKAGE_group.xml')
-            target_code = os.path.join(target, 'security/%s_group.xml' % package.name)
-            shutil.copy(source_code, target_code)
-            self.update(tags, target_code)
-
-            # Proceso el template basico sobre los archivos copiados.
-            for root, dirs, files in os.walk(target):
-                for f in files:
-                    self.update(tags, os.path.join(root, f))
-
-            # Por cada clase genero un archivo. El archivo lo agrego a la lista de importacion.
-            for xmi_id, name in root_classes:
-                # Prepare data
-                cclass = self.model[xmi_id]
-                if len(cclass.child_of) > 0:
-                    generalization = cclass.child_of[0]
-                    parent = generalization.parent
-                    extend_parent = generalization.is_extend
-                else:
-                    parent = None
-                    extend_parent = False
-                ctag = cclass.tag
-                tags.update({
-                    'CLASS': cclass,
-                    'CLASS_EXTEND_PARENT': extend_parent,
-                    'CLASS_LABEL': cclass.tag.get('label', name),
-                    'CLASS_MODULE': parent.package.name if extend_parent else cclass.package.name,
-                    'CLASS_NAME': parent.name if extend_parent else name,
-                    'CLASS_PARENT_MODULE': parent.package.name if parent is not None else None,
-                    'CLASS_PARENT_NAME': parent.name if parent is not None else None,
-                    'CLASS_DOCUMENTATION': ctag.get('documentation', None),
-                    'CLASS_ATTRIBUTES': [ m for m in cclass.members if m.entityclass == 'cattribute' ],
-                    'CLASS_ASSOCIATIONS': [ cclass.all_associations(ctype=uml.CClass, parents=False) ],
-                    'MENU_PARENT': cclass.tag.get('menu_parent', None) or (
-                        [ass.participant.tag['label']
-                         for ass in cclass.associations
-                         if type(ass.swap[0]) is uml.CUseCase and ass.swap[0].is_stereotype('menu')
-                        ]+[None]
-                    )[0],
-                    'MENU_SEQUENCE': cclass.tag.get('menu_sequence', '100'),
-                    'STEREOTYPES': [ s.name for s in cclass.stereotypes ],
-                    'tree_types': lambda c: [ '' ] + (any(c.all_associations(ctype=uml.CUseCase, stereotypes=["editable"])) and [ '_edit' ] or []) + (any(c.all_associations(ctype=uml.CUseCase, stereotypes=["hierarchical"])) and [ '_hier' ] or []),
-                    })
-
-                # Generate class file
-                source_code = os.path.join(source, 'CLASS.py_')
-                target_code = os.path.join(target, '%s.py' % name)
-                shutil.copy(source_code, target_code)
-                self.update(tags, target_code)
-
-                # Generate view file
-                source_code = os.path.join(source, 'view/CLASS_view.xml')
-                target_code = os.path.join(target, 'view/%s_view.xml' % name)
-                shutil.copy(source_code, target_code)
-                self.update(tags, target_code)
-
-                # Generate properties file
-                source_code = os.path.join(source, 'data/CLASS_properties.xml')
-                target_code = os.path.join(target, 'data/%s_properties.xml' % name)
-                shutil.copy(source_code, target_code)
-                self.update(tags, target_code)
-
-                # Generate track file
-                source_code = os.path.join(source, 'data/CLASS_track.xml')
-                target_code = os.path.join(target, 'data/%s_track.xml' % name)
-                shutil.copy(source_code, target_code)
-                self.update(tags, target_code)
-
-                # Generate workflow file
-                if len(list(cclass.iter_over_inhereted_attrs('statemachines'))[0:1]) > 0:
-                    source_code = os.path.join(source, 'workflow/CLASS_workflow.xml')
-                    target_code = os.path.join(target, 'workflow/%s_workflow.xml' % name)
-                    shutil.copy(source_code, target_code)
-                    self.update(tags, target_code)
-
-            # Por cada wizard genero un archivo. El archivo lo agrego a la lista de importacion.
-            for xmi_id, name in wizard_classes:
-                # Prepare data
-                cclass = self.model[xmi_id]
-                if len(cclass.child_of) > 0:
-                    generalization = cclass.child_of[0]
-                    parent = generalization.parent
-                    extend_parent = generalization.is_extend
-                else:
-                    parent = None
-                    extend_parent = False
-                ctag = cclass.tag
-                tags.update({
-                    'CLASS': cclass,
-                    'CLASS_EXTEND_PARENT': extend_parent,
-                    'CLASS_LABEL': cclass.tag.get('label', name),
-                    'CLASS_MODULE': parent.package.name if extend_parent else cclass.package.name,
-                    'CLASS_NAME': parent.name if extend_parent else name,
-                    'CLASS_PARENT_MODULE': parent.package.name if parent is not None else None,
-                    'CLASS_PARENT_NAME': parent.name if parent is not None else None,
-                    'CLASS_DOCUMENTATION': ctag.get('documentation', None),
-                    'CLASS_ATTRIBUTES': [ m for m in cclass.members if m.entityclass == 'cattribute' ],
-                    'CLASS_ASSOCIATIONS': [ cclass.all_associations(ctype=uml.CClass, parents=False) ],
-                    'MENU_PARENT': cclass.tag.get('menu_parent', None) or (
-                        [ass.participant.tag['label']
-                         for ass in cclass.associations
-                         if type(ass.swap[0]) is uml.CUseCase and ass.swap[0].is_stereotype('menu')
-                        ]+[None]
-                    )[0],
-                    'MENU_SEQUENCE': cclass.tag.get('menu_sequence', '100'),
-                    'STEREOTYPES': [ s.name for s in cclass.stereotypes ],
-                    'tree_types': lambda c: [ '' ] + (any(c.all_associations(ctype=uml.CUseCase, stereotypes=["editable"])) and [ '_edit' ] or []) + (any(c.all_associations(ctype=uml.CUseCase, stereotypes=["hierarchical"])) and [ '_hier' ] or []),
-                    })
-
-                # Generate class file
-                source_code = os.path.join(source, 'wizard', 'CLASS.py_')
-                target_code = os.path.join(target, 'wizard', '%s.py' % name)
-                shutil.copy(source_code, target_code)
-                self.update(tags, target_code)
-
-                # Generate view file
-                source_code = os.path.join(source, 'wizard', 'CLASS_view.xml')
-                target_code = os.path.join(target, 'wizard', '%s_view.xml' % name)
-                shutil.copy(source_code, target_code)
-                self.update(tags, target_code)
-
-                # Generate workflow file
-                source_code = os.path.join(source, 'wizard', 'CLASS_workflow.xml')
-                target_code = os.path.join(target, 'wizard', '%s_workflow.xml' % name)
-                shutil.copy(source_code, target_code)
-                self.update(tags, target_code)
+            # Los paquetes no seleccionados solo tienen entidades referenciadas.
+            if not self.is_selected(package):
+                logging.debug("Ignoring not selected package %s" % package.name)
+                continue
+            packages.append((package.xmi_id, package.name))
+        if self.model.packages and not packages:
+            logging.warning('No package to build was found for the selection %s.' % ', '.join(self.model.packages))
+
+        dbfile = self.model.engine and self.model.engine.url.database
+        if jobs > 1 and self.model.session is not None and dbfile in (None, '', ':memory:'):
+            logging.warning('Packages are built one by one: workers need a model in memory or a database file.')
+            jobs = 1
+        if jobs > 1 and len(packages) > 1:
+            if self.model.session is not None:
+                self.model.session.commit()
+            pool = multiprocessing.Pool(min(jobs, len(packages)), _init_worker,
+                                        (self, dbfile if self.model.session is not None else None))
+            try:
+                dependencies = pool.map(_build_package, [ (k, version) for k, name in packages ], 1)
+                pool.close()
+            except:
+                pool.terminate()
+                raise
+            finally:
+                pool.join()
+        else:
+            dependencies = [ self.build_package(self.model[k], version) for k, name in packages ]
+        # Store dependencies to check circular ones.
+        dependencies_map = dict((name, d) for (k, name), d in zip(packages, dependencies))
 
         for pack in dependencies_map:
             circular = [ pack_b for pack_b in dependencies_map[pack]
@@ -511,5 +490,287 @@ class Builder:
                 raise RuntimeError, "Simple circular dependies found beetween %s and %s.\n"\
                         "Please check relations direction beetween packages, or create an inhereted class in some package." % (pack, ','.join(circular))
 
+    def build_package(self, package, version):
+        """Build the addon of package. Return the names of the packages it depends on."""
+        # Classes of the backend of the model, to select its entities by type.
+        uml = self.model.uml
+        k = package.xmi_id
+        logging.debug("Building package %s" % package.name)
+        queries = self.model.queries
+        # Configuro las variables y tags para este paquete
+        ptag = package.tag
+        root_classes_obj = package.get_entities(uml.CClass, no_stereotypes=["wizard", "report"])
+        wizard_classes_obj = package.get_entities(uml.CClass, stereotypes=["wizard"])
+        report_classes_obj = package.get_entities(uml.CClass, stereotypes=["report"])
+        root_classes = [ (c.xmi_id, c.name) for c in root_classes_obj ]
+        wizard_classes = [ (c.xmi_id, c.name) for c in wizard_classes_obj ]
+        report_classes = [ (c.xmi_id, c.name) for c in report_classes_obj ]
+        #view_files = [ 'view/%s_view.xml' % name for xml_id, name in root_classes ]
+        view_files = [ "view/%s_view.xml" % n for n in self.sort_classes(root_classes_obj) ]
+        wizard_view_files = [ "wizard/%s_view.xml" % n for n in self.sort_classes(wizard_classes_obj) ]
+        wizard_workflow_files = [ 'wizard/%s_workflow.xml' % name for xml_id, name in wizard_classes if len(list(self.model[xml_id].iter_over_inhereted_attrs('statemachines'))[0:1])>0 ]
+        menu_files = ['view/%s_menuitem.xml' % package.name,
+                      'view/%s_actions.xml' % package.name]
+        properties_files = [ "data/%s_properties.xml" % n for n in self.sort_classes(root_classes_obj) ]
+        track_files = [ "data/%s_track.xml" % n for n in self.sort_classes(root_classes_obj) ]
+        group_files = [ 'security/%s_group.xml' % package.name ]
+        workflow_files = [ 'workflow/%s_workflow.xml' % name for xml_id, name in root_classes if len(list(self.model[xml_id].iter_over_inhereted_attrs('statemachines'))[0:1])>0 ]
+        app_files = [ '%s_app.xml' % package.name ]
+        security_files = [ 'security/ir.model.access.csv' ]
+        # Calcula dependencias
+        att_depends = [ self.model[a].datatype.package.name for a in self.model.iterclass(uml.CAttribute)
+                       if self.model[a].package.xmi_id == package.xmi_id and self.model[a].datatype.package ]
+        ass_depends = [ self.model[a].participant.package.name for a in self.model.iterclass(uml.CAssociationEnd)
+                       if self.model[a].swap[0].isNavigable
+                       and self.model[a].swap[0].participant.package.xmi_id == package.xmi_id
+                       and self.model[a].participant.package ]
+        gen_depends = [ self.model[a].parent.package.name for a in self.model.iterclass(uml.CGeneralization)
+                       if self.model[a].child.package.name == package.name ]
+        exp_depends = package.tag.get('depends','').split(',')
+        dependencies = set(att_depends + ass_depends + gen_depends + exp_depends) - set(['', 'res', 'ir', package.name])
+        # Construyo los tags
+        tags = {
+            'stereotype_dict': stereotype_dict,
+            'names': names,
+            'unicode': unicode,
+            'escape': escape,
+            'quote': lambda s: escape(s, {'"':'&quot;', "'":'&quot;'}),
+            'doublequote': lambda s: escape(s, {"'":'"'}),
+            'uml': uml,
+            'PACKAGE': package,
+            'YEAR': str(date.today().year),
+            'MODULE_NAME': package.name,
+            'MODULE_LABEL': ptag.get('label', package.name),
+            'MODULE_SHORT_DESCRIPTION': ptag.get('label','\n').split('\n')[0],
+            'MODULE_DESCRIPTION': ptag.get('documentation', 'No documented'),
+            'MODULE_AUTHOR': ptag.get('author', 'No author.'),
+            'MODULE_AUTHOR_EMAIL': ptag.get('email','No email'),
+            'MODULE_VERSION': ptag.get('version', 'No version'),
+            'MODULE_CATEGORY': ptag.get('category', 'base.module_category_hidden'),
+            'MODULE_WEBSITE': ptag.get('website', ''),
+            'MODULE_LICENSE': ptag.get('license', 'AGPL-3'),
+            'MODULE_DEPENDS': ptag.get('depends', ''),
+            'MENUES': self.sort_menues([ cu for cu in self.model.iterentities(uml.CUseCase)
+                                        if cu.is_stereotype('menu') and
+                                           cu.package and
+                                           cu.package.xmi_id == k]),
+            'SERVER_ACTIONS': [ cu for cu in self.model.iterentities(uml.CUseCase)
+                                        if cu.is_stereotype('server_action') and
+                                           cu.package and
+                                           cu.package.xmi_id == k],
+            'GROUPS': self.sort_by_gen([ ac for ac in self.model.iterentities(uml.CActor)
+                                        if ac.is_stereotype('group') and
+                                           ac.package and
+                                           ac.package.xmi_id == k]),
+            'ROOT_IMPORT': '\n'.join([ "import %s" % n
+                                      for n in self.sort_classes(root_classes_obj) ]),
+            'WIZARD_IMPORT': '\n'.join([ "import %s" % n
+                                        for n in self.sort_classes(wizard_classes_obj) ]),
+            'REPORT_IMPORT': '\n'.join([ "import %s" % n
+                                        for n in self.sort_classes(report_classes_obj) ]),
+        }
+        if version=='8.0':
+            tags.update({
+                'datatype': {
+                    'Selection': 'Selection',
+                    'Many2many': 'Many2many',
+                    'One2many': 'One2many',
+                    'Many2one': 'Many2one',
+                    'Boolean': 'Boolean',
+                    'Integer': 'Integer',
+                    'Float':   'Float',
+                    'Char':    'Char',
+                    'Text':    'Text',
+                    'Date':    'Date',
+                    'Datetime':'Datetime',
+                    'Binary':  'Binary',
+                    'HTML':    'Html',
+                },
+            })
+        else:
+            tags.update({
+                'datatype': {
+                    'Boolean': 'boolean',
+                    'Integer': 'integer',
+                    'Float':   'float',
+                    'Char':    'char',
+                    'Text':    'text',
+                    'Date':    'date',
+                    'Datetime':'datetime',
+                    'Binary':  'binary',
+                    'HTML':    'html',
+                },
+            })                
+        tags.update({
+            'uml': uml,
+            'LICENSE_HEADER': str(self.templates.get_template(
+                pkg_resources.resource_stream(__name__,
+                                              os.path.join('data',
+                                                           'licenses',
+                                                           filter(lambda c: c.isalpha() or c.isdigit(), tags['MODULE_LICENSE'].lower())+'-header.txt')
+                                             ).read()).render(**tags)),
+            'MODULE_DICTIONARY': self.pp.pformat({
+                'name': tags['MODULE_SHORT_DESCRIPTION'],
+                'version': tags['MODULE_VERSION'],
+                'author': tags['MODULE_AUTHOR'],
+                'category': tags['MODULE_CATEGORY'],
+                'website': tags['MODULE_WEBSITE'],
+                'license': tags['MODULE_LICENSE'],
+                'description': tags['MODULE_DESCRIPTION'],
+                'depends': list(dependencies),
+                'data': group_files + view_files + properties_files + track_files + workflow_files + security_files + wizard_view_files + wizard_workflow_files + menu_files,
+                'test': [],
+                'active': False,
+                'installable': True,
+            }),
+        })
+        # Proceso el template basico en el nuevo directorio.
+        source = pkg_resources.resource_filename(__name__, os.path.join('data', 'template', version))
+        target = os.path.join(self.path, package.name)
+        self.render_tree(tags, source, target, ignore=['*CLASS*', '*PACKAGE_*'])
+
+        # Generate menu file
+        source_code = os.path.join(source, 'view/PACKAGE_menuitem.xml')
+        target_code = os.path.join(target, 'view/%s_menuitem.xml' % package.name)
+        self.render(tags, source_code, target_code)
+
+        # Generate actions file
+        source_code = os.path.join(source, 'view/PACKAGE_actions.xml')
+        target_code = os.path.join(target, 'view/%s_actions.xml' % package.name)
+        self.render(tags, source_code, target_code)
+
+        # Generate groups file
+        source_code = os.path.join(source, 'security/PACKAGE_group.xml')
+        target_code = os.path.join(target, 'security/%s_group.xml' % package.name)
+        self.render(tags, source_code, target_code)
+
+        # Por cada clase genero un archivo. El archivo lo agrego a la lista de importacion.
+        for xmi_id, name in root_classes:
+            # Prepare data
+            cclass = self.model[xmi_id]
+            if len(cclass.child_of) > 0:
+                generalization = cclass.child_of[0]
+                parent = generalization.parent
+                extend_parent = generalization.is_extend
+            else:
+                parent = None
+                extend_parent = False
+            ctag = cclass.tag
+            tags.update({
+                'CLASS': cclass,
+                'CLASS_EXTEND_PARENT': extend_parent,
+                'CLASS_LABEL': cclass.tag.get('label', name),
+                'CLASS_MODULE': parent.package.name if extend_parent else cclass.package.name,
+                'CLASS_NAME': parent.name if extend_parent else name,
+                'CLASS_PARENT_MODULE': parent.package.name if parent is not None else None,
+                'CLASS_PARENT_NAME': parent.name if parent is not None else None,
+                'CLASS_DOCUMENTATION': ctag.get('documentation', None),
+                'CLASS_ATTRIBUTES': [ m for m in cclass.members if m.entityclass == 'cattribute' ],
+                'CLASS_ASSOCIATIONS': [ cclass.all_associations(ctype=uml.CClass, parents=False) ],
+                'MENU_PARENT': cclass.tag.get('menu_parent', None) or (
+                    [ass.participant.tag['label']
+                     for ass in cclass.associations
+                     if type(ass.swap[0]) is uml.CUseCase and ass.swap[0].is_stereotype('menu')
+                    ]+[None]
+                )[0],
+                'MENU_SEQUENCE': cclass.tag.get('menu_sequence', '100'),
+                'STEREOTYPES': [ s.name for s in cclass.stereotypes ],
+                'tree_types': lambda c: [ '' ] + (any(c.all_associations(ctype=uml.CUseCase, stereotypes=["editable"])) and [ '_edit' ] or []) + (any(c.all_associations(ctype=uml.CUseCase, stereotypes=["hierarchical"])) and [ '_hier' ] or []),
+                })
+
+            # Generate class file
+            source_code = os.path.join(source, 'CLASS.py_')
+            target_code = os.path.join(target, '%s.py' % name)
+            self.render(tags, source_code, target_code)
+
+            # Generate view file
+            source_code = os.path.join(source, 'view/CLASS_view.xml')
+            target_code = os.path.join(target, 'view/%s_view.xml' % name)
+            self.render(tags, source_code, target_code)
+
+            # Generate properties file
+            source_code = os.path.join(source, 'data/CLASS_properties.xml')
+            target_code = os.path.join(target, 'data/%s_properties.xml' % name)
+            self.render(tags, source_code, target_code)
+
+            # Generate track file
+            source_code = os.path.join(source, 'data/CLASS_track.xml')
+            target_code = os.path.join(target, 'data/%s_track.xml' % name)
+            self.render(tags, source_code, target_code)
+
+            # Generate workflow file
+            if len(list(cclass.iter_over_inhereted_attrs('statemachines'))[0:1]) > 0:
+                source_code = os.path.join(source, 'workflow/CLASS_workflow.xml')
+                target_code = os.path.join(target, 'workflow/%s_workflow.xml' % name)
+                self.render(tags, source_code, target_code)
+
+        # Por cada wizard genero un archivo. El archivo lo agrego a la lista de importacion.
+        for xmi_id, name in wizard_classes:
+            # Prepare data
+            cclass = self.model[xmi_id]
+            if len(cclass.child_of) > 0:
+                generalization = cclass.child_of[0]
+                parent = generalization.parent
+                extend_parent = generalization.is_extend
+            else:
+                parent = None
+                extend_parent = False
+            ctag = cclass.tag
+            tags.update({
+                'CLASS': cclass,
+                'CLASS_EXTEND_PARENT': extend_parent,
+                'CLASS_LABEL': cclass.tag.get('label', name),
+                'CLASS_MODULE': parent.package.name if extend_parent else cclass.package.name,
+                'CLASS_NAME': parent.name if extend_parent else name,
+                'CLASS_PARENT_MODULE': parent.package.name if parent is not None else None,
+                'CLASS_PARENT_NAME': parent.name if parent is not None else None,
+                'CLASS_DOCUMENTATION': ctag.get('documentation', None),
+                'CLASS_ATTRIBUTES': [ m for m in cclass.members if m.entityclass == 'cattribute' ],
+                'CLASS_ASSOCIATIONS': [ cclass.all_associations(ctype=uml.CClass, parents=False) ],
+                'MENU_PARENT': cclass.tag.get('menu_parent', None) or (
+                    [ass.participant.tag['label']
+                     for ass in cclass.associations
+                     if type(ass.swap[0]) is uml.CUseCase and ass.swap[0].is_stereotype('menu')
+                    ]+[None]
+                )[0],
+                'MENU_SEQUENCE': cclass.tag.get('menu_sequence', '100'),
+                'STEREOTYPES': [ s.name for s in cclass.stereotypes ],
+                'tree_types': lambda c: [ '' ] + (any(c.all_associations(ctype=uml.CUseCase, stereotypes=["editable"])) and [ '_edit' ] or []) + (any(c.all_associations(ctype=uml.CUseCase, stereotypes=["hierarchical"])) and [ '_hier' ] or []),
+                })
+
+            # Generate class file
+            source_code = os.path.join(source, 'wizard', 'CLASS.py_')
+            target_code = os.path.join(target, 'wizard', '%s.py' % name)
+            self.render(tags, source_code, target_code)
+
+            # Generate view file
+            source_code = os.path.join(source, 'wizard', 'CLASS_view.xml')
+            target_code = os.path.join(target, 'wizard', '%s_view.xml' % name)
+            self.render(tags, source_code, target_code)
+
+            # Generate workflow file
+            source_code = os.path.join(source, 'wizard', 'CLASS_workflow.xml')
+            target_code = os.path.join(target, 'wizard', '%s_workflow.xml' % name)
+            self.render(tags, source_code, target_code)
+
+        logging.info("Package %s built with %i queries." % (package.name, self.model.queries - queries))
+        return dependencies
+
+# Builder of the worker processes of Builder.build.
+_worker = None
+
+def _init_worker(builder, dbfile):
+    """Set the builder of the worker, with its own model if it is stored in dbfile."""
+    global _worker
+    if dbfile is not None:
+        model = Model(db=dbfile, packages=builder.model.packages, readonly=True)
+        builder = Builder(builder.path, model, template_cache=builder.templates.module_directory)
+    _worker = builder
+
+def _build_package(args):
+    """Build the package with xmi_id in the worker. Return its dependencies."""
+    xmi_id, version = args
+    return _worker.build_package(_worker.model[xmi_id], version)
+
 # vim:expandtab:smartindent:tabstop=4:softtabstop=4:shiftwidth=4:
 
@@ -0,0 +1,414 @@
+#!/usr/bin/env python
+##############################################################################
+#
+#    XMI2OERP, XMI convesort to OpenERP module
+#    Copyright (C) 2012 Coop Trab Moldeo Interactive, Grupo AdHoc S.A.
+#    (<http://www.moldeointeractive.com.ar>; <www.grupoadhoc.com.ar>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+"""Classes to describe UML entities in memory.
+
+Each class of uml has a class with the same name here, with the same
+attributes and methods. Entities keep their columns in __slots__ and
+reference other entities directly, without a database session. Classes are
+built from the mappers of uml, so both backends share the code of the methods.
+
+>>> package = CPackage('p', 'sale', order=0)
+>>> theclass = CClass('c', 'order', package=package, order=1)
+>>> attrib = CAttribute('a', 'amount', None, member_of=theclass, package=package, order=2)
+>>> theclass.members
+[<CAttribute(xmi_id:'a', name:'amount', size=None)>]
+>>> attrib.member_of is theclass, package.entities
+(True, [<CClass(xmi_id:'c', name:'order')>, <CAttribute(xmi_id:'a', name:'amount', size=None)>])
+>>> theclass.oerp_id(), type(theclass) is CClass, type(theclass) is uml.CClass
+(u'sale.order', True, False)
+
+Relationships are updated on both sides. Collections are sorted by the order
+of the entities, as the database returns them.
+
+>>> other = CClass('o', 'other', package=package, order=3)
+>>> attrib.member_of = other
+>>> theclass.members, other.members
+([], [<CAttribute(xmi_id:'a', name:'amount', size=None)>])
+>>> first = CAttribute('f', 'first', None, order=1)
+>>> other.members.append(first)
+>>> other.members
+[<CAttribute(xmi_id:'f', name:'first', size=None)>, <CAttribute(xmi_id:'a', name:'amount', size=None)>]
+>>> first.member_of is other
+True
+
+Entities are stored by dump as rows, referencing each other by position, and
+built again by restore. Entities referencing other ones are not stored.
+
+>>> rows = dump([ package, theclass, attrib, other, first ])
+>>> rows[1][0], rows[1][1]['name'], rows[1][1]['package'], rows[0][1]['entities']
+('CClass', u'order', 0, [1, 2, 3])
+>>> copies = restore(rows)
+>>> copies[3].members, copies[2].member_of is copies[3], copies[1].package is copies[0]
+([<CAttribute(xmi_id:'f', name:'first', size=None)>, <CAttribute(xmi_id:'a', name:'amount', size=None)>], True, True)
+>>> copies[3].members[1] is copies[2], other.members[1] is attrib
+(True, True)
+>>> dump([ package, theclass ]) is None
+True
+
+Entities have a slot for each attribute where the methods of uml memoize
+computed values, registered in uml._caches.
+
+>>> import inspect, re
+>>> memos = re.findall(r"getattr\(self, '(_\w+)', None\)", inspect.getsource(uml))
+>>> sorted(set(memos) - set(uml._caches)), set(uml._caches) <= set(CEntity.__slots__)
+([], True)
+"""
+
+import types
+from sqlalchemy import String
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.orm.interfaces import MANYTOONE, MANYTOMANY
+import uml
+
+class EntityList(list):
+    """Collection of entities of a relationship.
+
+    Entities added or removed are updated on the other side of the
+    relationship. Other changes of the list are not supported.
+    """
+
+    __slots__ = ('owner', 'attribute')
+
+    def __init__(self, owner, attribute):
+        super(EntityList, self).__init__()
+        self.owner = owner
+        self.attribute = attribute
+
+    def append(self, value):
+        self.attribute.append(self.owner, value)
+
+    def remove(self, value):
+        self.attribute.remove(self.owner, value)
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def _unsupported(self, *args, **kwargs):
+        raise TypeError('Only append, extend and remove change relationships.')
+
+    __setitem__ = __delitem__ = __setslice__ = __delslice__ = __iadd__ = _unsupported
+    insert = pop = sort = reverse = _unsupported
+
+class Attribute(object):
+    """Changes of a column of the entities, calling the listeners of set events.
+
+    Values are stored in the slot of the column and read from it directly.
+    Text is stored as unicode, or as uml.NativeString reads it, as the
+    database returns it.
+    """
+
+    def __init__(self, slot, coerce=None):
+        self.slot = slot
+        self.coerce = coerce
+        self.listeners = {'set': []}
+
+    def set(self, obj, value):
+        if self.coerce is not None:
+            value = self.coerce(value)
+        oldvalue = self.slot.__get__(obj)
+        self.slot.__set__(obj, value)
+        for fn in self.listeners['set']:
+            fn(obj, value, oldvalue, None)
+
+class Reference(Attribute):
+    """Many to one relationship. The other side is a Collection or None."""
+
+    reverse = None
+
+    def set(self, obj, value):
+        oldvalue = self.slot.__get__(obj)
+        if oldvalue is value:
+            return
+        self.slot.__set__(obj, value)
+        if self.reverse is not None:
+            if oldvalue is not None:
+                self.reverse.discard(oldvalue, obj)
+            if value is not None:
+                self.reverse.add(value, obj)
+        for fn in self.listeners['set']:
+            fn(obj, value, oldvalue, None)
+
+class Collection(Attribute):
+    """One to many or many to many relationship, stored in an EntityList.
+
+    One to many collections are kept sorted by the order of the entities.
+    Many to many collections keep the order of the appends.
+    """
+
+    reverse = None
+
+    def __init__(self, slot, sort):
+        super(Collection, self).__init__(slot)
+        self.sort = sort
+        self.listeners.update({'append': [], 'remove': []})
+
+    def set(self, obj, values):
+        for value in list(self.slot.__get__(obj)):
+            self.remove(obj, value)
+        for value in values:
+            self.append(obj, value)
+
+    def init(self, obj):
+        """Set the empty collection of a new entity."""
+        self.slot.__set__(obj, EntityList(obj, self))
+
+    def append(self, obj, value):
+        if isinstance(self.reverse, Reference):
+            self.reverse.set(value, obj)
+            return
+        self.add(obj, value)
+        if self.reverse is not None:
+            self.reverse.add(value, obj)
+
+    def remove(self, obj, value):
+        if isinstance(self.reverse, Reference):
+            self.reverse.set(value, None)
+            return
+        self.discard(obj, value)
+        if self.reverse is not None:
+            self.reverse.discard(value, obj)
+
+    def add(self, obj, value):
+        """Insert value in the collection of obj, without changing the other side."""
+        values = self.slot.__get__(obj)
+        i = len(values)
+        if self.sort:
+            order = value.order
+            while i and values[i - 1].order > order:
+                i -= 1
+        list.insert(values, i, value)
+        for fn in self.listeners['append']:
+            fn(obj, value, None)
+
+    def discard(self, obj, value):
+        """Remove value from the collection of obj, without changing the other side."""
+        list.remove(self.slot.__get__(obj), value)
+        for fn in self.listeners['remove']:
+            fn(obj, value, None)
+
+class Base(object):
+    """Base of the entity classes.
+
+    Every slot is initialized when the entity is created, to None or to an
+    empty collection. Attributes with changes to track are set by their
+    Attribute, other ones directly.
+    """
+
+    __slots__ = ()
+
+    _slots = _collections = ()
+
+    _setters = {}
+
+    def __init__(self):
+        for slot in self._slots:
+            slot.__set__(self, None)
+        for collection in self._collections:
+            collection.init(self)
+
+    def __setattr__(self, name, value):
+        setter = self._setters.get(name)
+        if setter is None:
+            object.__setattr__(self, name, value)
+        else:
+            setter.set(self, value)
+
+def _text(value):
+    return value.decode('utf-8') if type(value) is str else value
+
+def _native(value):
+    return _native_type.process_result_value(_text(value), None)
+
+_native_type = uml.NativeString()
+
+# Attributes of the mapped classes that are not copied.
+_mapping = ('__tablename__', '__mapper_args__', '__table_args__', '__table__', '__mapper__',
+            '_sa_class_manager', '__dict__', '__weakref__', '__module__')
+
+# Attribute of each (class, slot) with changes to track.
+_attributes = {}
+
+def _rebind(value):
+    """Return value with the globals of its functions replaced by the ones of this module.
+
+    Names of entity classes in the code of the methods, and classes given as
+    default arguments, refer to the classes of this module.
+    """
+    if isinstance(value, types.FunctionType):
+        defaults = value.func_defaults and tuple(_rebind(d) for d in value.func_defaults)
+        f = types.FunctionType(value.func_code, globals(), value.func_name, defaults, value.func_closure)
+        f.__doc__ = value.__doc__
+        return f
+    if isinstance(value, property):
+        return property(*[ f and _rebind(f) for f in (value.fget, value.fset, value.fdel) ] + [ value.__doc__ ])
+    if isinstance(value, (staticmethod, classmethod)):
+        return type(value)(_rebind(value.__func__))
+    if isinstance(value, (type, types.ClassType)):
+        if issubclass(value, uml.Base):
+            return globals()[value.__name__]
+        if value.__module__ == uml.__name__ and value.__name__ not in vars(uml):
+            # Classes defined inside an entity class.
+            members = dict((k, _rebind(v)) for k, v in vars(value).items() if k not in _mapping)
+            return type(value)(value.__name__, value.__bases__, members)
+    return value
+
+def _original_init(cls):
+    """Return the constructor of the mapped class cls, without instrumentation."""
+    init = vars(cls)['__init__']
+    while hasattr(init, '_sa_original_init'):
+        init = getattr(init._sa_original_init, 'im_func', init._sa_original_init)
+    return init
+
+def _build(mapper):
+    """Create the class of this module for the class of mapper.
+
+    Return the pairs of Attribute and reverse relationship property of its
+    relationships.
+    """
+    cls = mapper.class_
+    base = globals()[mapper.inherits.class_.__name__] if mapper.inherits else Base
+    inherited = set(a for c in base.__mro__ for a in getattr(c, '__slots__', ()))
+    slots = [] if mapper.inherits else list(uml._caches)
+    texts = []
+    natives = []
+    relationships = []
+    for prop in mapper.iterate_properties:
+        if prop.parent is not mapper or prop.key in inherited:
+            continue
+        if isinstance(prop, ColumnProperty):
+            column = prop.columns[0]
+            # Foreign keys and the type are given by references and classes.
+            if column.foreign_keys and not column.primary_key or prop.key == 'entityclass':
+                continue
+            if isinstance(column.type, uml.NativeString):
+                natives.append(prop.key)
+            elif isinstance(column.type, String):
+                texts.append(prop.key)
+        else:
+            relationships.append(prop)
+        slots.append(prop.key)
+    members = dict((k, _rebind(v)) for k, v in vars(cls).items()
+                   if k not in _mapping and not hasattr(v, '__clause_element__'))
+    members.update(__slots__=tuple(slots), __module__=__name__,
+                   entityclass=mapper.polymorphic_identity)
+    # The mapper replaces the constructor of each class by an instrumented one.
+    init = _original_init(cls)
+    if mapper.inherits and init is _original_init(mapper.inherits.class_):
+        del members['__init__']
+    else:
+        members['__init__'] = _rebind(init)
+    new = globals()[cls.__name__] = type(cls.__name__, (base,), members)
+    for key in texts:
+        _attributes[new, key] = Attribute(vars(new)[key], _text)
+    for key in natives:
+        _attributes[new, key] = Attribute(vars(new)[key], _native)
+    reverses = []
+    for prop in relationships:
+        slot = vars(new)[prop.key]
+        if prop.direction is MANYTOONE:
+            attribute = Reference(slot)
+        else:
+            attribute = Collection(slot, prop.direction is not MANYTOMANY)
+        _attributes[new, prop.key] = attribute
+        reverses.extend((attribute, reverse) for reverse in prop._reverse_property)
+    return reverses
+
+def _fields(cls):
+    """Return the pairs of name and slot of the columns and relationships of cls."""
+    return [ (k, vars(c)[k]) for c in cls.__mro__ for k in getattr(c, '__slots__', ())
+             if k not in uml._caches ]
+
+def dump(entities):
+    """Return the rows of the columns and relationships of entities, to store them.
+
+    Related entities are given by their position in entities. Return None if
+    entities reference other ones. Memoized values are not kept.
+    """
+    position = dict((id(entity), i) for i, entity in enumerate(entities))
+    rows = []
+    for entity in entities:
+        row = {}
+        for key, slot in _fields(type(entity)):
+            value = slot.__get__(entity)
+            attribute = entity._setters.get(key)
+            if isinstance(attribute, Collection):
+                value = [ position.get(id(v)) for v in value ]
+                if None in value:
+                    return None
+            elif isinstance(attribute, Reference) and value is not None:
+                value = position.get(id(value))
+                if value is None:
+                    return None
+            row[key] = value
+        rows.append((type(entity).__name__, row))
+    return rows
+
+def restore(rows):
+    """Return the entities of rows given by dump.
+
+    Both sides of each relationship are in the rows, so they are set as they
+    are, without calling the listeners.
+    """
+    classes = [ globals()[name] for name, row in rows ]
+    entities = [ cls.__new__(cls) for cls in classes ]
+    for entity, (name, row) in zip(entities, rows):
+        Base.__init__(entity)
+        for key, value in row.items():
+            attribute = entity._setters.get(key)
+            if isinstance(attribute, Collection):
+                list.extend(attribute.slot.__get__(entity), [ entities[i] for i in value ])
+            elif isinstance(attribute, Reference):
+                attribute.slot.__set__(entity, None if value is None else entities[value])
+            elif attribute is not None:
+                attribute.slot.__set__(entity, value)
+            else:
+                object.__setattr__(entity, key, value)
+    return entities
+
+def _observe(classname, key, identifier, fn):
+    """Call fn on the events of the attribute key, as uml does for its mapped attribute."""
+    slot = getattr(globals()[classname], key)
+    attribute = _attributes.setdefault((slot.__objclass__, key), Attribute(slot))
+    attribute.listeners[identifier].append(globals()[fn])
+
+for _name, _value in vars(uml).items():
+    if not _name.startswith('__') and _name not in globals():
+        globals()[_name] = _value
+for _name, _value in vars(uml).items():
+    if isinstance(_value, types.FunctionType) and _value.__module__ == uml.__name__:
+        globals()[_name] = _rebind(_value)
+
+_mappers = list(uml.CEntity.__mapper__.self_and_descendants)
+_reverses = [ r for _mapper in _mappers for r in _build(_mapper) ]
+for _attribute, _reverse in _reverses:
+    _attribute.reverse = _attributes[globals()[_reverse.parent.class_.__name__], _reverse.key]
+for _listener in uml._listeners:
+    _observe(*_listener)
+for _mapper in _mappers:
+    _new = globals()[_mapper.class_.__name__]
+    _slots = [ (c, k) for c in _new.__mro__ for k in getattr(c, '__slots__', ()) ]
+    _new._slots = tuple(vars(c)[k] for c, k in _slots)
+    _new._collections = tuple(_attributes[s] for s in _slots if isinstance(_attributes.get(s), Collection))
+    _new._setters = dict((k, _attributes[c, k]) for c, k in _slots if (c, k) in _attributes)
+
+# vim:expandtab:smartindent:tabstop=4:softtabstop=4:shiftwidth=4:
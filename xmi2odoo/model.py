@@ -22,32 +22,167 @@
 
 from urllib2 import urlopen
 import xml.etree.ElementTree as ET
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from xml.parsers import expat
+from sqlalchemy import create_engine, func, event, inspect
+from sqlalchemy.orm import sessionmaker, selectinload
+from sqlalchemy.sql import bindparam
 import pkg_resources, os, sys
 import uml
+import memory
 import logging
 import time
 import md5
+import mmap
+import zipfile
+import gzip
+import collections
+import operator
+import heapq
+import shutil
+import tempfile
+import re
+import cPickle as pickle
+import ast
+import json
 
 _lines_to_stop = eval(os.environ.get('STOP','[]'))
 
+# Increase it when the parser changes the entities generated from a file.
+SNAPSHOT_VERSION = 1
+
+# Bytes read from the input on each call to the expat parser.
+CHUNK_SIZE = 1 << 16
+
+_href_re = re.compile(r'''href\s*=\s*['"]([^'"#]*)#''')
+
+def open_xmi(source):
+    """Return a stream over the XMI in source, a filename or a file.
+
+    ArgoUML projects (.zargo and .zuml) and files compressed by gzip (.gz) or
+    xz (.xz) are decompressed while reading. Reading xz files needs the lzma
+    module from backports.lzma.
+
+    >>> xmi = open_xmi('xmi2odoo/test/data/test_002.zargo')
+    >>> xmi.name
+    'test_002.xmi'
+    >>> xmi.readline()
+    "<?xml version = '1.0' encoding = 'UTF-8' ?>\\n"
+    """
+    filename = source if isinstance(source, basestring) else getattr(source, 'name', '')
+    if filename.endswith(('.zargo', '.zuml')):
+        archive = zipfile.ZipFile(source)
+        names = archive.namelist()
+        xmi = [ n for n in names if n.endswith('.xmi') ] or [ n for n in names if n.endswith('.uml') ]
+        if not xmi:
+            raise RuntimeError, "Not found any XMI file in %s." % filename
+        return archive.open(xmi[0])
+    if filename.endswith('.gz'):
+        return gzip.GzipFile(filename) if source is filename else gzip.GzipFile(fileobj=source)
+    if filename.endswith('.xz'):
+        try:
+            import lzma
+        except ImportError:
+            try:
+                from backports import lzma
+            except ImportError:
+                raise RuntimeError, "Reading %s needs the lzma module. Install backports.lzma." % filename
+        return lzma.LZMAFile(source)
+    return open(source) if source is filename else source
+
 class FileWrapper:
+     """Read the source by chunks.
+
+     Local files are mapped in memory by windows, so the mapped pages of a big
+     file don't stay in memory after being parsed.
+     """
+
+     # Bytes of the file mapped at once. Multiple of mmap.ALLOCATIONGRANULARITY.
+     window = 1 << 24
+
      def __init__(self, source, filename=None):
          if not hasattr(source, 'readline'):
              if os.path.exists(source):
-                 source = open(source)
+                 source = open_xmi(source)
              else:
                  import StringIO
                  source = StringIO.StringIO(source)
+         elif type(source) is file:
+             source = open_xmi(source)
          self.source = source
-         self.lineno = 0
          self.filename = filename
-
-     def read(self, bytes):
-         s = self.source.readline()
-         self.lineno += 1
-         return s
+         self.map = None
+         if type(source) is not file:
+             return
+         try:
+             self.size = os.fstat(source.fileno()).st_size
+             start = source.tell()
+             if start < self.size:
+                 self._map(start - start % mmap.ALLOCATIONGRANULARITY)
+                 self.map.seek(start - self.offset)
+         except (AttributeError, EnvironmentError, ValueError):
+             self.map = None
+
+     def _map(self, offset):
+         self.offset = offset
+         self.map = mmap.mmap(self.source.fileno(), min(self.window, self.size - offset),
+                              access=mmap.ACCESS_READ, offset=offset)
+
+     def read(self, size=-1):
+         if self.map is None:
+             return self.source.read(size)
+         if size < 0:
+             return ''.join(iter(lambda: self.read(self.window), ''))
+         if self.map.tell() == len(self.map):
+             offset = self.offset + len(self.map)
+             if offset >= self.size:
+                 return ''
+             self.map.close()
+             self._map(offset)
+         return self.map.read(size)
+
+     def release(self):
+         """Close the mapped window, keeping the source open."""
+         if self.map is not None:
+             self.map.close()
+             self.map = None
+
+     def close(self):
+         """Close the mapped window and the source."""
+         self.release()
+         if hasattr(self.source, 'close'):
+             self.source.close()
+
+def _digest_xmi(digest, source):
+    """Update digest with the content of source, read by chunks. Return the urls referenced by href.
+
+    Only the last tag, maybe cut by the chunk, is kept to find the urls.
+
+    >>> digest = md5.md5()
+    >>> _digest_xmi(digest, FileWrapper('<a href="one#x"/><a href="two#y"/>'))
+    ['one', 'two']
+    >>> digest.hexdigest() == md5.md5('<a href="one#x"/><a href="two#y"/>').hexdigest()
+    True
+    """
+    hrefs = []
+    tail = ''
+    for chunk in iter(lambda: source.read(CHUNK_SIZE), ''):
+        digest.update(chunk)
+        text = tail + chunk
+        cut = text.rfind('<')
+        if cut < 0:
+            cut = len(text)
+        hrefs.extend(_href_re.findall(text, 0, cut))
+        tail = text[cut:]
+    hrefs.extend(_href_re.findall(tail))
+    return hrefs
+
+def _digest_url(digest, url):
+    """Update digest with the content of the file in url. Return the urls referenced by href."""
+    source = FileWrapper(open_xmi(url))
+    try:
+        return _digest_xmi(digest, source)
+    finally:
+        source.close()
 
 class NotResolved:
     pass
@@ -59,6 +194,272 @@ def asNotResolved(p):
 def maskstr(mask, params):
     return [ m and type(v) is str for m,v in zip(mask,params) ]
 
+UML = '{org.omg.xmi.namespace.UML}'
+
+# Handlers of the parser events, indexed by (kind, event, tag).
+_handlers = {}
+
+def handler(kind, event, *tags):
+    """Register the decorated method as handler of the event over the UML tags.
+
+    :param kind: 'description', 'reference', 'externalref' or 'plain'.
+    :param event: 'start' or 'end'.
+    :param tags: Tag names without the UML namespace.
+    """
+    def register(f):
+        for tag in tags:
+            _handlers[(kind, event, UML + tag)] = f
+        return f
+    return register
+
+class _LoadContext(object):
+    """State of a file load shared by the handlers.
+
+    Handlers store here the entities in process. Reading an entity not stored
+    yet raises AttributeError, as the XMI is not well formed.
+    """
+    def __init__(self):
+        self.owner = []
+        self.in_xmi = False
+        self.stop = False
+        self.lineno = 0
+        self.elem = None
+        self.cclass = None
+        self.cpackage = None
+        self.skip = 0
+        self.skipped = frozenset()
+
+def _fixtext(text):
+    # Same as ElementTree, convert to ascii if possible.
+    try:
+        return text.encode('ascii')
+    except UnicodeError:
+        return text
+
+def _track_lines(parser, lines):
+    """Append to lines the line number of each element event of the expat parser.
+
+    ElementTree iterparse reports the events after parsing a whole chunk, when
+    the parser position is not longer the position of the elements.
+    """
+    def track(handler):
+        def tracked(*args):
+            lines.append(parser.CurrentLineNumber)
+            return handler(*args)
+        return tracked
+    parser.StartElementHandler = track(parser.StartElementHandler)
+    parser.EndElementHandler = track(parser.EndElementHandler)
+
+class _EndOfXMI(Exception):
+    pass
+
+class _Element(object):
+    """Element given by the expat reader to the handlers.
+
+    As ElementTree elements, it has the tag, the attributes and the text before
+    the first child, but it not keeps the children.
+    """
+    __slots__ = ('tag', 'attrib', 'text')
+
+    def __init__(self, tag, attrib):
+        self.tag = tag
+        self.attrib = attrib
+        self.text = None
+
+class _ExpatReader(object):
+    """Call handle(ctx, event, elem) for each element parsed by expat."""
+
+    def __init__(self, handle, ctx):
+        self.handle = handle
+        self.ctx = ctx
+        self.names = {}
+        self.stack = []
+        self.texted = None
+        self.data = []
+        parser = self.parser = expat.ParserCreate(None, '}')
+        parser.buffer_text = True
+        parser.ordered_attributes = True
+        parser.specified_attributes = True
+        parser.StartElementHandler = self.start
+        parser.EndElementHandler = self.end
+        parser.CharacterDataHandler = self.chardata
+
+    def fixname(self, name):
+        try:
+            return self.names[name]
+        except KeyError:
+            r = self.names[name] = _fixtext('{' + name if '}' in name else name)
+            return r
+
+    def flush(self):
+        if self.data:
+            if self.texted is not None:
+                self.texted.text = _fixtext(''.join(self.data))
+            self.data = []
+        self.texted = None
+
+    def start(self, tag, attrib_in):
+        self.flush()
+        fixname = self.fixname
+        attrib = {}
+        for i in range(0, len(attrib_in), 2):
+            attrib[fixname(attrib_in[i])] = _fixtext(attrib_in[i+1])
+        elem = _Element(fixname(tag), attrib)
+        self.stack.append(elem)
+        self.texted = elem
+        self.event('start', elem)
+
+    def end(self, tag):
+        self.flush()
+        self.event('end', self.stack.pop())
+
+    def chardata(self, data):
+        if self.texted is not None:
+            self.data.append(data)
+
+    def event(self, event, elem):
+        self.ctx.lineno = self.parser.CurrentLineNumber
+        if not self.handle(self.ctx, event, elem):
+            raise _EndOfXMI()
+
+_PACKAGE = UML[1:] + 'Package'
+_OWNED = UML[1:] + 'Namespace.ownedElement'
+# Units referencing a selected unit are selected too.
+_BACK = (UML[1:] + 'Association', UML[1:] + 'StateMachine', UML[1:] + 'Generalization')
+
+def _selection_name(name):
+    """Return name as the model names a package, see uml.CEntity.__init__."""
+    try:
+        name = str(name)
+    except UnicodeError:
+        pass
+    return name if uml.is_valid_name(name) else uml.clean_name(name)
+
+def package_selected(names, packages):
+    """True if a package is selected by the names in packages.
+
+    names are the names of the package and of the packages owning it. A
+    package is selected with every package nested in it. Names are compared
+    as the model stores them, so a package can be selected by its name in
+    the XMI file or by its clean name.
+
+    >>> package_selected(['sale'], ['Sale']), package_selected([u'sale'], ['sale'])
+    (True, True)
+    >>> package_selected(['reports', 'Sale Orders'], ['sale_orders'])
+    True
+    >>> package_selected(['sale'], ['stock'])
+    False
+    """
+    selected = set(_selection_name(p) for p in packages)
+    return any(_selection_name(name) in selected for name in names)
+
+class _PackageScanner(object):
+    """Index of the packages of a XMI file and the elements they own.
+
+    Elements owned by packages, as classes or associations, are the units of
+    the selective loading. For each package and unit it stores the owner
+    package and the references inside it, and for each xmi.id the package or
+    unit declaring it.
+    """
+
+    def __init__(self):
+        self.owner = {}
+        self.names = {}
+        self.refs = {}
+        self.back = {}
+        self.declared = {}
+        self.roots = []
+        self._tags = []
+        self._nodes = []
+        self._packages = []
+        self._unit = None
+        self._unit_tag = None
+
+    def scan(self, infile):
+        parser = expat.ParserCreate(None, '}')
+        parser.StartElementHandler = self.start
+        parser.EndElementHandler = self.end
+        try:
+            data = True
+            while data:
+                data = infile.read(CHUNK_SIZE)
+                parser.Parse(data, not data)
+        except _EndOfXMI:
+            pass
+        return self
+
+    def start(self, tag, attrib):
+        parent = self._tags[-1] if self._tags else None
+        self._tags.append(tag)
+        package = self._packages[-1] if self._packages else None
+        node = None
+        xmi_id = attrib.get('xmi.id')
+        if xmi_id is not None:
+            if self._unit is None and tag == _PACKAGE:
+                node = xmi_id
+                self.names[node] = _fixtext(attrib.get('name', ''))
+                self._packages.append(node)
+            elif self._unit is None and parent == _OWNED:
+                node = self._unit = xmi_id
+                self._unit_tag = tag
+                self.back[node] = []
+            if node is not None:
+                self.owner[node] = package
+                self.refs[node] = []
+            self.declared[xmi_id] = self._unit or self._packages and self._packages[-1] or None
+        self._nodes.append(node)
+        ref = attrib.get('xmi.idref')
+        if ref is not None:
+            if self._unit is not None:
+                self.refs[self._unit].append(ref)
+                if self._unit_tag in _BACK:
+                    self.back[self._unit].append(ref)
+            elif package is not None:
+                self.refs[package].append(ref)
+            else:
+                self.roots.append(ref)
+
+    def end(self, tag):
+        self._tags.pop()
+        node = self._nodes.pop()
+        if node is None:
+            pass
+        elif node == self._unit:
+            self._unit = None
+        else:
+            self._packages.pop()
+        if tag == 'XMI':
+            raise _EndOfXMI()
+
+    def skipped(self, packages):
+        """Return the packages and units not needed to load the packages.
+
+        Needed are the selected packages with everything inside them, the
+        associations, state machines and generalizations referencing them, and
+        all they reference, recursively.
+        """
+        def is_selected(node):
+            names = []
+            while node is not None:
+                if node in self.names:
+                    names.append(self.names[node])
+                node = self.owner[node]
+            return package_selected(names, packages)
+        selected = set(node for node in self.owner if is_selected(node))
+        queue = list(selected)
+        queue.extend(unit for unit, refs in self.back.items()
+                     if any(self.declared.get(ref) in selected for ref in refs))
+        queue.extend(self.declared.get(ref) for ref in self.roots)
+        needed = set()
+        while queue:
+            node = queue.pop()
+            if node is None or node in needed:
+                continue
+            needed.add(node)
+            queue.append(self.owner[node])
+            queue.extend(self.declared.get(ref) for ref in self.refs[node])
+        return frozenset(node for node in self.owner if node not in needed)
+
 class Model:
     """UML Model.
     
@@ -82,9 +483,9 @@ class Model:
     >>> for xmi_id in model:
     ...     print xmi_id
     127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000865
-    .:000000000000087A
     127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000866
     127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000867
+    .:000000000000087A
     .:0000000000000821
     .:0000000000000822
     .:0000000000000823
@@ -139,9 +540,9 @@ class Model:
     -84-17--56-5-43645a83:11466542d86:-8000:000000000000087C
     -84-17--56-5-43645a83:11466542d86:-8000:000000000000087D
     -84-17--56-5-43645a83:11466542d86:-8000:000000000000087E
-    -84-17--56-5-43645a83:11466542d86:-8000:0000000000000880
     -84-17--56-5-43645a83:11466542d86:-8000:0000000000000881
     -84-17--56-5-43645a83:11466542d86:-8000:0000000000000882
+    -84-17--56-5-43645a83:11466542d86:-8000:0000000000000880
     127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000868
     127-0-1-1--9b39813:13af03f5b9c:-8000:000000000000086B
     127-0-1-1--9b39813:13af03f5b9c:-8000:000000000000086C
@@ -151,9 +552,9 @@ class Model:
     >>> for xmi_id in model:
     ...     print model[xmi_id]
     <CModel(xmi_id:'127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000865', name:'untitle')>
-    <CModel(xmi_id:'.:000000000000087A', name:'UML 1.4 Standard Elements')>
     <CPackage(xmi_id:'127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000866', name:'testing1')>
     <CClass(xmi_id:'127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000867', name:'class1')>
+    <CModel(xmi_id:'.:000000000000087A', name:'UML 1.4 Standard Elements')>
     <CStereotype(xmi_id:'.:0000000000000821', name:'access')>
     <CStereotype(xmi_id:'.:0000000000000822', name:'friend')>
     <CStereotype(xmi_id:'.:0000000000000823', name:'import')>
@@ -208,9 +609,9 @@ class Model:
     <CDataType(xmi_id:'-84-17--56-5-43645a83:11466542d86:-8000:000000000000087C', name:'Integer')>
     <CDataType(xmi_id:'-84-17--56-5-43645a83:11466542d86:-8000:000000000000087D', name:'UnlimitedInteger')>
     <CDataType(xmi_id:'-84-17--56-5-43645a83:11466542d86:-8000:000000000000087E', name:'String')>
-    <CEnumeration(xmi_id:'-84-17--56-5-43645a83:11466542d86:-8000:0000000000000880', name:'Boolean', literals:[u'TRUE', u'FALSE'])>
     <CEntity(xmi_id:'-84-17--56-5-43645a83:11466542d86:-8000:0000000000000881', name:'TRUE')>
     <CEntity(xmi_id:'-84-17--56-5-43645a83:11466542d86:-8000:0000000000000882', name:'FALSE')>
+    <CEnumeration(xmi_id:'-84-17--56-5-43645a83:11466542d86:-8000:0000000000000880', name:'Boolean', literals:[u'TRUE', u'FALSE'])>
     <CAttribute(xmi_id:'127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000868', name:'attr1', size=None)>
     <COperation(xmi_id:'127-0-1-1--9b39813:13af03f5b9c:-8000:000000000000086B', name:'func1')>
     <CParameter(xmi_id:'127-0-1-1--9b39813:13af03f5b9c:-8000:000000000000086C', name:'return', kind='None')>
@@ -259,15 +660,10 @@ class Model:
 
     Iterate over members of "document"
 
-    >>> for xmi_id in model.iterclass(uml.CMember,
-    ...                                uml.CMember.member_of == model['127-0-1-1-2b464aa4:13b09d81b72:-8000:00000000000010D8']):
+    >>> document = model['127-0-1-1-2b464aa4:13b09d81b72:-8000:00000000000010D8']
+    >>> for xmi_id in model.iterclass(uml.CMember, lambda m: m.member_of is document):
     ...     print model[xmi_id]
-    <COperation(xmi_id:'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EF3', name:'newOperation')>
-    <CAttribute(xmi_id:'127-0-1-1-2b464aa4:13b09d81b72:-8000:00000000000010A6', name:'name', size=None)>
-    <CAttribute(xmi_id:'127-0-1-1-2b464aa4:13b09d81b72:-8000:00000000000010B7', name:'name', size=None)>
     <CAttribute(xmi_id:'127-0-1-1-2b464aa4:13b09d81b72:-8000:00000000000010D9', name:'number', size=None)>
-    <CAttribute(xmi_id:'127-0-1-1-2b464aa4:13b09d81b72:-8000:00000000000010F8', name:'name', size=None)>
-    <CAttribute(xmi_id:'127-0-1-1-2b464aa4:13b09d81b72:-8000:0000000000001116', name:'name', size=None)>
     <CAttribute(xmi_id:'127-0-1-1-2b464aa4:13b09d81b72:-8000:00000000000010E7', name:'tipo', size=None)>
 
     Take the Package and get properties.
@@ -315,13 +711,207 @@ class Model:
 
     >>> child.is_stereotype('method')
     False
+
+    References are solved by the identity map, without querying the database.
+
+    >>> model.identity_stats['hits'] > model.identity_stats['misses']
+    True
+
+    Entities are kept in memory, unless a database is given. A database file
+    or ':memory:' stores them with the same classes, mapped by SQLAlchemy.
+
+    >>> Model().uml is memory
+    True
+    >>> model = Model(db=':memory:')
+    >>> model.uml is uml
+    True
+    >>> model.load("xmi2odoo/test/data/test_002.xmi")
+    >>> str(repr(model)) == out.strip()
+    True
+
+    In bulk mode the session is not flushed while parsing. Entities are inserted
+    at the end of the load and the result is the same.
+
+    >>> model = Model(db=':memory:', bulk=True)
+    >>> model.load("xmi2odoo/test/data/test_002.xmi")
+    >>> str(repr(model)) == out.strip()
+    True
+
+    References to entities not declared in any file are reported.
+
+    >>> model = Model()
+    >>> model.load("xmi2odoo/test/data/test_004.xmi")
+    Traceback (most recent call last):
+    ...
+    RuntimeError: Postprocessing can't create: 127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000968 referenced by 127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000967; 127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000969 referenced by 127-0-1-1--9b39813:13af03f5b9c:-8000:0000000000000967.
+
+    Profiles are stored as snapshots the first time they are parsed in a
+    database, in snapshot_dir or ~/.xmi2odoo/profiles. Next times their
+    entities are imported from the snapshot.
+
+    >>> import tempfile, shutil
+    >>> snapshot_dir = tempfile.mkdtemp()
+    >>> url = "http://argouml.org/user-profiles/OpenObjectStadardElements.xmi"
+    >>> parsed = Model(url, db=':memory:', snapshots=False)
+    >>> imported = Model(url, db=':memory:', snapshot_dir=snapshot_dir)
+    >>> os.listdir(snapshot_dir)
+    ['OpenObjectStadardElements.xmi.snapshot']
+    >>> imported = Model(url, db=':memory:', snapshot_dir=snapshot_dir)
+    >>> entities = lambda m: [ (x, type(m[x]), m[x].name, m[x].tag) for x in m ]
+    >>> entities(parsed) == entities(imported)
+    True
+    >>> shutil.rmtree(snapshot_dir)
+
+    Models in memory have their own snapshots. The profile referenced by
+    test_002.xmi is parsed the first time and imported next times.
+
+    >>> snapshot_dir = tempfile.mkdtemp()
+    >>> parsed = Model("xmi2odoo/test/data/test_002.xmi", snapshot_dir=snapshot_dir)
+    >>> os.listdir(snapshot_dir)
+    ['OpenObjectStadardElements.xmi.memory.snapshot']
+    >>> imported = Model("xmi2odoo/test/data/test_002.xmi", snapshot_dir=snapshot_dir)
+    >>> [ infile.filename for infile in parsed._infiles ]
+    ['xmi2odoo/test/data/test_002.xmi', 'http://argouml.org/user-profiles/OpenObjectStadardElements.xmi']
+    >>> [ infile.filename for infile in imported._infiles ]
+    ['xmi2odoo/test/data/test_002.xmi']
+    >>> entities(parsed) == entities(imported), str(repr(imported)) == out.strip()
+    (True, True)
+    >>> shutil.rmtree(snapshot_dir)
+
+    Models can be stored in a cache directory. If the input and the files it
+    references have not changed, the model is loaded from the cache.
+
+    >>> import tempfile, shutil
+    >>> cachedir = tempfile.mkdtemp()
+    >>> Model("xmi2odoo/test/data/test_002.xmi", cache=cachedir).cached
+    False
+    >>> model = Model("xmi2odoo/test/data/test_002.xmi", cache=cachedir)
+    >>> model.cached
+    True
+    >>> str(repr(model)) == out.strip()
+    True
+    >>> shutil.rmtree(cachedir)
+
+    ArgoUML projects and compressed files are decompressed while parsing.
+
+    >>> str(repr(Model("xmi2odoo/test/data/test_002.zargo"))) == out.strip()
+    True
+    >>> import gzip
+    >>> compressed = tempfile.mktemp(suffix='.xmi.gz')
+    >>> f = gzip.open(compressed, 'wb')
+    >>> shutil.copyfileobj(open("xmi2odoo/test/data/test_002.xmi"), f)
+    >>> f.close()
+    >>> str(repr(Model(compressed, parser='expat'))) == out.strip()
+    True
+    >>> os.remove(compressed)
+
+    Files are parsed with ElementTree by default. The expat parser calls the
+    same handlers without building the element tree, and the entities are the
+    same.
+
+    >>> parsed = Model("xmi2odoo/test/data/test_005.xmi", parser='etree')
+    >>> expat = Model("xmi2odoo/test/data/test_005.xmi", parser='expat')
+    >>> entities(parsed) == entities(expat)
+    True
+    >>> expat['test_005:draft:confirmed'].guard.body
+    u'amount > 0'
+
+    Errors report the line of the element given by the parser.
+
+    >>> import StringIO
+    >>> xmi = ("<XMI xmlns:UML='org.omg.xmi.namespace.UML'><XMI.content>\\n"
+    ...        "<UML:Model xmi.id='m' name='m'><UML:Package xmi.id='p' name='p'>\\n"
+    ...        "<UML:Class xmi.id='a' name='a'>\\n"
+    ...        "<UML:Class xmi.id='b' name='b'/>\\n"
+    ...        "</UML:Class></UML:Package></UML:Model></XMI.content></XMI>")
+    >>> for parser in Model.parsers:
+    ...     try:
+    ...         Model(StringIO.StringIO(xmi), parser=parser)
+    ...     except RuntimeError, e:
+    ...         print str(e).splitlines()[0]
+    Parsing error in line 4 of file <stream>.
+    Parsing error in line 4 of file <stream>.
+
+    >>> Model(parser='sax')
+    Traceback (most recent call last):
+    ...
+    RuntimeError: Unknown parser 'sax'. Use one of etree, expat.
+
+    Only the selected packages are loaded, with the entities they reference
+    and the associations referencing them.
+
+    >>> for parser in Model.parsers:
+    ...     sale = Model("xmi2odoo/test/data/test_006.xmi", packages=['sale'], parser=parser)
+    ...     print sorted(x for x in sale.iterclass(uml.CClass) if x.startswith('test_006'))
+    [u'test_006:base:partner', u'test_006:sale:order', u'test_006:sale:partner', u'test_006:stock:picking']
+    [u'test_006:base:partner', u'test_006:sale:order', u'test_006:sale:partner', u'test_006:stock:picking']
+
+    Packages can be nested. Entities belong to the innermost package around
+    them, also when they are declared after the end of a nested package.
+
+    >>> nested = Model("xmi2odoo/test/data/test_007.xmi")
+    >>> for xmi_id in ('test_007:stock', 'test_007:stock:picking', 'test_007:sale:quotation', 'test_007:account'):
+    ...     print xmi_id, nested[xmi_id].package and nested[xmi_id].package.name
+    test_007:stock sale
+    test_007:stock:picking stock
+    test_007:sale:quotation sale
+    test_007:account None
+
+    Streams that can not seek, as pipes or urls, are copied to a temporary
+    file to scan their packages before loading them.
+
+    >>> class Reader:
+    ...     def __init__(self, filename):
+    ...         source = open(filename)
+    ...         self.read, self.readline = source.read, source.readline
+    >>> sale = Model(packages=['sale'])
+    >>> sale.load(Reader("xmi2odoo/test/data/test_006.xmi"))
+    >>> sorted(x for x in sale.iterclass(uml.CClass) if x.startswith('test_006'))
+    [u'test_006:base:partner', u'test_006:sale:order', u'test_006:sale:partner', u'test_006:stock:picking']
+
+    Databases opened readonly are used as stored, without creating or
+    migrating tables, and can not be written.
+
+    >>> import sqlalchemy.exc
+    >>> dbfile = tempfile.mktemp(suffix='.db')
+    >>> Model("xmi2odoo/test/data/test_006.xmi", db=dbfile).session.commit()
+    >>> stored = Model(db=dbfile, readonly=True)
+    >>> stored['test_006:sale:order'].name
+    u'order'
+    >>> try:
+    ...     stored.session.execute('DELETE FROM centity')
+    ... except sqlalchemy.exc.OperationalError, e:
+    ...     print e.orig
+    attempt to write a readonly database
+    >>> stored.session.close()
+    >>> os.remove(dbfile)
     """
 
-    def __init__(self, url=None, debug=False, db=':memory:'):
-        self.engine = create_engine('sqlite:///%s' % db, echo=debug)
-        uml.Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+    parsers = ('etree', 'expat')
+    # Parser used if none is given, also by the command line.
+    default_parser = 'etree'
+    # Directory of the profile snapshots if none is given.
+    default_snapshot_dir = '~/.xmi2odoo/profiles'
+
+    def __init__(self, url=None, debug=False, db=None, bulk=False, snapshots=True, cache=None, parser=default_parser, packages=None, readonly=False, snapshot_dir=None):
+        if parser not in self.parsers:
+            raise RuntimeError, "Unknown parser '%s'. Use one of %s." % (parser, ', '.join(self.parsers))
+        self.queries = 0
+        self._objects = []
+        if db is None and cache is None:
+            self.uml = memory
+            self.engine = self.session = None
+        else:
+            self.uml = uml
+            self.engine = create_engine('sqlite:///%s' % (db or ':memory:'), echo=debug)
+            event.listen(self.engine, 'before_cursor_execute', self._count_query)
+            if readonly:
+                event.listen(self.engine, 'connect', self._query_only)
+            else:
+                uml.Base.metadata.create_all(self.engine)
+                self._migrate()
+            Session = sessionmaker(bind=self.engine)
+            self.session = Session()
         self.parsed_urls = []
         self._load_stack = []
         self._postprocessing_create = []
@@ -329,10 +919,116 @@ class Model:
         self._postprocessing_set = []
         self._infiles = []
         self._order = 0
+        self._entities = {}
+        self._pending = []
+        self.bulk = bulk
+        self.snapshots = snapshots
+        self.snapshot_dir = snapshot_dir or self.default_snapshot_dir
+        self._last_id = self.session and self.session.query(func.max(uml.CEntity.id)).scalar() or 0
+        self._stored = self._last_id > 0
+        self.identity_stats = {'hits': 0, 'misses': 0}
+        self.cache = cache
+        self.cached = False
+        self.parser = parser
+        self.packages = packages
         if url != None:
-            self.load(url)
-
-    def _c_load(self, url):
+            if cache is None:
+                self.load(url)
+            else:
+                self._cached_load(url)
+
+    def _migrate(self):
+        """Update databases created by older versions to the current schema.
+
+        Multiplicity ranges of association ends were stored as the repr of a
+        tuple in cassociationend.multiplicityrange. They are moved to the
+        lower, upper and cardinality columns.
+
+        Default tag values were stored pickled in centity.default_tagvalues.
+        They are moved to the label and default_tags columns. Labels given as
+        str were stored as blobs in the label column. They are stored as text.
+
+        Old columns are left in place, unused. Missing indexes are created.
+
+        >>> import sqlite3, tempfile, shutil
+        >>> tmpdir = tempfile.mkdtemp(); dbfile = os.path.join(tmpdir, 'test_003.db')
+        >>> sqlite3.connect(dbfile).executescript(open("xmi2odoo/test/data/test_003.sql").read()).close()
+        >>> model = Model(db=dbfile)
+        >>> for end in model.session.query(uml.CAssociationEnd).order_by(uml.CAssociationEnd.id)[:4]:
+        ...     print end.name, end.multiplicityrange, end.cardinality
+        used_by None one
+        use (0, 1) one
+        owned_by None one
+        cars (0, -1) many
+        >>> model['127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009AB'].tag['label']
+        'car'
+        >>> model.engine.execute("SELECT name FROM centity WHERE label = 'car'").fetchall()
+        [(u'car',)]
+        >>> model.session.close()
+
+        Labels stored as blobs are converted to text.
+
+        >>> connection = sqlite3.connect(dbfile)
+        >>> connection.executescript("UPDATE centity SET label = CAST(label AS BLOB); PRAGMA user_version = 0").close()
+        >>> connection.close()
+        >>> model = Model(db=dbfile)
+        >>> model.engine.execute("SELECT name FROM centity WHERE label = 'car'").fetchall()
+        [(u'car',)]
+        >>> model.session.close()
+        >>> shutil.rmtree(tmpdir)
+        """
+        inspector = inspect(self.engine)
+        columns = [ c['name'] for c in inspector.get_columns('cassociationend') ]
+        if 'multiplicityrange' in columns and 'lower' not in columns:
+            logging.info('Migrating multiplicity ranges to the lower and upper columns.')
+            table = uml.CAssociationEnd.__table__
+            with self.engine.begin() as conn:
+                for column in ('lower', 'upper'):
+                    conn.execute('ALTER TABLE cassociationend ADD COLUMN "%s" INTEGER' % column)
+                conn.execute('ALTER TABLE cassociationend ADD COLUMN cardinality VARCHAR')
+                rows = []
+                for id, multiplicityrange, aggregation in conn.execute(
+                        'SELECT id, multiplicityrange, aggregation FROM cassociationend'):
+                    mr = ast.literal_eval(multiplicityrange) if multiplicityrange else None
+                    lower, upper = (None, None) if mr is None else mr
+                    rows.append(dict(id_=id, lower=lower, upper=upper, cardinality=uml.solvmul(mr, aggregation)))
+                if rows:
+                    conn.execute(table.update()
+                                 .where(table.c.id == bindparam('id_'))
+                                 .values(lower=bindparam('lower'), upper=bindparam('upper'),
+                                         cardinality=bindparam('cardinality')),
+                                 rows)
+        columns = [ c['name'] for c in inspector.get_columns('centity') ]
+        if 'default_tagvalues' in columns and 'label' not in columns:
+            logging.info('Migrating default tag values to the label column.')
+            table = uml.CEntity.__table__
+            with self.engine.begin() as conn:
+                conn.execute('ALTER TABLE centity ADD COLUMN label VARCHAR')
+                conn.execute('ALTER TABLE centity ADD COLUMN default_tags TEXT')
+                rows = []
+                for id, data in conn.execute('SELECT id, default_tagvalues FROM centity'):
+                    tagvalues = pickle.loads(str(data)) if data is not None else {}
+                    label = tagvalues.pop(u'label', None)
+                    rows.append({'id_': id, 'label': label,
+                                 'default_tags': json.dumps(tagvalues) if tagvalues else None})
+                if rows:
+                    conn.execute(table.update()
+                                 .where(table.c.id == bindparam('id_'))
+                                 .values(label=bindparam('label'), default_tags=bindparam('default_tags')),
+                                 rows)
+        with self.engine.begin() as conn:
+            if conn.execute('PRAGMA user_version').scalar() < 1:
+                conn.execute("UPDATE centity SET label = CAST(label AS TEXT) WHERE typeof(label) = 'blob'")
+                conn.execute('PRAGMA user_version = 1')
+        if 'ix_centity_type_package_id' not in [ i['name'] for i in inspector.get_indexes('centity') ]:
+            logging.info('Creating indexes.')
+            for table in uml.Base.metadata.sorted_tables:
+                existing = [ i['name'] for i in inspector.get_indexes(table.name) ]
+                for index in table.indexes:
+                    if index.name not in existing:
+                        index.create(self.engine)
+
+    def _c_path(self, url):
         querypaths = lambda filename: \
                 [os.path.join(os.path.expanduser('~'), '.xmi2odoo', 'profiles', filename),
                  pkg_resources.resource_filename(__name__, os.path.join('data', filename)) ]
@@ -340,7 +1036,7 @@ class Model:
             filename = url.split('/')[-1]
             try:
                 to_read = [ os.path.exists(fn) for fn in querypaths(filename) ].index(True)
-                iofile = open(querypaths(filename)[to_read])
+                path = querypaths(filename)[to_read]
             except:
                 raise RuntimeError, 'File not found. Search paths: %s' % querypaths
         else:
@@ -358,8 +1054,182 @@ class Model:
                 srcProfile.close()
             # Verifico que exista el archivo nuevamente
             to_read = [ os.path.exists(fn) for fn in querypaths(filename) ]
-            iofile = open(querypaths(filename)[to_read.index(True)])
-        return iofile
+            path = querypaths(filename)[to_read.index(True)]
+        return path
+
+    def _c_load(self, url):
+        return open(self._c_path(url))
+
+    def _snapshot_path(self, path):
+        # Entities in memory are stored in their own snapshots.
+        suffix = 'snapshot' if self.session is not None else 'memory.snapshot'
+        return os.path.join(os.path.expanduser(self.snapshot_dir), '%s.%s' % (os.path.basename(path), suffix))
+
+    def _schema_key(self):
+        return (SNAPSHOT_VERSION,
+                [ (t.name, [ c.name for c in t.columns ]) for t in uml.Base.metadata.sorted_tables ])
+
+    def _snapshot_key(self, path):
+        """Return the key to validate a snapshot of the profile in path.
+
+        Snapshots are invalid if the profile or the database schema changes.
+        """
+        return (self._schema_key(), md5.md5(open(path, 'rb').read()).hexdigest())
+
+    def _load_snapshot(self, path):
+        """Import the entities of a profile snapshot. Return False if there is not a valid snapshot.
+
+        Rows are inserted directly in the database, shifting ids and orders to
+        follow the entities already loaded. Entities in memory are built from
+        their rows and shifted in the same way.
+        """
+        try:
+            snapshot = pickle.load(open(self._snapshot_path(path), 'rb'))
+        except Exception:
+            return False
+        if snapshot['key'] != self._snapshot_key(path):
+            logging.info('Snapshot of %s is outdated.' % path)
+            return False
+        logging.info('Loading snapshot of %s.' % path)
+        id_offset = self._last_id - snapshot['first_id']
+        order_offset = self._order - snapshot['first_order']
+        if self.session is None:
+            entities = memory.restore(snapshot['entities'])
+            for obj in entities:
+                obj.id += id_offset
+                if obj.order is not None:
+                    obj.order += order_offset
+                if obj.xmi_id is not None:
+                    self._entities[obj.xmi_id] = obj
+            self._objects.extend(entities)
+            self._last_id += snapshot['ids']
+            self._order += snapshot['orders']
+            return True
+        for tablename, rows in snapshot['tables']:
+            table = uml.Base.metadata.tables[tablename]
+            ids = [ c.name for c in table.columns if c.primary_key or c.foreign_keys ]
+            for row in rows:
+                for k in ids:
+                    if row[k] is not None:
+                        row[k] += id_offset
+                if 'order' in row and row['order'] is not None:
+                    row['order'] += order_offset
+            if rows:
+                self.session.execute(table.insert(), rows)
+        first_id = self._last_id
+        self._last_id += snapshot['ids']
+        self._order += snapshot['orders']
+        for obj in self.session.query(uml.CEntity).filter(uml.CEntity.id > first_id,
+                                                          uml.CEntity.id <= self._last_id):
+            if obj.xmi_id is not None:
+                self._entities[obj.xmi_id] = obj
+        return True
+
+    def _save_snapshot(self, path, first_id, first_order):
+        """Store the entities loaded from the profile in path as a snapshot.
+
+        Profiles with references to entities of other files are not stored.
+        """
+        last_id = self._last_id
+        inrange = lambda v: v is None or first_id < v <= last_id
+        snapshot = {}
+        if self.session is None:
+            snapshot['entities'] = memory.dump([ obj for obj in self._objects if inrange(obj.id) ])
+            if snapshot['entities'] is None:
+                logging.info('Profile %s has external references, snapshot not stored.' % path)
+                return False
+        else:
+            snapshot['tables'] = tables = []
+            for table in uml.Base.metadata.sorted_tables:
+                ids = [ c.name for c in table.columns if c.primary_key or c.foreign_keys ]
+                rows = [ dict(row) for row in self.session.execute(table.select())
+                         if inrange(row[ids[0]]) ]
+                if not all(inrange(row[k]) for row in rows for k in ids):
+                    logging.info('Profile %s has external references, snapshot not stored.' % path)
+                    return False
+                tables.append((table.name, rows))
+        snapshot.update({
+            'key': self._snapshot_key(path),
+            'first_id': first_id,
+            'first_order': first_order,
+            'ids': last_id - first_id,
+            'orders': self._order - first_order,
+        })
+        filename = self._snapshot_path(path)
+        if not os.path.exists(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        tmpfilename = '%s.%i.tmp' % (filename, os.getpid())
+        outfile = open(tmpfilename, 'wb')
+        pickle.dump(snapshot, outfile, pickle.HIGHEST_PROTOCOL)
+        outfile.close()
+        os.rename(tmpfilename, filename)
+        return True
+
+    def _cache_key(self, infile):
+        """Return the cache key of infile and the urls it loads.
+
+        The key is a hash of the contents of infile, of every file referenced
+        by href, recursively, and of the database schema.
+        """
+        digest = md5.md5(repr((self._schema_key(), self.packages)))
+        if type(infile) is file:
+            urls = [ infile.name ]
+            source = FileWrapper(infile)
+            try:
+                hrefs = _digest_xmi(digest, source)
+            finally:
+                source.release()
+            infile.seek(0)
+        else:
+            urls = [ infile ]
+            hrefs = _digest_url(digest, infile)
+        queue = [ hrefs ]
+        while queue:
+            for url in queue.pop(0):
+                if url in urls:
+                    continue
+                urls.append(url)
+                digest.update(url)
+                queue.append(_digest_url(digest, url if os.path.exists(url) else self._c_path(url)))
+        return digest.hexdigest(), urls
+
+    def _copy_tables(self, path, to_path=False):
+        """Copy all the tables from the database in path, or to it if to_path is True."""
+        connection = self.engine.connect()
+        connection.execute("ATTACH DATABASE ? AS other", (path,))
+        try:
+            transaction = connection.begin()
+            for table in uml.Base.metadata.sorted_tables:
+                columns = ', '.join('"%s"' % c.name for c in table.columns)
+                source, target = ('main', 'other') if to_path else ('other', 'main')
+                connection.execute('INSERT INTO %s."%s" (%s) SELECT %s FROM %s."%s"' %
+                                   (target, table.name, columns, columns, source, table.name))
+            transaction.commit()
+        finally:
+            connection.execute("DETACH DATABASE other")
+            connection.close()
+
+    def _cached_load(self, infile):
+        """Load infile from the model cache, or load it and store it in the cache."""
+        key, urls = self._cache_key(infile)
+        filename = os.path.join(os.path.expanduser(self.cache), '%s.db' % key)
+        if os.path.exists(filename):
+            logging.info('Loading %s from cache %s.' % (urls[0], filename))
+            self._copy_tables(filename)
+            self._last_id = self.session.query(func.max(uml.CEntity.id)).scalar() or 0
+            self._order = (self.session.query(func.max(uml.CEntity.order)).scalar() or 0) + 1
+            self._stored = True
+            self.parsed_urls.extend(urls)
+            self.cached = True
+            return
+        self.load(infile)
+        if not os.path.exists(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        tmpfilename = '%s.%i.tmp' % (filename, os.getpid())
+        uml.Base.metadata.create_all(create_engine('sqlite:///%s' % tmpfilename))
+        self._copy_tables(tmpfilename, to_path=True)
+        os.rename(tmpfilename, filename)
+        logging.info('Model stored in cache %s.' % filename)
 
     def __contains__(self, xmi_id):
         """Return true if exists an UML Entity with this xmi_id.
@@ -367,8 +1237,7 @@ class Model:
         :param xmi_id: XMI Id to check existence.
         :type xmi_id: str
         """
-        r = list(self.session.query(uml.CEntity).filter(uml.CEntity.xmi_id == xmi_id))
-        return len(r) == 1
+        return self._lookup(xmi_id) is not None
 
     def __getitem__(self, xmi_id):
         """Return an UML Entity with xmi_id if exists. If not return xmi_id.
@@ -376,11 +1245,55 @@ class Model:
         :param xmi_id: XMI Id of the XML Entity.
         :type xmi_id: str
         """
-        r = list(self.session.query(uml.CEntity).filter(uml.CEntity.xmi_id == xmi_id))
-        if len(r) != 1:
+        r = self._lookup(xmi_id)
+        if r is None:
             raise KeyError
         else:
-            return r[0]
+            return r
+
+    def _register(self, obj, entity_id):
+        """Add a new entity to the session and to the identity map.
+
+        Ids are reserved by _create in the order of the XMI file, so entities
+        keep this order even if the session is not flushed after each creation
+        or the creation is postponed.
+
+        In bulk mode the entity is not added to the session until the end of
+        the load, where all of them are inserted in one flush. Entities in
+        memory are kept in a list.
+        """
+        obj.id = entity_id
+        if self.session is None:
+            self._objects.append(obj)
+        elif self.bulk:
+            self._pending.append(obj)
+        else:
+            self.session.add(obj)
+        if obj.xmi_id is not None:
+            self._entities[obj.xmi_id] = obj
+
+    def _lookup(self, xmi_id):
+        """Return the entity with xmi_id or None.
+
+        Lookups are solved by the identity map. The database is queried
+        only when the entity is not there, i.e. it was stored by other session.
+        If the database was empty all the entities are in the identity map, and
+        forward references are not searched in the database.
+        """
+        obj = self._entities.get(xmi_id)
+        if obj is not None:
+            self.identity_stats['hits'] += 1
+            return obj
+        self.identity_stats['misses'] += 1
+        if not self._stored:
+            return None
+        r = list(self.session.query(uml.CEntity).filter(uml.CEntity.xmi_id == xmi_id))
+        if len(r) > 1:
+            logging.warning('More than one entity with id: %s' % xmi_id)
+        if len(r) == 0:
+            return None
+        self._entities[xmi_id] = r[0]
+        return r[0]
 
     def _push_load_stack(self):
         self._load_stack.append((self._postprocessing_create,
@@ -399,6 +1312,8 @@ class Model:
             self._order += 1
         else:
             import pdb; pdb.set_trace()
+        self._last_id += 1
+        entity_id = self._last_id
         if package is None:
             logging.warning("Object without package associated")
         params = [ elem.attrib.get(k, None) for k in attribs ]
@@ -409,39 +1324,75 @@ class Model:
             params[i] = params[i] in ['true','1','TRUE']
         typemap = maskstr(mask, params)
         if any(typemap):
-            self._postprocessing_create.append((eclass, params, typemap, order, package))
+            self._postprocessing_create.append((eclass, params, typemap, order, package, entity_id))
             obj = params[0]
         else:
             obj = eclass(*params, order=order, package=package)
-            self.session.add(obj)
+            self._register(obj, entity_id)
         if obj is None:
             import pdb; pdb.set_trace()
         return obj
 
     def _do_postprocessing_create(self):
-        postprocessing_create = self._postprocessing_create
-        allobjs = set(params[0] for eclass, params, typemask, order, package in postprocessing_create) | \
-                set(self.iterclass(uml.CEntity)) 
-        needsolve = set()
-
-        while postprocessing_create and len(needsolve - allobjs) == 0:
-            eclass, params, typemask, order, package = postprocessing_create.pop(0)
+        """Create the entities postponed by references to entities not yet created.
 
-            typemask = [ type(v) is str and q for v,q in zip(params, typemask) ]
-            newparams = [ (q and self.get(p, NotResolved)) or p for p, q in zip(params, typemask) ]
-            needsolve |= set( v for i,v in zip(newparams, params) if i is NotResolved )
+        Pending entities are nodes of a dependency graph, where edges are the
+        references to other pending entities. They are created in topological
+        order, keeping the order of the file between independent entities.
+        Raise RuntimeError with the references to unknown entities or with the
+        cycles of references between pending entities.
+        """
+        records = self._postprocessing_create
+        self._postprocessing_create = []
 
-            if NotResolved in [ m and p for p,m in zip(newparams, typemask) ]:
-                postprocessing_create.append((eclass, params, typemask, order, package))
-            else:
-                if newparams[0] in needsolve:
-                    needsolve.remove(newparams[0])
-                newobj = eclass(*newparams, order=order, package=package)
-                self.session.add(newobj)
-
-        if len(needsolve - allobjs) != 0:
-            import pdb; pdb.set_trace()
-            raise RuntimeError('Postprocessing can\'t create: %s.' % ','.join(needsolve - allobjs))
+        pending = dict((params[0], i) for i, (eclass, params, typemask, order, package, entity_id) in enumerate(records))
+        depends = [ set() for r in records ]
+        dependents = [ [] for r in records ]
+        dangling = {}
+
+        for i, (eclass, params, typemask, order, package, entity_id) in enumerate(records):
+            for p, q in zip(params, typemask):
+                if not q or type(p) is not str:
+                    continue
+                if p in pending:
+                    if pending[p] not in depends[i]:
+                        depends[i].add(pending[p])
+                        dependents[pending[p]].append(i)
+                elif self._lookup(p) is None:
+                    dangling.setdefault(p, []).append(params[0])
+
+        if dangling:
+            raise RuntimeError('Postprocessing can\'t create: %s.' % '; '.join(
+                '%s referenced by %s' % (xmi_id, ','.join(dangling[xmi_id]))
+                for xmi_id in sorted(dangling)))
+
+        ready = [ i for i in range(len(records)) if not depends[i] ]
+        heapq.heapify(ready)
+        created = []
+        while ready:
+            i = heapq.heappop(ready)
+            eclass, params, typemask, order, package, entity_id = records[i]
+            newparams = [ self._lookup(p) if q and type(p) is str else p for p, q in zip(params, typemask) ]
+            newobj = eclass(*newparams, order=order, package=package)
+            self._register(newobj, entity_id)
+            created.append(i)
+            for j in dependents[i]:
+                depends[j].discard(i)
+                if not depends[j]:
+                    heapq.heappush(ready, j)
+
+        if len(created) < len(records):
+            cycles = []
+            visited = set(created)
+            for i in range(len(records)):
+                path = []
+                while i not in visited:
+                    visited.add(i)
+                    path.append(i)
+                    i = min(depends[i])
+                if i in path:
+                    cycles.append(' -> '.join(records[j][1][0] for j in path[path.index(i):] + [i]))
+            raise RuntimeError('Postprocessing can\'t create cyclic references: %s.' % '; '.join(cycles))
 
     def _append_obj(self, owner, member, obj):
         if type(owner) is str or type(obj) is str:
@@ -475,17 +1426,13 @@ class Model:
     def _get_xref(self, elem):
         url, xmi_id = elem.attrib['href'].split('#', 1)
         self.load(url)
-        r = list(self.session.query(uml.CEntity).filter(uml.CEntity.xmi_id == xmi_id))
-        if len(r) > 1:
-            logging.warning('More than one entity with id: %s' % xmi_id)
-        return xmi_id if len(r) == 0 else r[0]
+        r = self._lookup(xmi_id)
+        return xmi_id if r is None else r
 
     def _get_ref(self, elem):
         xmi_id = elem.attrib['xmi.idref']
-        r = list(self.session.query(uml.CEntity).filter(uml.CEntity.xmi_id == xmi_id))
-        if len(r) > 1:
-            logging.warning('More than one entity with id: %s' % xmi_id)
-        return xmi_id if len(r) == 0 else r[0]
+        r = self._lookup(xmi_id)
+        return xmi_id if r is None else r
 
     def get(self, xmi_id, default=None):
         """Return the UML Entity with xmi_id if exists else return default.
@@ -495,13 +1442,11 @@ class Model:
         :type xmi_id: str
         :type default: any
         """
-        r = list(self.session.query(uml.CEntity).filter(uml.CEntity.xmi_id == str(xmi_id)))
-        if len(r) == 0:
+        r = self._lookup(str(xmi_id))
+        if r is None:
             return default
-        elif len(r) == 1:
-            return r[0]
         else:
-            raise KeyError
+            return r
 
     """
     def tagsdict(self, umlclass):
@@ -516,29 +1461,200 @@ class Model:
         :param umlclass: Class over iterate.
         :param filter: Filter to select some of these entities.
         :type umlclass: Children of uml.CEntity or himself
-        :type filter: Filter Relations
+        :type filter: Function of the entity, or Filter Relations of the database
         """
-        q = self.session.query(umlclass)
-        if filter:
-            q = q.filter(filter)
-        for k in q:
+        for k in self.iterentities(umlclass, filter):
             yield k.xmi_id
 
+    def iterentities(self, umlclass=uml.CEntity, filter=None):
+        """Return a generator over the entities of a class, in the order of the files.
+
+        The class with the same name in the backend of the model is used, so
+        classes of uml select entities in memory too.
+
+        :param umlclass: Class over iterate.
+        :param filter: Filter to select some of these entities.
+        :type umlclass: Children of uml.CEntity or himself
+        :type filter: Function of the entity, or Filter Relations of the database
+        """
+        umlclass = getattr(self.uml, umlclass.__name__)
+        if self.session is None:
+            entities = ( obj for obj in self._objects if isinstance(obj, umlclass) )
+        else:
+            entities = self.session.query(umlclass)
+            if filter is not None and not callable(filter):
+                entities, filter = entities.filter(filter), None
+        if filter is not None:
+            if not callable(filter):
+                raise RuntimeError, 'Filter relations need a database. Use a function.'
+            entities = ( obj for obj in entities if filter(obj) )
+        return iter(entities)
+
+    def preload(self):
+        """Load all entities with their relationships in batched queries.
+
+        Entities are expired after the load, and each attribute or relationship
+        read by the builder issues its own query. Each class is loaded in one
+        query and each relationship in other one, for all the entities at once.
+
+        >>> model = Model("xmi2odoo/test/data/test_005.xmi", db=':memory:')
+        >>> model.preload()
+        >>> queries = model.queries
+        >>> for xmi_id, entity in model._entities.items():
+        ...     related = (entity.tag, entity.stereotypes, entity.package,
+        ...                getattr(entity, 'members', None), getattr(entity, 'associations', None))
+        >>> model.queries - queries
+        0
+        """
+        if self.session is None:
+            return
+        queries = self.queries
+        for mapper in uml.CEntity.__mapper__.self_and_descendants:
+            # Many to one relations are solved by the identity map. Relationships
+            # ordered by columns of the parent can't be loaded apart from it,
+            # they are left lazy.
+            options = [ selectinload(getattr(mapper.class_, r.key)) for r in mapper.relationships
+                        if r.parent is mapper and r.uselist and
+                           all(c.table in r.mapper.tables for c in r.order_by or []) ]
+            self.session.query(mapper.class_).options(*options).all()
+        logging.info('Preloaded model in %i queries.' % (self.queries - queries))
+
+    def _count_query(self, *args):
+        self.queries += 1
+
+    def _query_only(self, connection, record):
+        connection.execute('PRAGMA query_only = ON')
+
     def iterkeys(self):
         return self.iterclass(uml.CEntity)
 
     def __iter__(self):
         return self.iterkeys()
 
-    def load(self, infile):
+    def _parse_etree(self, ctx, infile):
+        # Processed elements are cleared and removed from its parent, so
+        # memory is bounded by the depth of the tree and not by its size.
+        xmlparser = ET.XMLParser()
+        events = ET.iterparse(infile, ('start', 'end'), xmlparser)
+        lines = collections.deque()
+        _track_lines(xmlparser.parser, lines)
+        parents = []
+        for event, elem in events:
+            ctx.lineno = lines.popleft()
+            if not self._handle(ctx, event, elem):
+                break # In ArgoUML prevents errors if you load .uml files.
+            if event == 'start':
+                parents.append(elem)
+            else:
+                parents.pop()
+                elem.clear()
+                if parents:
+                    parents[-1].remove(elem)
+
+    def _parse_expat(self, ctx, infile):
+        parser = _ExpatReader(self._handle, ctx).parser
+        try:
+            data = True
+            while data:
+                data = infile.read(CHUNK_SIZE)
+                parser.Parse(data, not data)
+        except _EndOfXMI:
+            pass # In ArgoUML prevents errors if you load .uml files.
+
+    def _handle(self, ctx, event, elem):
+        """Call the handler of the parser event.
+
+        Handlers are indexed by the kind of the element, the event and the tag.
+        Return False at the end of the XMI description.
+        """
+        if ctx.lineno in _lines_to_stop:
+            ctx.stop = True
+
+# Ignore tags outside XMI description.
+        tag = elem.tag
+        if tag == 'XMI':
+            ctx.in_xmi = event == 'start'
+            return ctx.in_xmi
+        if not ctx.in_xmi:
+            return True
+
+# Ignore elements out of the loaded packages.
+        if ctx.skip:
+            ctx.skip += 1 if event == 'start' else -1
+            return True
+
+# Setup comparison variables
+        attrib = elem.attrib
+        if 'xmi.id' in attrib:
+            kind = 'description'
+            if event == 'start' and attrib['xmi.id'] in ctx.skipped:
+                ctx.skip = 1
+                return True
+            if event == 'start':
+                logging.debug('Processing <%s xmi.id="%s" name="%s"/>', tag, attrib['xmi.id'], attrib.get('name'))
+                ctx.owner.append(attrib['xmi.id'])
+            else:
+                ctx.owner.remove(attrib['xmi.id'])
+        elif 'xmi.idref' in attrib:
+            kind = 'reference'
+        elif 'href' in attrib:
+            kind = 'externalref'
+        else:
+            kind = 'plain'
+        ctx.elem = elem
+
+        f = _handlers.get((kind, event, tag))
+        if ctx.stop:
+            import pdb; pdb.set_trace()
+        if f is None:
+            logging.debug('Ignoring %r', (kind, event, tag))
+        else:
+            f(self, ctx, elem)
+        return True
+
+    def load(self, infile, packages=None):
         """Load a XMI file.
         
         :param infile: Input to parse.
+        :param packages: Names of the packages to load. Other packages are
+            loaded only with the entities referenced from these ones.
         :type infile: str for filene, or stream to direct process
+        :type packages: list of str
+
+        Streams given by the caller are left open, also on errors.
+
+        >>> xmi = open('xmi2odoo/test/data/test_002.xmi')
+        >>> Model().load(xmi)
+        >>> xmi.closed
+        False
+        >>> xmi.close()
+        >>> import StringIO
+        >>> xmi = StringIO.StringIO('<XMI><XMI.content><UML:Model')
+        >>> try:
+        ...     Model().load(xmi)
+        ... except RuntimeError, e:
+        ...     print str(e).splitlines()[0]
+        Parsing error in line 1 of file <stream>.
+        >>> xmi.closed
+        False
+
+        Bulk loads turn off the autoflush of the session while loading.
+
+        >>> bulk = Model(db=':memory:', bulk=True)
+        >>> try:
+        ...     bulk.load(StringIO.StringIO('<XMI><XMI.content><UML:Model'))
+        ... except RuntimeError:
+        ...     pass
+        >>> bulk.session.autoflush, bulk._load_stack
+        (True, [])
         """
+        if packages is not None:
+            self.packages = packages
+        toplevel = not self._load_stack
 
 # -- Loading
         store_url = False
+        profile = None
         if type(infile) is file:
             store_url = infile.name
         if type(infile) is str and not '<xml' in infile:
@@ -546,10 +1662,43 @@ class Model:
                 return True
             store_url = infile
             if not os.path.exists(infile):
-                infile = self._c_load(infile)
-
-        owner = []
-        in_xmi = False
+                profile = self._c_path(infile)
+                if self.snapshots and self._load_snapshot(profile):
+                    if self.session is not None:
+                        self.session.commit()
+                    self.parsed_urls.append(store_url)
+                    return
+                infile = open(profile)
+
+        first_id, first_order, parsed_urls = self._last_id, self._order, len(self.parsed_urls)
+        # Streams given by the caller are left open.
+        opened = profile is not None or not hasattr(infile, 'read')
+
+        skipped = frozenset()
+        if self.packages and toplevel:
+            if hasattr(infile, 'read'):
+                try:
+                    start = infile.tell()
+                    infile.seek(start)
+                except (AttributeError, EnvironmentError):
+                    # Streams read once are copied to be read again to load them.
+                    logging.info('Copying the stream to a temporary file to scan its packages.')
+                    source, infile = infile, tempfile.TemporaryFile()
+                    shutil.copyfileobj(source, infile, CHUNK_SIZE)
+                    infile.seek(0)
+                    start, opened = 0, True
+            scanned = FileWrapper(infile)
+            try:
+                skipped = _PackageScanner().scan(scanned).skipped(self.packages)
+            finally:
+                # A stream given by the caller is read again to load it.
+                if scanned.source is infile:
+                    scanned.release()
+                else:
+                    scanned.close()
+            logging.info('Skipping %i elements out of packages %s.' % (len(skipped), ', '.join(self.packages)))
+            if hasattr(infile, 'read'):
+                infile.seek(start)
 
         infile = FileWrapper(infile, store_url)
 
@@ -560,521 +1709,482 @@ class Model:
 
         self._push_load_stack()
 
-        try:
-          cclass = None
-          stop = False
+        if self.session is not None:
+            autoflush = self.session.autoflush
+            if self.bulk:
+                self.session.autoflush = False
 
-          for event, elem in ET.iterparse(infile, events=('start', 'end')):
+        try:
+            ctx = _LoadContext()
+            ctx.skipped = skipped
+            try:
+                getattr(self, '_parse_%s' % self.parser)(ctx, infile)
+
+            except Exception, m:
+                import traceback
+                import StringIO
+                r =  "Parsing error in line %i of file %s.\n" % (ctx.lineno, getattr(infile.source, 'name', '<stream>'))
+                if ctx.elem is not None:
+                    r += "\t<Tag: %s, ID: %s> -\n" % (ctx.elem.tag, ctx.elem.attrib.get('xmi.id', ''))
+                r += "\tError: %s\n" % m
+                r += "\tLine: %s\n" % sys.exc_traceback.tb_lineno
+                try:
+                    r += "\tBreadcrumbs: %s\n" % ';'.join([ getattr(self.get(xmi_id, xmi_id),'name', xmi_id) for xmi_id in ctx.owner ])
+                except:
+                    r += "\tBreadcrumbs error."
+                    pass
+                sout = StringIO.StringIO()
+                traceback.print_exc(file=sout)
+                logging.error(sout.getvalue())
+                raise RuntimeError, r
+            finally:
+                if opened:
+                    infile.close()
+                else:
+                    infile.release()
 
-            if infile.lineno in _lines_to_stop:
-                stop = True
+# -- Postprocessing
+            self._do_postprocessing_create()
+            self._do_postprocessing_append()
+            self._do_postprocessing_set()
+
+            if self._pending:
+                logging.info('Bulk insert of %i entities.' % len(self._pending))
+                self.session.add_all(self._pending)
+                self._pending = []
+            if self.session is not None:
+                self.session.commit()
+            else:
+                self._objects.sort(key=operator.attrgetter('id'))
+        finally:
+            # Restored also when loading fails.
+            if self.session is not None:
+                self.session.autoflush = autoflush
+            self._pop_load_stack()
 
-# Ignore tags outside XMI description.
-            if not in_xmi and elem.tag == 'XMI' and event == 'start':
-                in_xmi = True
-            if in_xmi     and elem.tag == 'XMI' and event == 'end':
-                in_xmi = False
-                break # In ArgoUML prevents errors if you load .uml files.
-            if not in_xmi:
-                continue
+        logging.info('Identity map: %(hits)i hits, %(misses)i misses.' % self.identity_stats)
 
-# Setup comaparison variables
-            kind = ('xmi.id'    in elem.attrib and 'description') or \
-                   ('xmi.idref' in elem.attrib and 'reference') or \
-                   ('href'      in elem.attrib and 'externalref') or \
-                    'plain'
+        if profile and self.snapshots and len(self.parsed_urls) == parsed_urls:
+            self._save_snapshot(profile, first_id, first_order)
 
-            if event == 'start' and kind == 'description':
-                logging.debug('Processing <%s xmi.id="%s" name="%s"/>' % (elem.tag, elem.attrib['xmi.id'], elem.attrib.get('name')))
+        if store_url:
+            self.parsed_urls.append(store_url)
 
-            if event == 'start' and 'xmi.id' in elem.attrib:
-                owner.append(elem.attrib['xmi.id'])
+        logging.debug('Stop processing %s.' % getattr(infile, 'filename', infile))
 
-            if event == 'end' and 'xmi.id' in elem.attrib:
-                owner.remove(elem.attrib['xmi.id'])
+# -- Handlers of parser events
 
-# Model
-            if (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Model'):
-                if stop: import pdb; pdb.set_trace()
-                cmodel = self._create(uml.CModel, elem)
+    @handler('description', 'start', 'Model')
+    def _on_model(self, ctx, elem):
+        ctx.cmodel = self._create(self.uml.CModel, elem)
 
-# Package
-            if (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Package'):
-                if stop: import pdb; pdb.set_trace()
-                cpackage = self._create(uml.CPackage, elem, extra_params=[cmodel])
+    @handler('description', 'start', 'Package')
+    def _on_package(self, ctx, elem):
+        ctx.cpackage = self._create(self.uml.CPackage, elem, extra_params=[ctx.cmodel], package=ctx.cpackage)
 
-            if (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}Package'):
-                if stop: import pdb; pdb.set_trace()
-                cpackage = None
+    @handler('description', 'end', 'Package')
+    def _on_package_end(self, ctx, elem):
+        # Back to the package owning it, if it is nested.
+        ctx.cpackage = ctx.cpackage.package
 
 # UseCase
-            elif (kind, event, elem.tag) == ('reference', 'start', '{org.omg.xmi.namespace.UML}UseCase'):
-                if stop: import pdb; pdb.set_trace()
-                cusecase = self._get_ref(elem)
 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}UseCase'):
-                if stop: import pdb; pdb.set_trace()
-                cusecase = self._create(uml.CUseCase, elem)
-                self._append_obj(cpackage, 'entities', cusecase)
+    @handler('reference', 'start', 'UseCase')
+    def _on_usecase_ref(self, ctx, elem):
+        ctx.cusecase = self._get_ref(elem)
+
+    @handler('description', 'start', 'UseCase')
+    def _on_usecase(self, ctx, elem):
+        ctx.cusecase = self._create(self.uml.CUseCase, elem)
+        self._append_obj(ctx.cpackage, 'entities', ctx.cusecase)
 
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}UseCase'):
-                if stop: import pdb; pdb.set_trace()
-                cusecase = None
+    @handler('description', 'end', 'UseCase')
+    def _on_usecase_end(self, ctx, elem):
+        ctx.cusecase = None
 
 # Actor
-            elif (kind, event, elem.tag) == ('reference', 'start', '{org.omg.xmi.namespace.UML}Actor'):
-                if stop: import pdb; pdb.set_trace()
-                cactor = self._get_ref(elem)
 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Actor'):
-                if stop: import pdb; pdb.set_trace()
-                cactor = self._create(uml.CActor, elem)
-                self._append_obj(cpackage, 'entities', cactor)
+    @handler('reference', 'start', 'Actor')
+    def _on_actor_ref(self, ctx, elem):
+        ctx.cactor = self._get_ref(elem)
+
+    @handler('description', 'start', 'Actor')
+    def _on_actor(self, ctx, elem):
+        ctx.cactor = self._create(self.uml.CActor, elem)
+        self._append_obj(ctx.cpackage, 'entities', ctx.cactor)
 
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}Actor'):
-                if stop: import pdb; pdb.set_trace()
-                cactor = None
+    @handler('description', 'end', 'Actor')
+    def _on_actor_end(self, ctx, elem):
+        ctx.cactor = None
 
 # Class
-            elif (kind, event, elem.tag) == ('reference', 'start', '{org.omg.xmi.namespace.UML}Class'):
-                if stop: import pdb; pdb.set_trace()
-                cdatatype = self._get_ref(elem)
-
-            elif (kind, event, elem.tag) == ('externalref', 'start', '{org.omg.xmi.namespace.UML}Class'):
-                if stop: import pdb; pdb.set_trace()
-                cdatatype = self._get_xref(elem)
-
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Class'):
-                if stop: import pdb; pdb.set_trace()
-                if cclass is not None:
-                    r = 'Class %s is inside the class %s.' % (elem.attrib['name'], cclass)
-                    raise RuntimeError, r
-                cclass = self._create(uml.CClass, elem)
-                self._append_obj(cpackage, 'entities', cclass)
-
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}Class'):
-                if stop: import pdb; pdb.set_trace()
-                cdatatype = cclass
-                cclass = None
 
-# DataType
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}DataType'):
-                if stop: import pdb; pdb.set_trace()
-                cdatatype = self._create(uml.CDataType, elem)
+    @handler('reference', 'start', 'Class', 'DataType', 'Enumeration')
+    def _on_datatype_ref(self, ctx, elem):
+        ctx.cdatatype = self._get_ref(elem)
 
-            elif (kind, event, elem.tag) == ('externalref', 'start', '{org.omg.xmi.namespace.UML}DataType'):
-                if stop: import pdb; pdb.set_trace()
-                cdatatype = self._get_xref(elem)
+    @handler('externalref', 'start', 'Class', 'DataType', 'Enumeration')
+    def _on_datatype_xref(self, ctx, elem):
+        ctx.cdatatype = self._get_xref(elem)
 
-            elif (kind, event, elem.tag) == ('reference', 'start', '{org.omg.xmi.namespace.UML}DataType'):
-                if stop: import pdb; pdb.set_trace()
-                cdatatype = self._get_ref(elem)
+    @handler('description', 'start', 'Class')
+    def _on_class(self, ctx, elem):
+        if ctx.cclass is not None:
+            r = 'Class %s is inside the class %s.' % (elem.attrib['name'], ctx.cclass)
+            raise RuntimeError, r
+        ctx.cclass = self._create(self.uml.CClass, elem)
+        self._append_obj(ctx.cpackage, 'entities', ctx.cclass)
 
-# Members: Enumeration
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Enumeration'):
-                if stop: import pdb; pdb.set_trace()
-                enumerationliterals = []
+    @handler('description', 'end', 'Class')
+    def _on_class_end(self, ctx, elem):
+        ctx.cdatatype = ctx.cclass
+        ctx.cclass = None
 
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}EnumerationLiteral'):
-                if stop: import pdb; pdb.set_trace()
-                enumerationliterals.append(self._create(uml.CEnumerationLiteral, elem))
+# DataType
+
+    @handler('description', 'start', 'DataType')
+    def _on_datatype(self, ctx, elem):
+        ctx.cdatatype = self._create(self.uml.CDataType, elem)
+
+# Members: Enumeration
 
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}Enumeration'):
-                if stop: import pdb; pdb.set_trace()
-                cdatatype = self._create(uml.CEnumeration, elem, mask=(False, False, False),
-                                         attribs=['xmi.id','name'], extra_params=[enumerationliterals])
+    @handler('description', 'start', 'Enumeration')
+    def _on_enumeration(self, ctx, elem):
+        ctx.enumerationliterals = []
 
-            elif (kind, event, elem.tag) == ('reference', 'start', '{org.omg.xmi.namespace.UML}Enumeration'):
-                if stop: import pdb; pdb.set_trace()
-                cdatatype = self._get_ref(elem)
+    @handler('description', 'end', 'EnumerationLiteral')
+    def _on_enumerationliteral_end(self, ctx, elem):
+        ctx.enumerationliterals.append(self._create(self.uml.CEnumerationLiteral, elem))
 
-            elif (kind, event, elem.tag) == ('externalref', 'start', '{org.omg.xmi.namespace.UML}Enumeration'):
-                if stop: import pdb; pdb.set_trace()
-                cdatatype = self._get_xref(elem)
+    @handler('description', 'end', 'Enumeration')
+    def _on_enumeration_end(self, ctx, elem):
+        ctx.cdatatype = self._create(self.uml.CEnumeration, elem, mask=(False, False, False),
+                                     attribs=['xmi.id','name'], extra_params=[ctx.enumerationliterals])
 
 # Members: Attribute
 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Attribute'):
-                if stop: import pdb; pdb.set_trace()
-                cdatatype = None
+    @handler('description', 'start', 'Attribute')
+    def _on_attribute(self, ctx, elem):
+        ctx.cdatatype = None
 
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}Attribute'):
-                if stop: import pdb; pdb.set_trace()
-                if cclass is None or cdatatype is None:
-                    raise RuntimeError, "The attribute %s.%s has not type." % (cclass if type(cclass) is str else cclass.name, elem.attrib['name']) 
-                cattribute = self._create(uml.CAttribute, elem, mask=(False, False, True, True), extra_params=[cdatatype, cclass])
-                self._append_obj(cpackage, 'entities', cattribute)
+    @handler('description', 'end', 'Attribute')
+    def _on_attribute_end(self, ctx, elem):
+        cclass, cdatatype = ctx.cclass, ctx.cdatatype
+        if cclass is None or cdatatype is None:
+            raise RuntimeError, "The attribute %s.%s has not type." % (cclass if type(cclass) is str else cclass.name, elem.attrib['name'])
+        cattribute = self._create(self.uml.CAttribute, elem, mask=(False, False, True, True), extra_params=[cdatatype, cclass])
+        self._append_obj(ctx.cpackage, 'entities', cattribute)
 
 # Members: Operation
 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Operation'):
-                if stop: import pdb; pdb.set_trace()
-                coperation = self._create(uml.COperation, elem)
-                self._append_obj(cclass, 'members', coperation)
+    @handler('description', 'start', 'Operation')
+    def _on_operation(self, ctx, elem):
+        ctx.coperation = self._create(self.uml.COperation, elem)
+        self._append_obj(ctx.cclass, 'members', ctx.coperation)
 
 # Parameters
 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Parameter'):
-                if stop: import pdb; pdb.set_trace()
-                if 'coperation' in locals():
-                    cparameter = self._create(uml.CParameter, elem,
-                                              mask=(False, False, False, False, True),
-                                              attribs=['xmi.id', 'name'],
-                                              extra_params=[None, None, coperation])
-                else:
-                    """
-                    Could be a TemplateParameter
-                    """
-                    pass
+    @handler('description', 'start', 'Parameter')
+    def _on_parameter(self, ctx, elem):
+        if hasattr(ctx, 'coperation'):
+            self._create(self.uml.CParameter, elem,
+                         mask=(False, False, False, False, True),
+                         attribs=['xmi.id', 'name'],
+                         extra_params=[None, None, ctx.coperation])
+        else:
+            """
+            Could be a TemplateParameter
+            """
+            pass
 
 # Tags
 
-            elif (kind, event, elem.tag) == ('plain', 'start', '{org.omg.xmi.namespace.UML}TaggedValue.dataValue'):
-                if stop: import pdb; pdb.set_trace()
-                tagvalue = elem.text or ''
+    @handler('plain', 'start', 'TaggedValue.dataValue')
+    def _on_datavalue(self, ctx, elem):
+        ctx.tagvalue = elem.text or ''
 
-            elif (kind, event, elem.tag) == ('plain', 'end', '{org.omg.xmi.namespace.UML}TaggedValue.dataValue'):
-                if stop: import pdb; pdb.set_trace()
-                tagvalue = max('tagvalue' in locals() and tagvalue, elem.text or '')
+    @handler('plain', 'end', 'TaggedValue.dataValue')
+    def _on_datavalue_end(self, ctx, elem):
+        ctx.tagvalue = max(getattr(ctx, 'tagvalue', False), elem.text or '')
 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}TagDefinition'):
-                if stop: import pdb; pdb.set_trace()
-                ctagdefinition = self._create(uml.CTagDefinition, elem)
+    @handler('description', 'start', 'TagDefinition')
+    def _on_tagdefinition(self, ctx, elem):
+        self._create(self.uml.CTagDefinition, elem)
 
-            elif (kind, event, elem.tag) == ('reference', 'start', '{org.omg.xmi.namespace.UML}TagDefinition'):
-                if stop: import pdb; pdb.set_trace()
-                tagdefinition = self._get_ref(elem)
+    @handler('reference', 'start', 'TagDefinition')
+    def _on_tagdefinition_ref(self, ctx, elem):
+        ctx.tagdefinition = self._get_ref(elem)
 
-            elif (kind, event, elem.tag) == ('externalref', 'start', '{org.omg.xmi.namespace.UML}TagDefinition'):
-                if stop: import pdb; pdb.set_trace()
-                tagdefinition = self._get_xref(elem)
+    @handler('externalref', 'start', 'TagDefinition')
+    def _on_tagdefinition_xref(self, ctx, elem):
+        ctx.tagdefinition = self._get_xref(elem)
 
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}TaggedValue'):
-                if stop: import pdb; pdb.set_trace()
-                tagvalue = max('tagvalue' in locals() and tagvalue, elem.text or '')
-                if len(owner) > 1:
-                    ctaggedvalue = self._create(uml.CTaggedValue, elem,
-                                                mask=(False, True, False, True), attribs=['xmi.id'],
-                                                extra_params=[tagdefinition, tagvalue.strip() , owner[-1]])
-                del tagvalue
+    @handler('description', 'end', 'TaggedValue')
+    def _on_taggedvalue_end(self, ctx, elem):
+        tagvalue = max(getattr(ctx, 'tagvalue', False), elem.text or '')
+        if len(ctx.owner) > 1:
+            self._create(self.uml.CTaggedValue, elem,
+                         mask=(False, True, False, True), attribs=['xmi.id'],
+                         extra_params=[ctx.tagdefinition, tagvalue.strip(), ctx.owner[-1]])
+        if hasattr(ctx, 'tagvalue'):
+            del ctx.tagvalue
 
 # Associations
 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}AssociationEnd'):
-                if stop: import pdb; pdb.set_trace()
-                multiplicityrange = None
-                cdatatype = None
-                cusecase = None
-                cactor = None
-
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}MultiplicityRange'):
-                if stop: import pdb; pdb.set_trace()
-                multiplicityrange = (int(elem.attrib['lower']), int(elem.attrib['upper']))
-
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}AssociationEnd'):
-                if stop: import pdb; pdb.set_trace()
-                cassociationend = self._create(uml.CAssociationEnd, elem,
-                                               mask=(False, False, False, False, True, False, True),
-                                               attribs=['xmi.id', 'name', 'isNavigable', 'aggregation' ],
-                                               booleans=[2],
-                                               extra_params=[cdatatype or cusecase or cactor,
-                                                             repr(multiplicityrange),
-                                                             cassociation])
-                multiplicityrange = None
-
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Association'):
-                if stop: import pdb; pdb.set_trace()
-                cassociation = self._create(uml.CAssociation, elem)
-                cdatatype = None
-                cusecase = None
-                cactor = None
-                cassociationend = None
-
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}Association'):
-                pass
+    @handler('description', 'start', 'AssociationEnd')
+    def _on_associationend(self, ctx, elem):
+        ctx.multiplicityrange = None
+        ctx.cdatatype = None
+        ctx.cusecase = None
+        ctx.cactor = None
+
+    @handler('description', 'end', 'MultiplicityRange')
+    def _on_multiplicityrange_end(self, ctx, elem):
+        ctx.multiplicityrange = (int(elem.attrib['lower']), int(elem.attrib['upper']))
+
+    @handler('description', 'end', 'AssociationEnd')
+    def _on_associationend_end(self, ctx, elem):
+        self._create(self.uml.CAssociationEnd, elem,
+                     mask=(False, False, False, False, True, False, True),
+                     attribs=['xmi.id', 'name', 'isNavigable', 'aggregation' ],
+                     booleans=[2],
+                     extra_params=[ctx.cdatatype or ctx.cusecase or ctx.cactor,
+                                   ctx.multiplicityrange,
+                                   ctx.cassociation])
+        ctx.multiplicityrange = None
+
+    @handler('description', 'start', 'Association')
+    def _on_association(self, ctx, elem):
+        ctx.cassociation = self._create(self.uml.CAssociation, elem)
+        ctx.cdatatype = None
+        ctx.cusecase = None
+        ctx.cactor = None
 
 # Generalization
 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Generalization'):
-                if stop: import pdb; pdb.set_trace()
-                child = None
-                parent = None
-                cdatatype = None
-                cactor = None
-
-            elif (kind, event, elem.tag) == ('plain', 'end', '{org.omg.xmi.namespace.UML}Generalization.child'):
-                if stop: import pdb; pdb.set_trace()
-                child = cdatatype or cactor
-
-            elif (kind, event, elem.tag) == ('plain', 'end', '{org.omg.xmi.namespace.UML}Generalization.parent'):
-                if stop: import pdb; pdb.set_trace()
-                parent = cdatatype or cactor
-
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}Generalization'):
-                if stop: import pdb; pdb.set_trace()
-                logging.debug("GEN %s %s" % ( parent, child ))
-                cgeneralization = self._create(uml.CGeneralization, elem,
-                                               mask=(False, True, True),
-                                               attribs=['xmi.id'],
-                                               extra_params=[parent, child])
-                child = None
-                parent = None
-                cdatatype = None
-                cactor = None
+    @handler('description', 'start', 'Generalization')
+    def _on_generalization(self, ctx, elem):
+        ctx.child = None
+        ctx.parent = None
+        ctx.cdatatype = None
+        ctx.cactor = None
+
+    @handler('plain', 'end', 'Generalization.child')
+    def _on_generalization_child_end(self, ctx, elem):
+        ctx.child = ctx.cdatatype or ctx.cactor
+
+    @handler('plain', 'end', 'Generalization.parent')
+    def _on_generalization_parent_end(self, ctx, elem):
+        ctx.parent = ctx.cdatatype or ctx.cactor
+
+    @handler('description', 'end', 'Generalization')
+    def _on_generalization_end(self, ctx, elem):
+        logging.debug("GEN %s %s" % ( ctx.parent, ctx.child ))
+        self._create(self.uml.CGeneralization, elem,
+                     mask=(False, True, True),
+                     attribs=['xmi.id'],
+                     extra_params=[ctx.parent, ctx.child])
+        ctx.child = None
+        ctx.parent = None
+        ctx.cdatatype = None
+        ctx.cactor = None
 
 # Stereotypes
 
-            elif (kind, event, elem.tag) == ('reference', 'start', '{org.omg.xmi.namespace.UML}Stereotype'):
-                if stop: import pdb; pdb.set_trace()
-                if len(owner) > 0:
-                    self._append_obj(owner[-1], 'stereotypes', self._get_ref(elem))
-
-            elif (kind, event, elem.tag) == ('externalref', 'start', '{org.omg.xmi.namespace.UML}Stereotype'):
-                if stop: import pdb; pdb.set_trace()
-                if len(owner) > 0:
-                    self._append_obj(owner[-1], 'stereotypes', self._get_xref(elem))
-
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Stereotype'):
-                if stop: import pdb; pdb.set_trace()
-                stereotype = self._create(uml.CStereotype, elem)
-
-# State machine 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}StateMachine'):
-                if stop: import pdb; pdb.set_trace()
-                ccompositestates = []
-                cstatemachine = elem
-                cdatatype = None
-
-            elif (kind, event, elem.tag) == ('plain', 'end', '{org.omg.xmi.namespace.UML}StateMachine.context'):
-                if stop: import pdb; pdb.set_trace()
-                if cdatatype is None:
-                    logger.warning('StateMachine <%s> has not any context defined. Will not processed.' % elem.attrib['xmi.id'])
-                    cstatemachine = None
-                else:
-                    cstatemachine = self._create(uml.CStateMachine, cstatemachine,
-                                                 mask=(False, False, True),
-                                                 attribs=['xmi.id', 'name'],
-                                                 extra_params=[cdatatype])
-
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}CompositeState'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    cstate = self._create(uml.CCompositeState, elem, 
-                                          mask=(False, False, True, True),
-                                          attribs=['xmi.id', 'name'],
-                                          extra_params=[cstatemachine,
-                                          ccompositestates[-1] if len(ccompositestates)>0 else None] )
-                    ccompositestates.append(cstate)
-                else:
-                    logging.warning('CompositeState %s without statemachine' % elem.attrib['xmi.id'])
-
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}CompositeState'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    ccompositestates.pop()
-                    cstate = ccompositestates[-1] if len(ccompositestates) > 0 else None
-
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}SimpleState'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    cstate = self._create(uml.CSimpleState, elem,
-                                          mask=(False, False, True, True),
-                                          attribs=['xmi.id', 'name'],
-                                          extra_params=[cstatemachine,
-                                          ccompositestates[-1] if len(ccompositestates)>0 else None] )
-                else:
-                    logging.warning('SimpleState %s without statemachine' % elem.attrib['xmi.id'])
-
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}Pseudostate'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    cstate = self._create(uml.CPseudostate, elem,
-                                          mask=(False, False, False, True, True),
-                                          attribs=['xmi.id', 'name', 'kind'],
-                                          extra_params=[cstatemachine,
-                                          ccompositestates[-1] if len(ccompositestates)>0 else None] )
-                else:
-                    logging.warning('Pseudostate %s without statemachine' % elem.attrib['xmi.id'])
-
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}FinalState'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    cstate = self._create(uml.CFinalState, elem,
-                                          mask=(False, False, True, True),
-                                          attribs=['xmi.id', 'name'],
-                                          extra_params=[cstatemachine,
-                                          ccompositestates[-1] if len(ccompositestates)>0 else None] )
-                else:
-                    logging.warning('FinalState %s without statemachine' % elem.attrib['xmi.id'])
-
-            elif (kind, event, elem.tag) in [
-                    ('reference', 'start', '{org.omg.xmi.namespace.UML}CompositeState'), 
-                    ('reference', 'start', '{org.omg.xmi.namespace.UML}SimpleState'), 
-                    ('reference', 'start', '{org.omg.xmi.namespace.UML}Pseudostate'), 
-                    ('reference', 'start', '{org.omg.xmi.namespace.UML}FinalState')
-            ]:
-                if cstatemachine != None:
-                    cstate = self._get_ref(elem)
-
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Transition'):
-                if stop: import pdb; pdb.set_trace()
-                source = None
-                target = None
-                guard = None
-                effect = None
-                trigger = None
-
-            elif (kind, event, elem.tag) == ('plain', 'end', '{org.omg.xmi.namespace.UML}Transition.source'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    source = cstate
-
-            elif (kind, event, elem.tag) == ('plain', 'end', '{org.omg.xmi.namespace.UML}Transition.target'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    target = cstate
-
-            elif (kind, event, elem.tag) == ('plain', 'end', '{org.omg.xmi.namespace.UML}Transition.guard'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    guard = cexpression
-
-            elif (kind, event, elem.tag) == ('plain', 'end', '{org.omg.xmi.namespace.UML}Transition.effect'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    effect = caction
-
-            elif (kind, event, elem.tag) == ('plain', 'end', '{org.omg.xmi.namespace.UML}Transition.trigger'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    trigger = cevent
-
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}Transition'):
-                ctransition = self._get_ref(elem)
-
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}Transition'):
-                if stop: import pdb; pdb.set_trace()
-                if cstatemachine != None:
-                    ctransition = self._create(uml.CTransition, elem,
-                                               mask=(False, False, True, True, True, True, True, True),
-                                               extra_params=[cstatemachine,
-                                                             source,
-                                                             target,
-                                                             guard,
-                                                             effect,
-                                                             trigger])
-
-# Effect 
+    @handler('reference', 'start', 'Stereotype')
+    def _on_stereotype_ref(self, ctx, elem):
+        if len(ctx.owner) > 0:
+            self._append_obj(ctx.owner[-1], 'stereotypes', self._get_ref(elem))
+
+    @handler('externalref', 'start', 'Stereotype')
+    def _on_stereotype_xref(self, ctx, elem):
+        if len(ctx.owner) > 0:
+            self._append_obj(ctx.owner[-1], 'stereotypes', self._get_xref(elem))
+
+    @handler('description', 'start', 'Stereotype')
+    def _on_stereotype(self, ctx, elem):
+        self._create(self.uml.CStereotype, elem)
+
+# State machine
+
+    @handler('description', 'start', 'StateMachine')
+    def _on_statemachine(self, ctx, elem):
+        ctx.ccompositestates = []
+        ctx.cstatemachine = elem
+        ctx.cdatatype = None
+
+    @handler('plain', 'end', 'StateMachine.context')
+    def _on_statemachine_context_end(self, ctx, elem):
+        if ctx.cdatatype is None:
+            logging.warning('StateMachine <%s> has not any context defined. Will not processed.' % ctx.cstatemachine.attrib['xmi.id'])
+            ctx.cstatemachine = None
+        else:
+            ctx.cstatemachine = self._create(self.uml.CStateMachine, ctx.cstatemachine,
+                                             mask=(False, False, True),
+                                             attribs=['xmi.id', 'name'],
+                                             extra_params=[ctx.cdatatype])
+
+    @handler('description', 'start', 'CompositeState')
+    def _on_compositestate(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.cstate = self._create(self.uml.CCompositeState, elem,
+                                      mask=(False, False, True, True),
+                                      attribs=['xmi.id', 'name'],
+                                      extra_params=[ctx.cstatemachine,
+                                      ctx.ccompositestates[-1] if len(ctx.ccompositestates)>0 else None] )
+            ctx.ccompositestates.append(ctx.cstate)
+        else:
+            logging.warning('CompositeState %s without statemachine' % elem.attrib['xmi.id'])
+
+    @handler('description', 'end', 'CompositeState')
+    def _on_compositestate_end(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.ccompositestates.pop()
+            ctx.cstate = ctx.ccompositestates[-1] if len(ctx.ccompositestates) > 0 else None
+
+    @handler('description', 'end', 'SimpleState')
+    def _on_simplestate_end(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.cstate = self._create(self.uml.CSimpleState, elem,
+                                      mask=(False, False, True, True),
+                                      attribs=['xmi.id', 'name'],
+                                      extra_params=[ctx.cstatemachine,
+                                      ctx.ccompositestates[-1] if len(ctx.ccompositestates)>0 else None] )
+        else:
+            logging.warning('SimpleState %s without statemachine' % elem.attrib['xmi.id'])
+
+    @handler('description', 'end', 'Pseudostate')
+    def _on_pseudostate_end(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.cstate = self._create(self.uml.CPseudostate, elem,
+                                      mask=(False, False, False, True, True),
+                                      attribs=['xmi.id', 'name', 'kind'],
+                                      extra_params=[ctx.cstatemachine,
+                                      ctx.ccompositestates[-1] if len(ctx.ccompositestates)>0 else None] )
+        else:
+            logging.warning('Pseudostate %s without statemachine' % elem.attrib['xmi.id'])
+
+    @handler('description', 'end', 'FinalState')
+    def _on_finalstate_end(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.cstate = self._create(self.uml.CFinalState, elem,
+                                      mask=(False, False, True, True),
+                                      attribs=['xmi.id', 'name'],
+                                      extra_params=[ctx.cstatemachine,
+                                      ctx.ccompositestates[-1] if len(ctx.ccompositestates)>0 else None] )
+        else:
+            logging.warning('FinalState %s without statemachine' % elem.attrib['xmi.id'])
+
+    @handler('reference', 'start', 'CompositeState', 'SimpleState', 'Pseudostate', 'FinalState')
+    def _on_state_ref(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.cstate = self._get_ref(elem)
+
+    @handler('description', 'start', 'Transition')
+    def _on_transition(self, ctx, elem):
+        ctx.source = None
+        ctx.target = None
+        ctx.guard = None
+        ctx.effect = None
+        ctx.trigger = None
+
+    @handler('plain', 'end', 'Transition.source')
+    def _on_transition_source_end(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.source = ctx.cstate
+
+    @handler('plain', 'end', 'Transition.target')
+    def _on_transition_target_end(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.target = ctx.cstate
+
+    @handler('plain', 'end', 'Transition.guard')
+    def _on_transition_guard_end(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.guard = ctx.cexpression
+
+    @handler('plain', 'end', 'Transition.effect')
+    def _on_transition_effect_end(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.effect = ctx.caction
+
+    @handler('plain', 'end', 'Transition.trigger')
+    def _on_transition_trigger_end(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            ctx.trigger = ctx.cevent
+
+    @handler('description', 'end', 'Transition')
+    def _on_transition_end(self, ctx, elem):
+        if ctx.cstatemachine != None:
+            self._create(self.uml.CTransition, elem,
+                         mask=(False, False, True, True, True, True, True, True),
+                         extra_params=[ctx.cstatemachine,
+                                       ctx.source,
+                                       ctx.target,
+                                       ctx.guard,
+                                       ctx.effect,
+                                       ctx.trigger])
+
+# Effect
 
 #   Call Action
 
-            elif (kind, event, elem.tag) == ('reference', 'start', '{org.omg.xmi.namespace.UML}CallAction'):
-                if stop: import pdb; pdb.set_trace()
-                caction = self._get_ref(elem)
+    @handler('reference', 'start', 'CallAction')
+    def _on_callaction_ref(self, ctx, elem):
+        ctx.caction = self._get_ref(elem)
 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}CallAction'):
-                if stop: import pdb; pdb.set_trace()
-                coperation = None
+    @handler('description', 'start', 'CallAction', 'CallEvent')
+    def _on_call(self, ctx, elem):
+        ctx.coperation = None
 
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}CallAction'):
-                if stop: import pdb; pdb.set_trace()
-                caction = self._create(uml.CCallAction, elem,
-                                          mask=(False, False, True),
-                                          attribs=['xmi.id', 'name'],
-                                          extra_params=[coperation])
+    @handler('description', 'end', 'CallAction')
+    def _on_callaction_end(self, ctx, elem):
+        ctx.caction = self._create(self.uml.CCallAction, elem,
+                                   mask=(False, False, True),
+                                   attribs=['xmi.id', 'name'],
+                                   extra_params=[ctx.coperation])
 
-
-# Events 
+# Events
 
 #   Call
 
-            elif (kind, event, elem.tag) == ('reference', 'start', '{org.omg.xmi.namespace.UML}CallEvent'):
-                if stop: import pdb; pdb.set_trace()
-                cevent = elem.attrib['xmi.idref']
-
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}CallEvent'):
-                if stop: import pdb; pdb.set_trace()
-                coperation = None
+    @handler('reference', 'start', 'CallEvent', 'SignalEvent')
+    def _on_event_ref(self, ctx, elem):
+        ctx.cevent = elem.attrib['xmi.idref']
 
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}CallEvent'):
-                if stop: import pdb; pdb.set_trace()
-                cevent = self._create(uml.CCallEvent, elem,
-                                          mask=(False, False, True),
-                                          attribs=['xmi.id', 'name'],
-                                          extra_params=[coperation])
+    @handler('description', 'end', 'CallEvent')
+    def _on_callevent_end(self, ctx, elem):
+        ctx.cevent = self._create(self.uml.CCallEvent, elem,
+                                  mask=(False, False, True),
+                                  attribs=['xmi.id', 'name'],
+                                  extra_params=[ctx.coperation])
 
 #   Signal
-            elif (kind, event, elem.tag) == ('reference', 'start', '{org.omg.xmi.namespace.UML}SignalEvent'):
-                if stop: import pdb; pdb.set_trace()
-                cevent = elem.attrib['xmi.idref']
 
-            elif (kind, event, elem.tag) == ('description', 'start', '{org.omg.xmi.namespace.UML}SignalEvent'):
-                if stop: import pdb; pdb.set_trace()
-                csignal = None
+    @handler('description', 'start', 'SignalEvent')
+    def _on_signalevent(self, ctx, elem):
+        ctx.csignal = None
 
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}SignalEvent'):
-                if stop: import pdb; pdb.set_trace()
-                cevent = self._create(uml.CCallEvent, elem,
-                                          mask=(False, False, True),
-                                          attribs=['xmi.id', 'name'],
-                                          extra_params=[csignal])
+    @handler('description', 'end', 'SignalEvent')
+    def _on_signalevent_end(self, ctx, elem):
+        ctx.cevent = self._create(self.uml.CCallEvent, elem,
+                                  mask=(False, False, True),
+                                  attribs=['xmi.id', 'name'],
+                                  extra_params=[ctx.csignal])
 
 # Expression
 
 #   Boolean
 
-            elif (kind, event, elem.tag) == ('description', 'end', '{org.omg.xmi.namespace.UML}BooleanExpression'):
-                if stop: import pdb; pdb.set_trace()
-                cexpression = self._create(uml.CBooleanExpression, elem,
-                                           mask=(False, False, False, False),
-                                           attribs=['xmi.id', 'name', 'language', 'body'])
-
-# Unknown tags 
-
-            else:
-                if not kind:
-                    logging.debug('Ignoring %s' % repr((elem.attrib.keys(), event, elem.tag)))
-                else:
-                    logging.debug('Ignoring %s' % repr((kind, event, elem.tag)))
-                if stop:
-                    import pdb; pdb.set_trace()
-                    pass
-
-        except Exception, m:
-            import traceback
-            import StringIO
-            r =  "Parsing error in line %i of file %s.\n" % (infile.lineno, infile.source.name)
-            if 'elem' in globals():
-                r += "\t<Tag: %s, ID: %s> -\n" % (elem.tag, kind == 'description' and elem.attrib['xmi.id'] or '')
-            r += "\tError: %s\n" % m
-            r += "\tLine: %s\n" % sys.exc_traceback.tb_lineno
-            try:
-                r += "\tBreadcrumbs: %s\n" % ';'.join([ getattr(self.get(xmi_id, xmi_id),'name', xmi_id) for xmi_id in owner ])
-            except:
-                r += "\tBreadcrumbs error."
-                pass
-            sout = StringIO.StringIO()
-            traceback.print_exc(file=sout)
-            logging.error(sout.getvalue())
-            raise RuntimeError, r
-
-# -- Postprocessing
-        self._do_postprocessing_create()
-        self._do_postprocessing_append()
-        self._do_postprocessing_set()
-
-        self.session.commit()
-
-        self._pop_load_stack()
-
-        if store_url:
-            self.parsed_urls.append(store_url)
-
-        logging.debug('Stop processing %s.' % getattr(infile, 'filename', infile))
+    @handler('description', 'end', 'BooleanExpression')
+    def _on_booleanexpression_end(self, ctx, elem):
+        ctx.cexpression = self._create(self.uml.CBooleanExpression, elem,
+                                       mask=(False, False, False, False),
+                                       attribs=['xmi.id', 'name', 'language', 'body'])
 
     def __repr__(self):
         s = []
-        for p in self.session.query(uml.CPackage):
+        for p in self.iterentities(uml.CPackage):
             s.append(repr(p))
             for c in p.entities:
                 s.append('  %s' % (repr(c),))
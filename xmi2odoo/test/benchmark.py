@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+##############################################################################
+#
+#    XMI2ODOO, XMI convesort to Odoo module
+#    Copyright (C) 2012 Coop Trab Moldeo Interactive, Grupo AdHoc S.A.
+#    (<http://www.moldeointeractive.com.ar>; <www.grupoadhoc.com.ar>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+"""Loading benchmarks.
+
+Run it from the root of the project:
+
+    python -m xmi2odoo.test.benchmark [classes] [attributes]
+
+Each configuration loads test_003.xmi and a synthetic model with the given
+number of classes and attributes per class. Then the synthetic model is stored
+in a database file, and each relationship is loaded for all the entities with
+and without the indexes of the schema.
+"""
+
+import sys, os
+import time
+import tempfile
+import shutil
+import logging
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from xmi2odoo.model import Model
+from xmi2odoo import uml
+
+_header = """<?xml version = '1.0' encoding = 'UTF-8' ?>
+<XMI xmi.version = '1.2' xmlns:UML = 'org.omg.xmi.namespace.UML'>
+  <XMI.header>
+    <XMI.metamodel xmi.name="UML" xmi.version="1.4"/>
+  </XMI.header>
+  <XMI.content>
+    <UML:Model xmi.id = 'synthetic:model' name = 'synthetic'>
+      <UML:Namespace.ownedElement>
+        <UML:Package xmi.id = 'synthetic:package' name = 'synthetic'>
+          <UML:Namespace.ownedElement>
+"""
+
+_footer = """          </UML:Namespace.ownedElement>
+        </UML:Package>
+      </UML:Namespace.ownedElement>
+    </UML:Model>
+  </XMI.content>
+</XMI>
+"""
+
+_class = """            <UML:Class xmi.id = 'synthetic:class:%(i)i' name = 'class%(i)i'>
+%(generalization)s%(comments)s              <UML:Classifier.feature>
+%(attributes)s              </UML:Classifier.feature>
+            </UML:Class>
+"""
+
+_class_generalization = """              <UML:GeneralizableElement.generalization>
+                <UML:Generalization xmi.idref = 'synthetic:generalization:%(i)i'/>
+              </UML:GeneralizableElement.generalization>
+"""
+
+_comment = """              <UML:ModelElement.comment>
+                <UML:Comment xmi.id = 'synthetic:comment:%(i)i:%(j)i' name = '' body = '%(body)s'/>
+              </UML:ModelElement.comment>
+"""
+
+_attribute = """                <UML:Attribute xmi.id = 'synthetic:attribute:%(i)i:%(j)i' name = 'attr%(j)i'>
+                  <UML:StructuralFeature.type>
+                    <UML:DataType xmi.idref = 'synthetic:datatype:%(k)i'/>
+                  </UML:StructuralFeature.type>
+                </UML:Attribute>
+"""
+
+_generalization = """            <UML:Generalization xmi.id = 'synthetic:generalization:%(i)i'>
+              <UML:Generalization.child>
+                <UML:Class xmi.idref = 'synthetic:class:%(i)i'/>
+              </UML:Generalization.child>
+              <UML:Generalization.parent>
+                <UML:Class xmi.idref = 'synthetic:class:%(parent)i'/>
+              </UML:Generalization.parent>
+            </UML:Generalization>
+"""
+
+_association = """            <UML:Association xmi.id = 'synthetic:association:%(i)i' name = ''>
+              <UML:Association.connection>
+                <UML:AssociationEnd xmi.id = 'synthetic:association:%(i)i:0' name = 'owner%(i)i'
+                  isNavigable = 'true' aggregation = 'none'>
+                  <UML:AssociationEnd.participant>
+                    <UML:Class xmi.idref = 'synthetic:class:%(i)i'/>
+                  </UML:AssociationEnd.participant>
+                </UML:AssociationEnd>
+                <UML:AssociationEnd xmi.id = 'synthetic:association:%(i)i:1' name = 'items%(i)i'
+                  isNavigable = 'true' aggregation = 'none'>
+                  <UML:AssociationEnd.multiplicity>
+                    <UML:Multiplicity xmi.id = 'synthetic:multiplicity:%(i)i'>
+                      <UML:Multiplicity.range>
+                        <UML:MultiplicityRange xmi.id = 'synthetic:range:%(i)i' lower = '0' upper = '-1'/>
+                      </UML:Multiplicity.range>
+                    </UML:Multiplicity>
+                  </UML:AssociationEnd.multiplicity>
+                  <UML:AssociationEnd.participant>
+                    <UML:Class xmi.idref = 'synthetic:class:%(other)i'/>
+                  </UML:AssociationEnd.participant>
+                </UML:AssociationEnd>
+              </UML:Association.connection>
+            </UML:Association>
+"""
+
+_datatype = """            <UML:DataType xmi.id = 'synthetic:datatype:%(k)i' name = 'type%(k)i'/>
+"""
+
+def synthetic_xmi(outfile, classes=200, attributes=10, datatypes=8, comments=0, body=1024):
+    """Write a synthetic XMI model to outfile.
+
+    Classes are chained by generalizations and associations, and their
+    attributes are typed by datatypes declared at the end of the package, so
+    all references are forward references. Each class has the given number
+    of comments with a body of body bytes. Comments are ignored by the parser,
+    so they make the file bigger without adding entities.
+    """
+    outfile.write(_header)
+    for i in range(classes):
+        outfile.write(_class % {
+            'i': i,
+            'generalization': _class_generalization % {'i': i} if i > 0 else '',
+            'comments': ''.join(_comment % {'i': i, 'j': j, 'body': 'x' * body}
+                                for j in range(comments)),
+            'attributes': ''.join(_attribute % {'i': i, 'j': j, 'k': (i + j) % datatypes}
+                                  for j in range(attributes)),
+        })
+    for i in range(1, classes):
+        outfile.write(_generalization % {'i': i, 'parent': i - 1})
+    for i in range(classes - 1):
+        outfile.write(_association % {'i': i, 'other': i + 1})
+    for k in range(datatypes):
+        outfile.write(_datatype % {'k': k})
+    outfile.write(_footer)
+
+def timeit(infile, **kwargs):
+    """Return the seconds expended loading infile in a new Model."""
+    start = time.time()
+    Model(infile, **kwargs)
+    return time.time() - start
+
+configurations = [
+    ('default', {}),
+    ('sqlite', {'db': ':memory:'}),
+    ('bulk', {'db': ':memory:', 'bulk': True}),
+    ('expat', {'db': ':memory:', 'bulk': True, 'parser': 'expat'}),
+]
+
+def run(classes=200, attributes=10, configurations=configurations, stream=sys.stdout):
+    fd, synthetic = tempfile.mkstemp(suffix='.xmi')
+    try:
+        synthetic_xmi(os.fdopen(fd, 'w'), classes, attributes)
+        inputs = [
+            ('test_003.xmi', os.path.join(os.path.dirname(__file__), 'data', 'test_003.xmi')),
+            ('synthetic %ix%i' % (classes, attributes), synthetic),
+        ]
+        stream.write('%-24s' % 'input' + ''.join('%12s' % name for name, kwargs in configurations) + '\n')
+        for label, infile in inputs:
+            stream.write('%-24s' % label)
+            for name, kwargs in configurations:
+                stream.write('%11.2fs' % timeit(infile, **kwargs))
+                stream.flush()
+            stream.write('\n')
+    finally:
+        os.remove(synthetic)
+
+relationships = [
+    ('CEntity.package', uml.CEntity, 'package'),
+    ('CEntity.tagvalues', uml.CEntity, 'tagvalues'),
+    ('CEntity.stereotypes', uml.CEntity, 'stereotypes'),
+    ('CEntity.associations', uml.CEntity, 'associations'),
+    ('CEntity.child_of', uml.CEntity, 'child_of'),
+    ('CEntity.parent_of', uml.CEntity, 'parent_of'),
+    ('CPackage.entities', uml.CPackage, 'entities'),
+    ('CClass.members', uml.CClass, 'members'),
+    ('CAssociation.ends', uml.CAssociation, 'ends'),
+]
+
+def relationship_costs(dbfile, relationships=relationships):
+    """Return the seconds expended loading each relationship of all the entities in dbfile.
+
+    Relationships are loaded lazily, one query for each entity.
+    """
+    session = sessionmaker(bind=create_engine('sqlite:///%s' % dbfile))()
+    costs = []
+    for name, cls, attr in relationships:
+        entities = session.query(cls).all()
+        start = time.time()
+        for entity in entities:
+            getattr(entity, attr)
+        costs.append(time.time() - start)
+        session.expunge_all()
+    return costs
+
+def run_indexes(classes=200, attributes=10, relationships=relationships, stream=sys.stdout):
+    tmpdir = tempfile.mkdtemp()
+    try:
+        synthetic = os.path.join(tmpdir, 'synthetic.xmi')
+        indexed = os.path.join(tmpdir, 'indexed.db')
+        unindexed = os.path.join(tmpdir, 'unindexed.db')
+        synthetic_xmi(open(synthetic, 'w'), classes, attributes)
+        Model(synthetic, db=indexed, bulk=True).session.close()
+        shutil.copy(indexed, unindexed)
+        engine = create_engine('sqlite:///%s' % unindexed)
+        for table in uml.Base.metadata.sorted_tables:
+            for index in table.indexes:
+                engine.execute('DROP INDEX %s' % index.name)
+        stream.write('%-24s%12s%12s\n' % ('relationship', 'no indexes', 'indexes'))
+        for (name, cls, attr), before, after in zip(relationships,
+                                                      relationship_costs(unindexed, relationships),
+                                                      relationship_costs(indexed, relationships)):
+            stream.write('%-24s%11.3fs%11.3fs\n' % (name, before, after))
+    finally:
+        shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.CRITICAL)
+    run(*[ int(a) for a in sys.argv[1:] ])
+    run_indexes(*[ int(a) for a in sys.argv[1:] ])
+
+# vim:expandtab:smartindent:tabstop=4:softtabstop=4:shiftwidth=4:
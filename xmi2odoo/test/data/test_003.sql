@@ -0,0 +1,952 @@
+-- Database of test_003.xmi as stored by versions before the multiplicity
+-- and label columns. Used to test the migration of old databases.
+PRAGMA foreign_keys=OFF;
+BEGIN TRANSACTION;
+CREATE TABLE centity (
+	id INTEGER NOT NULL, 
+	xmi_id VARCHAR, 
+	name VARCHAR, 
+	type VARCHAR(50), 
+	default_tagvalues BLOB, 
+	package_id INTEGER, 
+	"order" INTEGER, 
+	PRIMARY KEY (id), 
+	UNIQUE (xmi_id), 
+	CONSTRAINT ent_package_id FOREIGN KEY(package_id) REFERENCES cpackage (id)
+);
+INSERT INTO centity VALUES(1,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000865','modelo sin título','cmodel',X'80027d710158050000006c6162656c710258120000006d6f64656c6f2073696e2074c3ad74756c6f7103732e',NULL,0);
+INSERT INTO centity VALUES(2,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:000000000000099E','test','cpackage',X'80027d710158050000006c6162656c71025504746573747103732e',NULL,1);
+INSERT INTO centity VALUES(3,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009AB','car','cclass',X'80027d710158050000006c6162656c710255036361727103732e',2,5);
+INSERT INTO centity VALUES(4,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000B96','Odoo Standard Elements','cmodel',X'80027d710158050000006c6162656c710255164f646f6f205374616e6461726420456c656d656e74737103732e',NULL,6);
+INSERT INTO centity VALUES(5,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000B97','Integer','cdatatype',X'80027d710158050000006c6162656c71025507496e74656765727103732e',NULL,7);
+INSERT INTO centity VALUES(6,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000B98','Boolean','cdatatype',X'80027d710158050000006c6162656c71025507426f6f6c65616e7103732e',NULL,8);
+INSERT INTO centity VALUES(7,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000B99','Date','cdatatype',X'80027d710158050000006c6162656c71025504446174657103732e',NULL,9);
+INSERT INTO centity VALUES(8,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000B9A','Datetime','cdatatype',X'80027d710158050000006c6162656c710255084461746574696d657103732e',NULL,10);
+INSERT INTO centity VALUES(9,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000B9B','Time','cdatatype',X'80027d710158050000006c6162656c7102550454696d657103732e',NULL,11);
+INSERT INTO centity VALUES(10,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000B9C','Char','cdatatype',X'80027d710158050000006c6162656c71025504436861727103732e',NULL,12);
+INSERT INTO centity VALUES(11,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000B9D','Text','cdatatype',X'80027d710158050000006c6162656c71025504546578747103732e',NULL,13);
+INSERT INTO centity VALUES(12,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000B9E','Float','cdatatype',X'80027d710158050000006c6162656c71025505466c6f61747103732e',NULL,14);
+INSERT INTO centity VALUES(13,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000B9F','Binary','cdatatype',X'80027d710158050000006c6162656c7102550642696e6172797103732e',NULL,15);
+INSERT INTO centity VALUES(14,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000BA0','translatable','cstereotype',X'80027d710158050000006c6162656c7102550c7472616e736c617461626c657103732e',NULL,16);
+INSERT INTO centity VALUES(15,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000BA1','readonly','cstereotype',X'80027d710158050000006c6162656c71025508726561646f6e6c797103732e',NULL,18);
+INSERT INTO centity VALUES(16,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000BA2','required','cstereotype',X'80027d710158050000006c6162656c7102550872657175697265647103732e',NULL,20);
+INSERT INTO centity VALUES(17,'127-0-1-1--66344949:13b09938a14:-8000:0000000000000BA3','select','cstereotype',X'80027d710158050000006c6162656c7102550673656c6563747103732e',NULL,22);
+INSERT INTO centity VALUES(18,'127-0-1-1--66344949:13b09938a14:-8000:00000000000011E5','form','cstereotype',X'80027d710158050000006c6162656c71025504666f726d7103732e',NULL,24);
+INSERT INTO centity VALUES(19,'127-0-1-1--66344949:13b09938a14:-8000:00000000000011E6','tree','cstereotype',X'80027d710158050000006c6162656c71025504747265657103732e',NULL,26);
+INSERT INTO centity VALUES(20,'127-0-1-1--66344949:13b09938a14:-8000:00000000000011E8','store','cstereotype',X'80027d710158050000006c6162656c7102550573746f72657103732e',NULL,28);
+INSERT INTO centity VALUES(21,'127-0-1-1--66344949:13b09938a14:-8000:00000000000011EC','fnct','ctagdefiniton',X'80027d710158050000006c6162656c71025504666e63747103732e',NULL,30);
+INSERT INTO centity VALUES(22,'127-0-1-1--66344949:13b09938a14:-8000:00000000000011EF','fnct_inv','ctagdefiniton',X'80027d710158050000006c6162656c71025508666e63745f696e767103732e',NULL,31);
+INSERT INTO centity VALUES(23,'127-0-1-1--66344949:13b09938a14:-8000:00000000000011F2','fnct_search','ctagdefiniton',X'80027d710158050000006c6162656c7102550b666e63745f7365617263687103732e',NULL,32);
+INSERT INTO centity VALUES(24,'127-0-1-1--66344949:13b09938a14:-8000:00000000000011F5','method','cstereotype',X'80027d710158050000006c6162656c710255066d6574686f647103732e',NULL,33);
+INSERT INTO centity VALUES(25,'127-0-1-1--66344949:13b09938a14:-8000:00000000000011F9','multi','ctagdefiniton',X'80027d710158050000006c6162656c710255056d756c74697103732e',NULL,35);
+INSERT INTO centity VALUES(26,'127-0-1-1--66344949:13b09938a14:-8000:00000000000011FF','context','ctagdefiniton',X'80027d710158050000006c6162656c71025507636f6e746578747103732e',NULL,36);
+INSERT INTO centity VALUES(27,'127-0-1-1--66344949:13b09938a14:-8000:0000000000001202','ondelete','ctagdefiniton',X'80027d710158050000006c6162656c710255086f6e64656c6574657103732e',NULL,37);
+INSERT INTO centity VALUES(28,'127-0-1-1-2b464aa4:13b09d81b72:-8000:0000000000001567','default','ctagdefiniton',X'80027d710158050000006c6162656c7102550764656661756c747103732e',NULL,38);
+INSERT INTO centity VALUES(29,'127-0-1-1-2b464aa4:13b09d81b72:-8000:000000000000156A','order','ctagdefiniton',X'80027d710158050000006c6162656c710255056f726465727103732e',NULL,39);
+INSERT INTO centity VALUES(30,'127-0-1-1-2b464aa4:13b09d81b72:-8000:000000000000156D','constraints','ctagdefiniton',X'80027d710158050000006c6162656c7102550b636f6e73747261696e74737103732e',NULL,40);
+INSERT INTO centity VALUES(31,'127-0-1-1-2b464aa4:13b09d81b72:-8000:0000000000001573','label','ctagdefiniton',X'80027d710158050000006c6162656c710255056c6162656c7103732e',NULL,41);
+INSERT INTO centity VALUES(32,'127-0-1-1-2b464aa4:13b09d81b72:-8000:0000000000001576','help','ctagdefiniton',X'80027d710158050000006c6162656c7102550468656c707103732e',NULL,42);
+INSERT INTO centity VALUES(33,'127-0-1-1-780dda7a:13b0a924d36:-8000:0000000000001495','size','ctagdefiniton',X'80027d710158050000006c6162656c7102550473697a657103732e',NULL,43);
+INSERT INTO centity VALUES(34,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:00000000000011D0','author','ctagdefiniton',X'80027d710158050000006c6162656c71025506617574686f727103732e',NULL,44);
+INSERT INTO centity VALUES(35,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:00000000000011D3','documentation','ctagdefiniton',X'80027d710158050000006c6162656c7102550d646f63756d656e746174696f6e7103732e',NULL,45);
+INSERT INTO centity VALUES(36,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:00000000000011D6','version','ctagdefiniton',X'80027d710158050000006c6162656c7102550776657273696f6e7103732e',NULL,46);
+INSERT INTO centity VALUES(37,'127-0-1-1--26cf3395:13b343df95b:-8000:0000000000000F90','menu_parent','ctagdefiniton',X'80027d710158050000006c6162656c7102550b6d656e755f706172656e747103732e',NULL,47);
+INSERT INTO centity VALUES(38,'127-0-1-1--26cf3395:13b343df95b:-8000:0000000000000F93','menu_sequence','ctagdefiniton',X'80027d710158050000006c6162656c7102550d6d656e755f73657175656e63657103732e',NULL,48);
+INSERT INTO centity VALUES(39,'127-0-1-1-663b23fd:13b396ee199:-8000:0000000000000D10','external','cstereotype',X'80027d710158050000006c6162656c7102550865787465726e616c7103732e',NULL,49);
+INSERT INTO centity VALUES(40,'127-0-1-1-7b01ca01:13b51db18aa:-8000:0000000000000D12','hidden','cstereotype',X'80027d710158050000006c6162656c7102550668696464656e7103732e',NULL,51);
+INSERT INTO centity VALUES(41,'127-0-1-1--7f493fcf:13b6d9e307b:-8000:0000000000000F56','search','cstereotype',X'80027d710158050000006c6162656c710255067365617263687103732e',NULL,53);
+INSERT INTO centity VALUES(42,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D16','HTML','cdatatype',X'80027d710158050000006c6162656c7102550448544d4c7103732e',NULL,55);
+INSERT INTO centity VALUES(43,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D17','state','cstereotype',X'80027d710158050000006c6162656c7102550573746174657103732e',NULL,56);
+INSERT INTO centity VALUES(44,'127-0-1-1-7944a5f0:13b6db16c37:-8000:00000000000011C6','extend','cstereotype',X'80027d710158050000006c6162656c71025506657874656e647103732e',NULL,58);
+INSERT INTO centity VALUES(45,'127-0-1-1-19e0703c:13b6dbe7adf:-8000:00000000000011CA','view_groups','ctagdefiniton',X'80027d710158050000006c6162656c7102550b766965775f67726f7570737103732e',NULL,60);
+INSERT INTO centity VALUES(46,'127-0-1-1-5ee79c33:13bb911d610:-8000:0000000000000F9E','menu','cstereotype',X'80027d710158050000006c6162656c710255046d656e757103732e',NULL,61);
+INSERT INTO centity VALUES(47,'127-0-1-1-5ee79c33:13bb911d610:-8000:0000000000000FA1','group','cstereotype',X'80027d710158050000006c6162656c7102550567726f75707103732e',NULL,62);
+INSERT INTO centity VALUES(48,'127-0-1-1-5ee79c33:13bb911d610:-8000:0000000000000FAD','related_to','ctagdefiniton',X'80027d710158050000006c6162656c7102550a72656c617465645f746f7103732e',NULL,63);
+INSERT INTO centity VALUES(49,'127-0-1-1--70559772:13bc2751e9f:-8000:0000000000000C20','related_by','ctagdefiniton',X'80027d710158050000006c6162656c7102550a72656c617465645f62797103732e',NULL,64);
+INSERT INTO centity VALUES(50,'127-0-1-1-f7a661d:13c45d154b1:-8000:0000000000000E93','action','ctagdefiniton',X'80027d710158050000006c6162656c71025506616374696f6e7103732e',NULL,65);
+INSERT INTO centity VALUES(51,'127-0-1-1-f7a661d:13c45d154b1:-8000:0000000000000E96','trigger_expre_id','ctagdefiniton',X'80027d710158050000006c6162656c71025510747269676765725f65787072655f69647103732e',NULL,66);
+INSERT INTO centity VALUES(52,'127-0-1-1-f7a661d:13c45d154b1:-8000:0000000000000E99','view','ctagdefiniton',X'80027d710158050000006c6162656c71025504766965777103732e',NULL,67);
+INSERT INTO centity VALUES(53,'127-0-1-1-f7a661d:13c45d154b1:-8000:0000000000000E9C','category','ctagdefiniton',X'80027d710158050000006c6162656c7102550863617465676f72797103732e',NULL,68);
+INSERT INTO centity VALUES(54,'127-0-1-1-f7a661d:13c45d154b1:-8000:0000000000000E9F','trigger_model','ctagdefiniton',X'80027d710158050000006c6162656c7102550d747269676765725f6d6f64656c7103732e',NULL,69);
+INSERT INTO centity VALUES(55,'127-0-1-1-f7a661d:13c45d154b1:-8000:0000000000000EA2','module_groups','ctagdefiniton',X'80027d710158050000006c6162656c7102550d6d6f64756c655f67726f7570737103732e',NULL,70);
+INSERT INTO centity VALUES(56,'127-0-1-1-f7a661d:13c45d154b1:-8000:0000000000000EAE','button','cstereotype',X'80027d710158050000006c6162656c71025506627574746f6e7103732e',NULL,71);
+INSERT INTO centity VALUES(57,'127-0-1-1-f7a661d:13c45d154b1:-8000:0000000000000EAF','default','cstereotype',X'80027d710158050000006c6162656c7102550764656661756c747103732e',NULL,72);
+INSERT INTO centity VALUES(58,'127-0-1-1-29a13c2b:13cb7762c9e:-8000:0000000000000ED5','domain','ctagdefiniton',X'80027d710158050000006c6162656c71025506646f6d61696e7103732e',NULL,73);
+INSERT INTO centity VALUES(59,'127-0-1-1-29a13c2b:13cb7762c9e:-8000:0000000000000ED8','view_tree_id','ctagdefiniton',X'80027d710158050000006c6162656c7102550c766965775f747265655f69647103732e',NULL,74);
+INSERT INTO centity VALUES(60,'127-0-1-1-29a13c2b:13cb7762c9e:-8000:0000000000000EDB','view_form_id','ctagdefiniton',X'80027d710158050000006c6162656c7102550c766965775f666f726d5f69647103732e',NULL,75);
+INSERT INTO centity VALUES(61,'127-0-1-1-29a13c2b:13cb7762c9e:-8000:0000000000000EDE','view_search_id','ctagdefiniton',X'80027d710158050000006c6162656c7102550e766965775f7365617263685f69647103732e',NULL,76);
+INSERT INTO centity VALUES(62,'127-0-1-1-29a13c2b:13cb7762c9e:-8000:0000000000000EE1','context','cstereotype',X'80027d710158050000006c6162656c71025507636f6e746578747103732e',NULL,77);
+INSERT INTO centity VALUES(63,'127-0-1-1-29a13c2b:13cb7762c9e:-8000:0000000000000EE2','cancellable','cstereotype',X'80027d710158050000006c6162656c7102550b63616e63656c6c61626c657103732e',NULL,78);
+INSERT INTO centity VALUES(64,'127-0-1-1-29a13c2b:13cb7762c9e:-8000:0000000000000EE3','editable','cstereotype',X'80027d710158050000006c6162656c710255086564697461626c657103732e',NULL,79);
+INSERT INTO centity VALUES(65,'127-0-1-1-36eb22b:13cb969044c:-8000:0000000000001A0D','disjoin_view','cstereotype',X'80027d710158050000006c6162656c7102550c6469736a6f696e5f766965777103732e',NULL,80);
+INSERT INTO centity VALUES(66,'127-0-1-1--8e6b3b1:13cd49b7a58:-8000:00000000000019F6','visible','cstereotype',X'80027d710158050000006c6162656c7102550776697369626c657103732e',NULL,81);
+INSERT INTO centity VALUES(67,'127-0-1-1-4b248840:13cda7ec58c:-8000:00000000000019EF','prototype','cstereotype',X'80027d710158050000006c6162656c7102550970726f746f747970657103732e',NULL,82);
+INSERT INTO centity VALUES(68,'127-0-1-1--3588a9e:13cead26784:-8000:0000000000000F2E','digits','ctagdefiniton',X'80027d710158050000006c6162656c710255066469676974737103732e',NULL,83);
+INSERT INTO centity VALUES(69,'127-0-1-1--3588a9e:13cead26784:-8000:0000000000000F31','states','ctagdefiniton',X'80027d710158050000006c6162656c710255067374617465737103732e',NULL,84);
+INSERT INTO centity VALUES(70,'127-0-1-1--3588a9e:13cead26784:-8000:0000000000000F34','form_on_change','ctagdefiniton',X'80027d710158050000006c6162656c7102550e666f726d5f6f6e5f6368616e67657103732e',NULL,85);
+INSERT INTO centity VALUES(71,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C84','field_parent','cstereotype',X'80027d710158050000006c6162656c7102550c6669656c645f706172656e747103732e',NULL,86);
+INSERT INTO centity VALUES(72,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C85','tree_colors','ctagdefiniton',X'80027d710158050000006c6162656c7102550b747265655f636f6c6f72737103732e',NULL,87);
+INSERT INTO centity VALUES(73,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C88','advance_select','cstereotype',X'80027d710158050000006c6162656c7102550e616476616e63655f73656c6563747103732e',NULL,88);
+INSERT INTO centity VALUES(74,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C89','form_groups','ctagdefiniton',X'80027d710158050000006c6162656c7102550b666f726d5f67726f7570737103732e',NULL,89);
+INSERT INTO centity VALUES(75,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C8C','groups','ctagdefiniton',X'80027d710158050000006c6162656c7102550667726f7570737103732e',NULL,90);
+INSERT INTO centity VALUES(76,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C8F','tree_widget','ctagdefiniton',X'80027d710158050000006c6162656c7102550b747265655f7769646765747103732e',NULL,91);
+INSERT INTO centity VALUES(77,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C92','form_widget','ctagdefiniton',X'80027d710158050000006c6162656c7102550b666f726d5f7769646765747103732e',NULL,92);
+INSERT INTO centity VALUES(78,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C95','form_attrs','ctagdefiniton',X'80027d710158050000006c6162656c7102550a666f726d5f61747472737103732e',NULL,93);
+INSERT INTO centity VALUES(79,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C98','form_invisible','ctagdefiniton',X'80027d710158050000006c6162656c7102550e666f726d5f696e76697369626c657103732e',NULL,94);
+INSERT INTO centity VALUES(80,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C9B','form_required','ctagdefiniton',X'80027d710158050000006c6162656c7102550d666f726d5f72657175697265647103732e',NULL,95);
+INSERT INTO centity VALUES(81,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000C9E','tree_attrs','ctagdefiniton',X'80027d710158050000006c6162656c7102550a747265655f61747472737103732e',NULL,96);
+INSERT INTO centity VALUES(82,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CA1','tree_groups','ctagdefiniton',X'80027d710158050000006c6162656c7102550b747265655f67726f7570737103732e',NULL,97);
+INSERT INTO centity VALUES(83,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CA4','tree_invisible','ctagdefiniton',X'80027d710158050000006c6162656c7102550e747265655f696e76697369626c657103732e',NULL,98);
+INSERT INTO centity VALUES(84,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CA7','tree_on_change','ctagdefiniton',X'80027d710158050000006c6162656c7102550e747265655f6f6e5f6368616e67657103732e',NULL,99);
+INSERT INTO centity VALUES(85,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CAA','tree_required','ctagdefiniton',X'80027d710158050000006c6162656c7102550d747265655f72657175697265647103732e',NULL,100);
+INSERT INTO centity VALUES(86,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CAD','form_string','ctagdefiniton',X'80027d710158050000006c6162656c7102550b666f726d5f737472696e677103732e',NULL,101);
+INSERT INTO centity VALUES(87,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CB0','tree_string','ctagdefiniton',X'80027d710158050000006c6162656c7102550b747265655f737472696e677103732e',NULL,102);
+INSERT INTO centity VALUES(88,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CB3','form_password','ctagdefiniton',X'80027d710158050000006c6162656c7102550d666f726d5f70617373776f72647103732e',NULL,103);
+INSERT INTO centity VALUES(89,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CB6','tree_password','ctagdefiniton',X'80027d710158050000006c6162656c7102550d747265655f70617373776f72647103732e',NULL,104);
+INSERT INTO centity VALUES(90,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CB9','form_select','ctagdefiniton',X'80027d710158050000006c6162656c7102550b666f726d5f73656c6563747103732e',NULL,105);
+INSERT INTO centity VALUES(91,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CBC','form_colspan','ctagdefiniton',X'80027d710158050000006c6162656c7102550c666f726d5f636f6c7370616e7103732e',NULL,106);
+INSERT INTO centity VALUES(92,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CBF','form_readonly','ctagdefiniton',X'80027d710158050000006c6162656c7102550d666f726d5f726561646f6e6c797103732e',NULL,107);
+INSERT INTO centity VALUES(93,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CC2','form_domain','ctagdefiniton',X'80027d710158050000006c6162656c7102550b666f726d5f646f6d61696e7103732e',NULL,108);
+INSERT INTO centity VALUES(94,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CC5','form_nolabel','ctagdefiniton',X'80027d710158050000006c6162656c7102550c666f726d5f6e6f6c6162656c7103732e',NULL,109);
+INSERT INTO centity VALUES(95,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CC8','form_eval','ctagdefiniton',X'80027d710158050000006c6162656c71025509666f726d5f6576616c7103732e',NULL,110);
+INSERT INTO centity VALUES(96,'127-0-1-1--6c1fde7f:13ceca5ec28:-8000:0000000000000CCB','form_default_focus','ctagdefiniton',X'80027d710158050000006c6162656c71025512666f726d5f64656661756c745f666f6375737103732e',NULL,111);
+INSERT INTO centity VALUES(97,'127-0-1-1-19de3346:13d114137f6:-8000:0000000000001B3F','property','cstereotype',X'80027d710158050000006c6162656c7102550870726f70657274797103732e',NULL,112);
+INSERT INTO centity VALUES(98,'127-0-1-1--70d108d6:13d11b86512:-8000:0000000000001B3F','value','ctagdefiniton',X'80027d710158050000006c6162656c7102550576616c75657103732e',NULL,113);
+INSERT INTO centity VALUES(99,'127-0-1-1-60df96a5:13d1bf42aba:-8000:0000000000000E1C','on_change','ctagdefiniton',X'80027d710158050000006c6162656c710255096f6e5f6368616e67657103732e',NULL,114);
+INSERT INTO centity VALUES(100,'127-0-1-1-4539e814:13d457e88e7:-8000:0000000000000D28','tree_editable','ctagdefiniton',X'80027d710158050000006c6162656c7102550d747265655f6564697461626c657103732e',NULL,116);
+INSERT INTO centity VALUES(101,'127-0-1-1-4539e814:13d457e88e7:-8000:0000000000000D2B','hierarchical','cstereotype',X'80027d710158050000006c6162656c7102550c68696572617263686963616c7103732e',NULL,117);
+INSERT INTO centity VALUES(102,'127-0-1-1-38af769d:13e7c737b92:-8000:000000000000232B','form_context','ctagdefiniton',X'80027d710158050000006c6162656c7102550c666f726d5f636f6e746578747103732e',NULL,118);
+INSERT INTO centity VALUES(103,'127-0-1-1-38af769d:13e7c737b92:-8000:000000000000232E','tree_context','ctagdefiniton',X'80027d710158050000006c6162656c7102550c747265655f636f6e746578747103732e',NULL,119);
+INSERT INTO centity VALUES(104,'127-0-1-1--233cac9c:13e8531bbe4:-8000:0000000000001D64','message_subject','ctagdefiniton',X'80027d710158050000006c6162656c7102550f6d6573736167655f7375626a6563747103732e',NULL,120);
+INSERT INTO centity VALUES(105,'127-0-1-1--233cac9c:13e8531bbe4:-8000:0000000000001D67','message_text','ctagdefiniton',X'80027d710158050000006c6162656c7102550c6d6573736167655f746578747103732e',NULL,121);
+INSERT INTO centity VALUES(106,'127-0-1-1-5247884e:13f1f1d6b36:-8000:0000000000000D48','back_from_cancel','cstereotype',X'80027d710158050000006c6162656c710255106261636b5f66726f6d5f63616e63656c7103732e',NULL,122);
+INSERT INTO centity VALUES(107,'127-0-1-1-3a0e66f:13f52b11fc8:-8000:0000000000000D4A','memory','cstereotype',X'80027d710158050000006c6162656c710255066d656d6f72797103732e',NULL,123);
+INSERT INTO centity VALUES(108,'127-0-1-1-3a0e66f:13f52b11fc8:-8000:0000000000000D4B','wizard','cstereotype',X'80027d710158050000006c6162656c7102550677697a6172647103732e',NULL,124);
+INSERT INTO centity VALUES(109,'127-0-1-1-3a0e66f:13f52b11fc8:-8000:0000000000000D4C','report','cstereotype',X'80027d710158050000006c6162656c710255067265706f72747103732e',NULL,125);
+INSERT INTO centity VALUES(110,'127-0-1-1-3a0e66f:13f52b11fc8:-8000:0000000000000D4D','view','cstereotype',X'80027d710158050000006c6162656c71025504766965777103732e',NULL,126);
+INSERT INTO centity VALUES(111,'127-0-1-1--d4d24eb:13fa5469284:-8000:000000000000153F','function','cstereotype',X'80027d710158050000006c6162656c7102550866756e6374696f6e7103732e',NULL,127);
+INSERT INTO centity VALUES(112,'127-0-1-1-15814bbb:13fc3d42206:-8000:0000000000000D54','act','cstereotype',X'80027d710158050000006c6162656c710255036163747103732e',NULL,128);
+INSERT INTO centity VALUES(113,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000E9F','res','cpackage',X'80027d710158050000006c6162656c710255037265737103732e',NULL,129);
+INSERT INTO centity VALUES(114,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EA4','partner','cclass',X'80027d710158050000006c6162656c71025507706172746e65727103732e',113,130);
+INSERT INTO centity VALUES(115,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EA8','bank','cclass',X'80027d710158050000006c6162656c7102550462616e6b7103732e',113,134);
+INSERT INTO centity VALUES(116,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EAC','partner.bank','cclass',X'80027d710158050000006c6162656c7102550c706172746e65722e62616e6b7103732e',113,137);
+INSERT INTO centity VALUES(117,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EB5','partner.bank.type','cclass',X'80027d710158050000006c6162656c71025511706172746e65722e62616e6b2e747970657103732e',113,141);
+INSERT INTO centity VALUES(118,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EB6','partner.bank.type.fields','cclass',X'80027d710158050000006c6162656c71025518706172746e65722e62616e6b2e747970652e6669656c64737103732e',113,144);
+INSERT INTO centity VALUES(119,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EBA','company','cclass',X'80027d710158050000006c6162656c71025507636f6d70616e797103732e',113,145);
+INSERT INTO centity VALUES(120,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EBE','multi_company_default','cclass',X'80027d710158050000006c6162656c710255156d756c74695f636f6d70616e795f64656661756c747103732e',113,148);
+INSERT INTO centity VALUES(121,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EC5','config','cclass',X'80027d710158050000006c6162656c71025506636f6e6669677103732e',113,152);
+INSERT INTO centity VALUES(122,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EC6','config.installer','cclass',X'80027d710158050000006c6162656c71025510636f6e6669672e696e7374616c6c65727103732e',113,154);
+INSERT INTO centity VALUES(123,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EF3','newOperation','coperation',X'80027d710158050000006c6162656c7102550c6e65774f7065726174696f6e7103732e',NULL,156);
+INSERT INTO centity VALUES(124,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EC9','country','cclass',X'80027d710158050000006c6162656c71025507636f756e7472797103732e',113,158);
+INSERT INTO centity VALUES(125,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EF4','return','cparameter',X'80027d710158050000006c6162656c7102550672657475726e7103732e',NULL,157);
+INSERT INTO centity VALUES(126,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ECA','country.group','cclass',X'80027d710158050000006c6162656c7102550d636f756e7472792e67726f75707103732e',113,161);
+INSERT INTO centity VALUES(127,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ECB','country.state','cclass',X'80027d710158050000006c6162656c7102550d636f756e7472792e73746174657103732e',113,164);
+INSERT INTO centity VALUES(128,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ED2','currency','cclass',X'80027d710158050000006c6162656c7102550863757272656e63797103732e',113,167);
+INSERT INTO centity VALUES(129,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ED3','currency.rate','cclass',X'80027d710158050000006c6162656c7102550d63757272656e63792e726174657103732e',113,171);
+INSERT INTO centity VALUES(130,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ED7','font','cclass',X'80027d710158050000006c6162656c71025504666f6e747103732e',113,172);
+INSERT INTO centity VALUES(131,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ED8','lang','cclass',X'80027d710158050000006c6162656c710255046c616e677103732e',113,173);
+INSERT INTO centity VALUES(132,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EDC','partner.category','cclass',X'80027d710158050000006c6162656c71025510706172746e65722e63617465676f72797103732e',113,177);
+INSERT INTO centity VALUES(133,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EDD','partner.title','cclass',X'80027d710158050000006c6162656c7102550d706172746e65722e7469746c657103732e',113,180);
+INSERT INTO centity VALUES(134,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EE6','request.link','cclass',X'80027d710158050000006c6162656c7102550c726571756573742e6c696e6b7103732e',113,183);
+INSERT INTO centity VALUES(135,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EEA','groups','cclass',X'80027d710158050000006c6162656c7102550667726f7570737103732e',113,187);
+INSERT INTO centity VALUES(136,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EEB','users','cclass',X'80027d710158050000006c6162656c7102550575736572737103732e',113,190);
+INSERT INTO centity VALUES(137,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EB0','ir','cpackage',X'80027d710158050000006c6162656c7102550269727103732e',NULL,194);
+INSERT INTO centity VALUES(138,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EB1','property','cclass',X'80027d710158050000006c6162656c7102550870726f70657274797103732e',137,195);
+INSERT INTO centity VALUES(139,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EF5','attachment','cclass',X'80027d710158050000006c6162656c7102550a6174746163686d656e747103732e',137,199);
+INSERT INTO centity VALUES(140,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EF9','mail','cpackage',X'80027d710158050000006c6162656c710255046d61696c7103732e',NULL,203);
+INSERT INTO centity VALUES(141,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EFA','thread','cclass',X'80027d710158050000006c6162656c710255067468726561647103732e',140,204);
+INSERT INTO centity VALUES(142,'127-0-1-1-35d7c300:14956ac7359:-8000:000000000000114E','depends','cstereotype',X'80027d710158050000006c6162656c71025507646570656e64737103732e',NULL,205);
+INSERT INTO centity VALUES(143,'127-0-1-1--2a7de05c:14ac03b07f8:-8000:000000000000260E','model_name','ctagdefiniton',X'80027d710158050000006c6162656c7102550a6d6f64656c5f6e616d657103732e',NULL,206);
+INSERT INTO centity VALUES(144,'127-0-1-1--29a7adf0:14ac0e08da2:-8000:0000000000001289','Many2many','cdatatype',X'80027d710158050000006c6162656c710255094d616e79326d616e797103732e',NULL,207);
+INSERT INTO centity VALUES(145,'127-0-1-1--29a7adf0:14ac0e08da2:-8000:000000000000128A','One2many','cdatatype',X'80027d710158050000006c6162656c710255084f6e65326d616e797103732e',NULL,208);
+INSERT INTO centity VALUES(146,'127-0-1-1--29a7adf0:14ac0e08da2:-8000:000000000000128B','Many2one','cdatatype',X'80027d710158050000006c6162656c710255084d616e79326f6e657103732e',NULL,209);
+INSERT INTO centity VALUES(147,'127-0-1-1--29a7adf0:14ac0e08da2:-8000:000000000000128C','comodel_name','ctagdefiniton',X'80027d710158050000006c6162656c7102550c636f6d6f64656c5f6e616d657103732e',NULL,210);
+INSERT INTO centity VALUES(148,'127-0-1-1--29a7adf0:14ac0e08da2:-8000:000000000000128F','relation','ctagdefiniton',X'80027d710158050000006c6162656c7102550872656c6174696f6e7103732e',NULL,211);
+INSERT INTO centity VALUES(149,'127-0-1-1--29a7adf0:14ac0e08da2:-8000:0000000000001292','column1','ctagdefiniton',X'80027d710158050000006c6162656c71025507636f6c756d6e317103732e',NULL,212);
+INSERT INTO centity VALUES(150,'127-0-1-1--29a7adf0:14ac0e08da2:-8000:0000000000001295','column2','ctagdefiniton',X'80027d710158050000006c6162656c71025507636f6c756d6e327103732e',NULL,213);
+INSERT INTO centity VALUES(151,'127-0-1-1--29a7adf0:14ac0e08da2:-8000:0000000000001298','inverse_name','ctagdefiniton',X'80027d710158050000006c6162656c7102550c696e76657273655f6e616d657103732e',NULL,214);
+INSERT INTO centity VALUES(152,'127-0-1-1--29a7adf0:14ac0e08da2:-8000:000000000000129B','selection','ctagdefiniton',X'80027d710158050000006c6162656c7102550973656c656374696f6e7103732e',NULL,215);
+INSERT INTO centity VALUES(153,'127-0-1-1--29a7adf0:14ac0e08da2:-8000:000000000000129E','Selection','cdatatype',X'80027d710158050000006c6162656c7102550953656c656374696f6e7103732e',NULL,216);
+INSERT INTO centity VALUES(154,'127-0-1-1--2c8f0b2f:14ac1f4cc3f:-8000:0000000000001A49','copy','ctagdefiniton',X'80027d710158050000006c6162656c71025504636f70797103732e',NULL,217);
+INSERT INTO centity VALUES(155,'127-0-1-1-68debab9:14ac493492e:-8000:00000000000012BB','tree_sum','ctagdefiniton',X'80027d710158050000006c6162656c71025508747265655f73756d7103732e',NULL,218);
+INSERT INTO centity VALUES(156,'127-0-1-1--73a3f58d:14ae55b8c71:-8000:0000000000001624','group_by','cstereotype',X'80027d710158050000006c6162656c7102550867726f75705f62797103732e',NULL,219);
+INSERT INTO centity VALUES(157,'127-0-1-1--73a3f58d:14ae55b8c71:-8000:0000000000001625','track_visibility','ctagdefiniton',X'80027d710158050000006c6162656c71025510747261636b5f7669736962696c6974797103732e',NULL,220);
+INSERT INTO centity VALUES(158,'127-0-1-1--49b57e7d:157fabf3c0e:-8000:0000000000001D26','depends','ctagdefiniton',X'80027d710158050000006c6162656c71025507646570656e64737103732e',NULL,221);
+INSERT INTO centity VALUES(159,'127-0-1-1-53e803e1:157fc0fdbcb:-8000:00000000000014A3','compute','ctagdefiniton',X'80027d710158050000006c6162656c71025507636f6d707574657103732e',NULL,222);
+INSERT INTO centity VALUES(160,'127-0-1-1--7077bcbc:163964d5225:-8000:00000000000011AF','inverse','ctagdefiniton',X'80027d710158050000006c6162656c71025507696e76657273657103732e',NULL,223);
+INSERT INTO centity VALUES(161,'127-0-1-1-195fe836:15969482925:-8000:0000000000000D45','exception','cstereotype',X'80027d710158050000006c6162656c71025509657863657074696f6e7103732e',NULL,224);
+INSERT INTO centity VALUES(162,'127-0-1-1--669da02f:159addac8dd:-8000:00000000000011DC','server_action','cstereotype',X'80027d710158050000006c6162656c7102550d7365727665725f616374696f6e7103732e',NULL,225);
+INSERT INTO centity VALUES(163,'127-0-1-1--41a95447:159ade204c9:-8000:00000000000011DF','code','ctagdefiniton',X'80027d710158050000006c6162656c71025504636f64657103732e',NULL,226);
+INSERT INTO centity VALUES(164,'127-0-1-1-47c7f0b3:159fafdc36e:-8000:0000000000000E4C','form_filename','ctagdefiniton',X'80027d710158050000006c6162656c7102550d666f726d5f66696c656e616d657103732e',NULL,227);
+INSERT INTO centity VALUES(165,'127-0-1-1--32e5b68b:15a3be41f39:-8000:0000000000000D55','form_states','ctagdefiniton',X'80027d710158050000006c6162656c7102550b666f726d5f7374617465737103732e',NULL,228);
+INSERT INTO centity VALUES(166,'127-0-1-1--35a99ccb:15aad9e49a8:-8000:00000000000013AC','form_options','ctagdefiniton',X'80027d710158050000006c6162656c7102550c666f726d5f6f7074696f6e737103732e',NULL,229);
+INSERT INTO centity VALUES(167,'127-0-1-1--6ecda7df:15b157d59a3:-8000:0000000000000E5E','sql_constraints','ctagdefiniton',X'80027d710158050000006c6162656c7102550f73716c5f636f6e73747261696e74737103732e',NULL,230);
+INSERT INTO centity VALUES(168,'127-0-1-1-1c64bef8:15c58ab3d5f:-8000:0000000000001447','tree_order','ctagdefiniton',X'80027d710158050000006c6162656c7102550a747265655f6f726465727103732e',NULL,231);
+INSERT INTO centity VALUES(169,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D22',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,17);
+INSERT INTO centity VALUES(170,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D1C',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,19);
+INSERT INTO centity VALUES(171,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D1D',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,21);
+INSERT INTO centity VALUES(172,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D1F',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,23);
+INSERT INTO centity VALUES(173,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D19',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,25);
+INSERT INTO centity VALUES(174,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D23',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,27);
+INSERT INTO centity VALUES(175,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D21',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,29);
+INSERT INTO centity VALUES(176,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D1B',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,34);
+INSERT INTO centity VALUES(177,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D18',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,50);
+INSERT INTO centity VALUES(178,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D1A',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,52);
+INSERT INTO centity VALUES(179,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D1E',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,54);
+INSERT INTO centity VALUES(180,'127-0-1-1-608aa393:13b6da4b8d4:-8000:0000000000000D20',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,57);
+INSERT INTO centity VALUES(181,'127-0-1-1-7944a5f0:13b6db16c37:-8000:00000000000011C7',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,59);
+INSERT INTO centity VALUES(182,'127-0-1-1-60df96a5:13d1bf42aba:-8000:0000000000000E1F',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,115);
+INSERT INTO centity VALUES(183,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EA5',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,131);
+INSERT INTO centity VALUES(184,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EA6',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,132);
+INSERT INTO centity VALUES(185,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EA7',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,133);
+INSERT INTO centity VALUES(186,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EA9',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,135);
+INSERT INTO centity VALUES(187,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EAB',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,136);
+INSERT INTO centity VALUES(188,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EAD',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,138);
+INSERT INTO centity VALUES(189,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EAE',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,139);
+INSERT INTO centity VALUES(190,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EAF',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,140);
+INSERT INTO centity VALUES(191,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EB7',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,142);
+INSERT INTO centity VALUES(192,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EB8',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,143);
+INSERT INTO centity VALUES(193,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EBB',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,146);
+INSERT INTO centity VALUES(194,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EBC',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,147);
+INSERT INTO centity VALUES(195,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EBF',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,149);
+INSERT INTO centity VALUES(196,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EC0',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,150);
+INSERT INTO centity VALUES(197,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EC1',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,151);
+INSERT INTO centity VALUES(198,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EC7',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,153);
+INSERT INTO centity VALUES(199,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EC8',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,155);
+INSERT INTO centity VALUES(200,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ECC',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,159);
+INSERT INTO centity VALUES(201,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ECD',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,160);
+INSERT INTO centity VALUES(202,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ECE',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,162);
+INSERT INTO centity VALUES(203,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ECF',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,163);
+INSERT INTO centity VALUES(204,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ED0',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,165);
+INSERT INTO centity VALUES(205,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ED1',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,166);
+INSERT INTO centity VALUES(206,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ED4',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,168);
+INSERT INTO centity VALUES(207,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ED5',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,169);
+INSERT INTO centity VALUES(208,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ED6',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,170);
+INSERT INTO centity VALUES(209,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000ED9',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,174);
+INSERT INTO centity VALUES(210,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EDA',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,175);
+INSERT INTO centity VALUES(211,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EDB',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,176);
+INSERT INTO centity VALUES(212,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EE3',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,178);
+INSERT INTO centity VALUES(213,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EE4',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,179);
+INSERT INTO centity VALUES(214,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EDE',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,181);
+INSERT INTO centity VALUES(215,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EDF',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,182);
+INSERT INTO centity VALUES(216,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EE7',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,184);
+INSERT INTO centity VALUES(217,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EE8',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,185);
+INSERT INTO centity VALUES(218,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EE9',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,186);
+INSERT INTO centity VALUES(219,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EEC',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,188);
+INSERT INTO centity VALUES(220,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EED',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,189);
+INSERT INTO centity VALUES(221,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EEF',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,191);
+INSERT INTO centity VALUES(222,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EF0',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,192);
+INSERT INTO centity VALUES(223,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EF1',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,193);
+INSERT INTO centity VALUES(224,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EB2',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,196);
+INSERT INTO centity VALUES(225,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EB3',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,197);
+INSERT INTO centity VALUES(226,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EB4',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,198);
+INSERT INTO centity VALUES(227,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EF6',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,200);
+INSERT INTO centity VALUES(228,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EF7',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,201);
+INSERT INTO centity VALUES(229,'127-0-1-1-6253ec58:1481cead29a:-8000:0000000000000EF8',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,202);
+INSERT INTO centity VALUES(230,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009AC','name','cattribute',X'80027d710158050000006c6162656c710255046e616d657103732e',2,234);
+INSERT INTO centity VALUES(231,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009B2','km','cattribute',X'80027d710158050000006c6162656c710255026b6d7103732e',2,239);
+INSERT INTO centity VALUES(232,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009B5','maxkmh','cattribute',X'80027d710158050000006c6162656c710255066d61786b6d687103732e',2,241);
+INSERT INTO centity VALUES(233,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009C0','width','cattribute',X'80027d710158050000006c6162656c7102550577696474687103732e',2,243);
+INSERT INTO centity VALUES(234,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009C3','height','cattribute',X'80027d710158050000006c6162656c710255066865696768747103732e',2,245);
+INSERT INTO centity VALUES(235,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009C6','large','cattribute',X'80027d710158050000006c6162656c710255056c617267657103732e',2,247);
+INSERT INTO centity VALUES(236,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009C9','plate','cattribute',X'80027d710158050000006c6162656c71025505706c6174657103732e',2,250);
+INSERT INTO centity VALUES(237,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009CC','usable','cattribute',X'80027d710158050000006c6162656c71025506757361626c657103732e',2,253);
+INSERT INTO centity VALUES(238,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009CF','description','cattribute',X'80027d710158050000006c6162656c7102550b6465736372697074696f6e7103732e',2,255);
+INSERT INTO centity VALUES(239,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009D5','last_use','cattribute',X'80027d710158050000006c6162656c710255086c6173745f7573657103732e',2,258);
+INSERT INTO centity VALUES(240,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009D9','year','cattribute',X'80027d710158050000006c6162656c71025504796561727103732e',2,260);
+INSERT INTO centity VALUES(241,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D25','get_mediumspeed','coperation',X'80027d710158050000006c6162656c7102550f6765745f6d656469756d73706565647103732e',NULL,266);
+INSERT INTO centity VALUES(242,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D22','mediumspeed','cattribute',X'80027d710158050000006c6162656c7102550b6d656469756d73706565647103732e',2,265);
+INSERT INTO centity VALUES(243,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D26','return','cparameter',X'80027d710158050000006c6162656c7102550672657475726e7103732e',NULL,267);
+INSERT INTO centity VALUES(244,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009BA','white','cenumerationliteral',X'80027d710158050000006c6162656c7102550577686974657103732e',NULL,269);
+INSERT INTO centity VALUES(245,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009BB','black','cenumerationliteral',X'80027d710158050000006c6162656c71025505626c61636b7103732e',NULL,271);
+INSERT INTO centity VALUES(246,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009BC','red','cenumerationliteral',X'80027d710158050000006c6162656c710255037265647103732e',NULL,273);
+INSERT INTO centity VALUES(247,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009BD','green','cenumerationliteral',X'80027d710158050000006c6162656c71025505677265656e7103732e',NULL,275);
+INSERT INTO centity VALUES(248,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009BE','blue','cenumerationliteral',X'80027d710158050000006c6162656c71025504626c75657103732e',NULL,277);
+INSERT INTO centity VALUES(249,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009B9','Color','cenumeration',X'80027d710158050000006c6162656c71025505436f6c6f727103732e',NULL,280);
+INSERT INTO centity VALUES(250,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009DC','partener','cclass',X'80027d710158050000006c6162656c7102550870617274656e65727103732e',2,281);
+INSERT INTO centity VALUES(251,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009BF','yellow','cenumerationliteral',X'80027d710158050000006c6162656c7102550679656c6c6f777103732e',NULL,279);
+INSERT INTO centity VALUES(252,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009E3','','cassociation',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,285);
+INSERT INTO centity VALUES(253,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009DD','name','cattribute',X'80027d710158050000006c6162656c710255046e616d657103732e',2,284);
+INSERT INTO centity VALUES(254,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009E4','used_by','cassociationend',X'80027d710158050000006c6162656c71025507757365645f62797103732e',NULL,286);
+INSERT INTO centity VALUES(255,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009EA','','cassociation',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,288);
+INSERT INTO centity VALUES(256,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009E5','use','cassociationend',X'80027d710158050000006c6162656c710255037573657103732e',NULL,287);
+INSERT INTO centity VALUES(257,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009EB','owned_by','cassociationend',X'80027d710158050000006c6162656c710255086f776e65645f62797103732e',NULL,289);
+INSERT INTO centity VALUES(258,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009EF','wheel','cclass',X'80027d710158050000006c6162656c71025505776865656c7103732e',2,291);
+INSERT INTO centity VALUES(259,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009EC','cars','cassociationend',X'80027d710158050000006c6162656c71025504636172737103732e',NULL,290);
+INSERT INTO centity VALUES(260,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009F3','','cassociation',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,294);
+INSERT INTO centity VALUES(261,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009F0','size','cattribute',X'80027d710158050000006c6162656c7102550473697a657103732e',2,293);
+INSERT INTO centity VALUES(262,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009F4','installed_in','cassociationend',X'80027d710158050000006c6162656c7102550c696e7374616c6c65645f696e7103732e',NULL,295);
+INSERT INTO centity VALUES(263,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009FE','Trademark','cenumeration',X'80027d710158050000006c6162656c7102550954726164656d61726b7103732e',NULL,301);
+INSERT INTO centity VALUES(264,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A09','resource','cclass',X'80027d710158050000006c6162656c710255087265736f757263657103732e',2,302);
+INSERT INTO centity VALUES(265,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009FF','Ford','cenumerationliteral',X'80027d710158050000006c6162656c71025504466f72647103732e',NULL,297);
+INSERT INTO centity VALUES(266,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A00','Volkswagen','cenumerationliteral',X'80027d710158050000006c6162656c7102550a566f6c6b73776167656e7103732e',NULL,298);
+INSERT INTO centity VALUES(267,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A01','Renault','cenumerationliteral',X'80027d710158050000006c6162656c7102550752656e61756c747103732e',NULL,299);
+INSERT INTO centity VALUES(268,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A02','Citroen','cenumerationliteral',X'80027d710158050000006c6162656c71025507436974726f656e7103732e',NULL,300);
+INSERT INTO centity VALUES(269,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009F5','wheels','cassociationend',X'80027d710158050000006c6162656c71025506776865656c737103732e',NULL,296);
+INSERT INTO centity VALUES(270,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A0C','buy_date','cattribute',X'80027d710158050000006c6162656c710255086275795f646174657103732e',2,304);
+INSERT INTO centity VALUES(271,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A0F','used_from','cattribute',X'80027d710158050000006c6162656c71025509757365645f66726f6d7103732e',2,306);
+INSERT INTO centity VALUES(272,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D3D','stock_id','cattribute',X'80027d710158050000006c6162656c7102550873746f636b5f69647103732e',2,308);
+INSERT INTO centity VALUES(273,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A0A',NULL,'cgeneralization',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,309);
+INSERT INTO centity VALUES(274,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A12','','cassociation',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,311);
+INSERT INTO centity VALUES(275,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A0B',NULL,'cgeneralization',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,310);
+INSERT INTO centity VALUES(276,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A13','bought_by','cassociationend',X'80027d710158050000006c6162656c71025509626f756768745f62797103732e',NULL,312);
+INSERT INTO centity VALUES(277,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:000000000000099F','documentation','ctagdefiniton',X'80027d710158050000006c6162656c7102550d646f63756d656e746174696f6e7103732e',NULL,314);
+INSERT INTO centity VALUES(278,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009A3','author','ctagdefiniton',X'80027d710158050000006c6162656c71025506617574686f727103732e',NULL,315);
+INSERT INTO centity VALUES(279,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009A7','version','ctagdefiniton',X'80027d710158050000006c6162656c7102550776657273696f6e7103732e',NULL,316);
+INSERT INTO centity VALUES(280,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A14','bought','cassociationend',X'80027d710158050000006c6162656c71025506626f756768747103732e',NULL,313);
+INSERT INTO centity VALUES(281,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009A2',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,2);
+INSERT INTO centity VALUES(282,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009A6',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,3);
+INSERT INTO centity VALUES(283,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009AA',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,4);
+INSERT INTO centity VALUES(284,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D28',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,232);
+INSERT INTO centity VALUES(285,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D2B',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,233);
+INSERT INTO centity VALUES(286,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:00000000000009AF','color','cattribute',X'80027d710158050000006c6162656c71025505636f6c6f727103732e',2,237);
+INSERT INTO centity VALUES(287,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D2D',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,238);
+INSERT INTO centity VALUES(288,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D2E',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,240);
+INSERT INTO centity VALUES(289,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D2F',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,242);
+INSERT INTO centity VALUES(290,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D30',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,244);
+INSERT INTO centity VALUES(291,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D31',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,246);
+INSERT INTO centity VALUES(292,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D2A',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,248);
+INSERT INTO centity VALUES(293,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D32',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,249);
+INSERT INTO centity VALUES(294,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D33',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,251);
+INSERT INTO centity VALUES(295,'127-0-1-1-673300b1:13b322501a9:-8000:0000000000000D52',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,252);
+INSERT INTO centity VALUES(296,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D34',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,254);
+INSERT INTO centity VALUES(297,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D35',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,256);
+INSERT INTO centity VALUES(298,'127-0-1-1-673300b1:13b322501a9:-8000:0000000000000D50',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,257);
+INSERT INTO centity VALUES(299,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D36',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,259);
+INSERT INTO centity VALUES(300,'127-0-1-1-3b1b98f2:13b2e2eda8f:-8000:0000000000000A03','trademark','cattribute',X'80027d710158050000006c6162656c7102550974726164656d61726b7103732e',2,262);
+INSERT INTO centity VALUES(301,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D27',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,263);
+INSERT INTO centity VALUES(302,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D38',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,264);
+INSERT INTO centity VALUES(303,'127-0-1-1--563f455b:13b2e8dd86f:-8000:0000000000000D4A',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,268);
+INSERT INTO centity VALUES(304,'127-0-1-1--563f455b:13b2e8dd86f:-8000:0000000000000D4B',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,270);
+INSERT INTO centity VALUES(305,'127-0-1-1--563f455b:13b2e8dd86f:-8000:0000000000000D4C',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,272);
+INSERT INTO centity VALUES(306,'127-0-1-1--563f455b:13b2e8dd86f:-8000:0000000000000D4D',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,274);
+INSERT INTO centity VALUES(307,'127-0-1-1--563f455b:13b2e8dd86f:-8000:0000000000000D4E',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,276);
+INSERT INTO centity VALUES(308,'127-0-1-1--563f455b:13b2e8dd86f:-8000:0000000000000D4F',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,278);
+INSERT INTO centity VALUES(309,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D29',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,282);
+INSERT INTO centity VALUES(310,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D39',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,283);
+INSERT INTO centity VALUES(311,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D3A',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,292);
+INSERT INTO centity VALUES(312,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D3C',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,303);
+INSERT INTO centity VALUES(313,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D3B',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,305);
+INSERT INTO centity VALUES(314,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D40',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,307);
+INSERT INTO centity VALUES(315,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D2C',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,235);
+INSERT INTO centity VALUES(316,'127-0-1-1-673300b1:13b322501a9:-8000:0000000000000D51',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,236);
+INSERT INTO centity VALUES(317,'127-0-1-1-63334cf4:13b2e4e29c5:-8000:0000000000000D37',NULL,'ctaggedvalue',X'80027d710158050000006c6162656c7102580a0000003c6e6f206c6162656c3e7103732e',NULL,261);
+CREATE TABLE cstatemachine (
+	id INTEGER NOT NULL, 
+	context_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	CONSTRAINT sm_context_id FOREIGN KEY(context_id) REFERENCES centity (id)
+);
+CREATE TABLE cgeneralization (
+	id INTEGER NOT NULL, 
+	parent_id INTEGER, 
+	child_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	FOREIGN KEY(parent_id) REFERENCES centity (id), 
+	FOREIGN KEY(child_id) REFERENCES centity (id)
+);
+INSERT INTO cgeneralization VALUES(273,264,3);
+INSERT INTO cgeneralization VALUES(275,264,258);
+CREATE TABLE cusecase (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+CREATE TABLE caction (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+CREATE TABLE ctagdefinition (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+INSERT INTO ctagdefinition VALUES(21);
+INSERT INTO ctagdefinition VALUES(22);
+INSERT INTO ctagdefinition VALUES(23);
+INSERT INTO ctagdefinition VALUES(25);
+INSERT INTO ctagdefinition VALUES(26);
+INSERT INTO ctagdefinition VALUES(27);
+INSERT INTO ctagdefinition VALUES(28);
+INSERT INTO ctagdefinition VALUES(29);
+INSERT INTO ctagdefinition VALUES(30);
+INSERT INTO ctagdefinition VALUES(31);
+INSERT INTO ctagdefinition VALUES(32);
+INSERT INTO ctagdefinition VALUES(33);
+INSERT INTO ctagdefinition VALUES(34);
+INSERT INTO ctagdefinition VALUES(35);
+INSERT INTO ctagdefinition VALUES(36);
+INSERT INTO ctagdefinition VALUES(37);
+INSERT INTO ctagdefinition VALUES(38);
+INSERT INTO ctagdefinition VALUES(45);
+INSERT INTO ctagdefinition VALUES(48);
+INSERT INTO ctagdefinition VALUES(49);
+INSERT INTO ctagdefinition VALUES(50);
+INSERT INTO ctagdefinition VALUES(51);
+INSERT INTO ctagdefinition VALUES(52);
+INSERT INTO ctagdefinition VALUES(53);
+INSERT INTO ctagdefinition VALUES(54);
+INSERT INTO ctagdefinition VALUES(55);
+INSERT INTO ctagdefinition VALUES(58);
+INSERT INTO ctagdefinition VALUES(59);
+INSERT INTO ctagdefinition VALUES(60);
+INSERT INTO ctagdefinition VALUES(61);
+INSERT INTO ctagdefinition VALUES(68);
+INSERT INTO ctagdefinition VALUES(69);
+INSERT INTO ctagdefinition VALUES(70);
+INSERT INTO ctagdefinition VALUES(72);
+INSERT INTO ctagdefinition VALUES(74);
+INSERT INTO ctagdefinition VALUES(75);
+INSERT INTO ctagdefinition VALUES(76);
+INSERT INTO ctagdefinition VALUES(77);
+INSERT INTO ctagdefinition VALUES(78);
+INSERT INTO ctagdefinition VALUES(79);
+INSERT INTO ctagdefinition VALUES(80);
+INSERT INTO ctagdefinition VALUES(81);
+INSERT INTO ctagdefinition VALUES(82);
+INSERT INTO ctagdefinition VALUES(83);
+INSERT INTO ctagdefinition VALUES(84);
+INSERT INTO ctagdefinition VALUES(85);
+INSERT INTO ctagdefinition VALUES(86);
+INSERT INTO ctagdefinition VALUES(87);
+INSERT INTO ctagdefinition VALUES(88);
+INSERT INTO ctagdefinition VALUES(89);
+INSERT INTO ctagdefinition VALUES(90);
+INSERT INTO ctagdefinition VALUES(91);
+INSERT INTO ctagdefinition VALUES(92);
+INSERT INTO ctagdefinition VALUES(93);
+INSERT INTO ctagdefinition VALUES(94);
+INSERT INTO ctagdefinition VALUES(95);
+INSERT INTO ctagdefinition VALUES(96);
+INSERT INTO ctagdefinition VALUES(98);
+INSERT INTO ctagdefinition VALUES(99);
+INSERT INTO ctagdefinition VALUES(100);
+INSERT INTO ctagdefinition VALUES(102);
+INSERT INTO ctagdefinition VALUES(103);
+INSERT INTO ctagdefinition VALUES(104);
+INSERT INTO ctagdefinition VALUES(105);
+INSERT INTO ctagdefinition VALUES(143);
+INSERT INTO ctagdefinition VALUES(147);
+INSERT INTO ctagdefinition VALUES(148);
+INSERT INTO ctagdefinition VALUES(149);
+INSERT INTO ctagdefinition VALUES(150);
+INSERT INTO ctagdefinition VALUES(151);
+INSERT INTO ctagdefinition VALUES(152);
+INSERT INTO ctagdefinition VALUES(154);
+INSERT INTO ctagdefinition VALUES(155);
+INSERT INTO ctagdefinition VALUES(157);
+INSERT INTO ctagdefinition VALUES(158);
+INSERT INTO ctagdefinition VALUES(159);
+INSERT INTO ctagdefinition VALUES(160);
+INSERT INTO ctagdefinition VALUES(163);
+INSERT INTO ctagdefinition VALUES(164);
+INSERT INTO ctagdefinition VALUES(165);
+INSERT INTO ctagdefinition VALUES(166);
+INSERT INTO ctagdefinition VALUES(167);
+INSERT INTO ctagdefinition VALUES(168);
+INSERT INTO ctagdefinition VALUES(277);
+INSERT INTO ctagdefinition VALUES(278);
+INSERT INTO ctagdefinition VALUES(279);
+CREATE TABLE csignal (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+CREATE TABLE cdatatype (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+INSERT INTO cdatatype VALUES(3);
+INSERT INTO cdatatype VALUES(5);
+INSERT INTO cdatatype VALUES(6);
+INSERT INTO cdatatype VALUES(7);
+INSERT INTO cdatatype VALUES(8);
+INSERT INTO cdatatype VALUES(9);
+INSERT INTO cdatatype VALUES(10);
+INSERT INTO cdatatype VALUES(11);
+INSERT INTO cdatatype VALUES(12);
+INSERT INTO cdatatype VALUES(13);
+INSERT INTO cdatatype VALUES(42);
+INSERT INTO cdatatype VALUES(114);
+INSERT INTO cdatatype VALUES(115);
+INSERT INTO cdatatype VALUES(116);
+INSERT INTO cdatatype VALUES(117);
+INSERT INTO cdatatype VALUES(118);
+INSERT INTO cdatatype VALUES(119);
+INSERT INTO cdatatype VALUES(120);
+INSERT INTO cdatatype VALUES(121);
+INSERT INTO cdatatype VALUES(122);
+INSERT INTO cdatatype VALUES(124);
+INSERT INTO cdatatype VALUES(126);
+INSERT INTO cdatatype VALUES(127);
+INSERT INTO cdatatype VALUES(128);
+INSERT INTO cdatatype VALUES(129);
+INSERT INTO cdatatype VALUES(130);
+INSERT INTO cdatatype VALUES(131);
+INSERT INTO cdatatype VALUES(132);
+INSERT INTO cdatatype VALUES(133);
+INSERT INTO cdatatype VALUES(134);
+INSERT INTO cdatatype VALUES(135);
+INSERT INTO cdatatype VALUES(136);
+INSERT INTO cdatatype VALUES(138);
+INSERT INTO cdatatype VALUES(139);
+INSERT INTO cdatatype VALUES(141);
+INSERT INTO cdatatype VALUES(144);
+INSERT INTO cdatatype VALUES(145);
+INSERT INTO cdatatype VALUES(146);
+INSERT INTO cdatatype VALUES(153);
+INSERT INTO cdatatype VALUES(249);
+INSERT INTO cdatatype VALUES(250);
+INSERT INTO cdatatype VALUES(258);
+INSERT INTO cdatatype VALUES(263);
+INSERT INTO cdatatype VALUES(264);
+CREATE TABLE cactor (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+CREATE TABLE cstereotype (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+INSERT INTO cstereotype VALUES(14);
+INSERT INTO cstereotype VALUES(15);
+INSERT INTO cstereotype VALUES(16);
+INSERT INTO cstereotype VALUES(17);
+INSERT INTO cstereotype VALUES(18);
+INSERT INTO cstereotype VALUES(19);
+INSERT INTO cstereotype VALUES(20);
+INSERT INTO cstereotype VALUES(24);
+INSERT INTO cstereotype VALUES(39);
+INSERT INTO cstereotype VALUES(40);
+INSERT INTO cstereotype VALUES(41);
+INSERT INTO cstereotype VALUES(43);
+INSERT INTO cstereotype VALUES(44);
+INSERT INTO cstereotype VALUES(46);
+INSERT INTO cstereotype VALUES(47);
+INSERT INTO cstereotype VALUES(56);
+INSERT INTO cstereotype VALUES(57);
+INSERT INTO cstereotype VALUES(62);
+INSERT INTO cstereotype VALUES(63);
+INSERT INTO cstereotype VALUES(64);
+INSERT INTO cstereotype VALUES(65);
+INSERT INTO cstereotype VALUES(66);
+INSERT INTO cstereotype VALUES(67);
+INSERT INTO cstereotype VALUES(71);
+INSERT INTO cstereotype VALUES(73);
+INSERT INTO cstereotype VALUES(97);
+INSERT INTO cstereotype VALUES(101);
+INSERT INTO cstereotype VALUES(106);
+INSERT INTO cstereotype VALUES(107);
+INSERT INTO cstereotype VALUES(108);
+INSERT INTO cstereotype VALUES(109);
+INSERT INTO cstereotype VALUES(110);
+INSERT INTO cstereotype VALUES(111);
+INSERT INTO cstereotype VALUES(112);
+INSERT INTO cstereotype VALUES(142);
+INSERT INTO cstereotype VALUES(156);
+INSERT INTO cstereotype VALUES(161);
+INSERT INTO cstereotype VALUES(162);
+CREATE TABLE cassociation (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+INSERT INTO cassociation VALUES(252);
+INSERT INTO cassociation VALUES(255);
+INSERT INTO cassociation VALUES(260);
+INSERT INTO cassociation VALUES(274);
+CREATE TABLE cmodel (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+INSERT INTO cmodel VALUES(1);
+INSERT INTO cmodel VALUES(4);
+CREATE TABLE cevent (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+CREATE TABLE cexpression (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id)
+);
+CREATE TABLE cassociationend (
+	id INTEGER NOT NULL, 
+	association_id INTEGER, 
+	participant_id INTEGER, 
+	"isNavigable" BOOLEAN, 
+	aggregation VARCHAR, 
+	multiplicityrange VARCHAR, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	FOREIGN KEY(association_id) REFERENCES cassociation (id), 
+	FOREIGN KEY(participant_id) REFERENCES centity (id), 
+	CHECK ("isNavigable" IN (0, 1))
+);
+INSERT INTO cassociationend VALUES(254,252,250,1,'aggregate','None');
+INSERT INTO cassociationend VALUES(256,252,3,1,'none','(0, 1)');
+INSERT INTO cassociationend VALUES(257,255,250,1,'composite','None');
+INSERT INTO cassociationend VALUES(259,255,3,1,'none','(0, -1)');
+INSERT INTO cassociationend VALUES(262,260,3,1,'composite','None');
+INSERT INTO cassociationend VALUES(269,260,258,1,'none','None');
+INSERT INTO cassociationend VALUES(276,274,250,1,'none','(1, 1)');
+INSERT INTO cassociationend VALUES(280,274,264,1,'none','(0, -1)');
+CREATE TABLE cenumeration (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cdatatype (id)
+);
+INSERT INTO cenumeration VALUES(249);
+INSERT INTO cenumeration VALUES(263);
+CREATE TABLE ctaggedvalue (
+	id INTEGER NOT NULL, 
+	value VARCHAR, 
+	tagdefinition_id INTEGER, 
+	owner_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	FOREIGN KEY(tagdefinition_id) REFERENCES ctagdefinition (id), 
+	FOREIGN KEY(owner_id) REFERENCES centity (id)
+);
+INSERT INTO ctaggedvalue VALUES(169,'El campo puede traducirse.',35,14);
+INSERT INTO ctaggedvalue VALUES(170,'El campo es de solo lectura.',35,15);
+INSERT INTO ctaggedvalue VALUES(171,'El campo es obligatorio.',35,16);
+INSERT INTO ctaggedvalue VALUES(172,'El campo tiene un índice asociado.',35,17);
+INSERT INTO ctaggedvalue VALUES(173,'El campo se observa en la vista de formulario.',35,18);
+INSERT INTO ctaggedvalue VALUES(174,'El campo aparece en el la vista de árbol.',35,19);
+INSERT INTO ctaggedvalue VALUES(175,'El campo computado es almacenado en la base de datos.',35,20);
+INSERT INTO ctaggedvalue VALUES(176,'El campo es computado por una función miembro de la clase.',35,24);
+INSERT INTO ctaggedvalue VALUES(177,'El paquete es externo y no se tiene en cuenta a la hora de generar los paquetes.',35,39);
+INSERT INTO ctaggedvalue VALUES(178,'El campo esta oculto (es lo mismo que no poner ni form ni tree?)',35,40);
+INSERT INTO ctaggedvalue VALUES(179,'El campo aparece en el formulario de busqueda.',35,41);
+INSERT INTO ctaggedvalue VALUES(180,'El campo se representa por un widget de estados.',35,43);
+INSERT INTO ctaggedvalue VALUES(181,'Extiende la clase padre.',35,44);
+INSERT INTO ctaggedvalue VALUES(182,'Set on_change in object declaration.',35,99);
+INSERT INTO ctaggedvalue VALUES(183,'base.view_partner_form',60,114);
+INSERT INTO ctaggedvalue VALUES(184,'base.view_partner_tree',59,114);
+INSERT INTO ctaggedvalue VALUES(185,'base.view_res_partner_filter',61,114);
+INSERT INTO ctaggedvalue VALUES(186,'base.view_res_bank_form',60,115);
+INSERT INTO ctaggedvalue VALUES(187,'base.view_res_bank_tree',59,115);
+INSERT INTO ctaggedvalue VALUES(188,'base.view_partner_bank_form',60,116);
+INSERT INTO ctaggedvalue VALUES(189,'base.view_partner_bank_tree',59,116);
+INSERT INTO ctaggedvalue VALUES(190,'base.view_partner_bank_search',61,116);
+INSERT INTO ctaggedvalue VALUES(191,'base.view_partner_bank_type_form',60,117);
+INSERT INTO ctaggedvalue VALUES(192,'base.view_partner_bank_type_tree',59,117);
+INSERT INTO ctaggedvalue VALUES(193,'base.view_company_form',60,119);
+INSERT INTO ctaggedvalue VALUES(194,'base.view_company_tree',59,119);
+INSERT INTO ctaggedvalue VALUES(195,'base.view_inventory_form',60,120);
+INSERT INTO ctaggedvalue VALUES(196,'base.view_inventory_tree',59,120);
+INSERT INTO ctaggedvalue VALUES(197,'base.view_inventory_search',61,120);
+INSERT INTO ctaggedvalue VALUES(198,'base.res_config_view_base',60,121);
+INSERT INTO ctaggedvalue VALUES(199,'base.res_config_installer',60,122);
+INSERT INTO ctaggedvalue VALUES(200,'base.view_country_form',60,124);
+INSERT INTO ctaggedvalue VALUES(201,'base.view_country_tree',59,124);
+INSERT INTO ctaggedvalue VALUES(202,'base.view_country_group_form',60,126);
+INSERT INTO ctaggedvalue VALUES(203,'base.view_country_group_tree',59,126);
+INSERT INTO ctaggedvalue VALUES(204,'base.view_country_state_form',60,127);
+INSERT INTO ctaggedvalue VALUES(205,'base.view_country_state_tree',59,127);
+INSERT INTO ctaggedvalue VALUES(206,'base.view_currency_form',60,128);
+INSERT INTO ctaggedvalue VALUES(207,'base.view_currency_tree',59,128);
+INSERT INTO ctaggedvalue VALUES(208,'base.view_currency_search',61,128);
+INSERT INTO ctaggedvalue VALUES(209,'base.res_lang_form',60,131);
+INSERT INTO ctaggedvalue VALUES(210,'base.res_lang_tree',59,131);
+INSERT INTO ctaggedvalue VALUES(211,'base.res_lang_search',61,131);
+INSERT INTO ctaggedvalue VALUES(212,'base.view_partner_category_form',60,132);
+INSERT INTO ctaggedvalue VALUES(213,'base.view_partner_category_tree',59,132);
+INSERT INTO ctaggedvalue VALUES(214,'base.view_partner_title_form',60,133);
+INSERT INTO ctaggedvalue VALUES(215,'base.view_partner_title_tree',59,133);
+INSERT INTO ctaggedvalue VALUES(216,'base.res_request_link-view',60,134);
+INSERT INTO ctaggedvalue VALUES(217,'base.res_request_link_tree-view',59,134);
+INSERT INTO ctaggedvalue VALUES(218,'base.res_request_link_search_view',61,134);
+INSERT INTO ctaggedvalue VALUES(219,'base.view_groups_form',60,135);
+INSERT INTO ctaggedvalue VALUES(220,'base.view_groups_search',61,135);
+INSERT INTO ctaggedvalue VALUES(221,'base.view_users_form',60,136);
+INSERT INTO ctaggedvalue VALUES(222,'base.view_users_tree',59,136);
+INSERT INTO ctaggedvalue VALUES(223,'base.view_users_search',61,136);
+INSERT INTO ctaggedvalue VALUES(224,'base.ir_property_view',60,138);
+INSERT INTO ctaggedvalue VALUES(225,'base.ir_property_view_tree',59,138);
+INSERT INTO ctaggedvalue VALUES(226,'base.ir_property_view_search',61,138);
+INSERT INTO ctaggedvalue VALUES(227,'base.view_attachment_form',60,139);
+INSERT INTO ctaggedvalue VALUES(228,'base.view_attachment_tree',59,139);
+INSERT INTO ctaggedvalue VALUES(229,'base.view_attachment_search',61,139);
+INSERT INTO ctaggedvalue VALUES(281,'This a test for xmi2odoo using OpenERP model',277,2);
+INSERT INTO ctaggedvalue VALUES(282,'Cristian S. Rocha',278,2);
+INSERT INTO ctaggedvalue VALUES(283,'0.0.1',279,2);
+INSERT INTO ctaggedvalue VALUES(284,'32',33,230);
+INSERT INTO ctaggedvalue VALUES(285,'Name',31,230);
+INSERT INTO ctaggedvalue VALUES(287,'Km',31,231);
+INSERT INTO ctaggedvalue VALUES(288,'Max. Velocity',31,232);
+INSERT INTO ctaggedvalue VALUES(289,'Width',31,233);
+INSERT INTO ctaggedvalue VALUES(290,'Height',31,234);
+INSERT INTO ctaggedvalue VALUES(291,'Large',31,235);
+INSERT INTO ctaggedvalue VALUES(292,'8',33,236);
+INSERT INTO ctaggedvalue VALUES(293,'Ofiicial Plate',31,236);
+INSERT INTO ctaggedvalue VALUES(294,'Is working?',31,237);
+INSERT INTO ctaggedvalue VALUES(295,'True',28,237);
+INSERT INTO ctaggedvalue VALUES(296,'Description or comment',31,238);
+INSERT INTO ctaggedvalue VALUES(297,'Last use',31,239);
+INSERT INTO ctaggedvalue VALUES(298,'today()',28,239);
+INSERT INTO ctaggedvalue VALUES(299,'Model year',31,240);
+INSERT INTO ctaggedvalue VALUES(301,'get_mediumspeed',21,242);
+INSERT INTO ctaggedvalue VALUES(302,'Medium speed',31,242);
+INSERT INTO ctaggedvalue VALUES(303,'White',31,244);
+INSERT INTO ctaggedvalue VALUES(304,'Black',31,245);
+INSERT INTO ctaggedvalue VALUES(305,'Red',31,246);
+INSERT INTO ctaggedvalue VALUES(306,'Green',31,247);
+INSERT INTO ctaggedvalue VALUES(307,'Blue',31,248);
+INSERT INTO ctaggedvalue VALUES(308,'Yellow',31,251);
+INSERT INTO ctaggedvalue VALUES(309,'32',33,253);
+INSERT INTO ctaggedvalue VALUES(310,'Name',31,253);
+INSERT INTO ctaggedvalue VALUES(311,'Size',31,261);
+INSERT INTO ctaggedvalue VALUES(312,'Buy date',31,270);
+INSERT INTO ctaggedvalue VALUES(313,'Used from',31,271);
+INSERT INTO ctaggedvalue VALUES(314,'Stock Id',31,272);
+INSERT INTO ctaggedvalue VALUES(315,'Color',31,286);
+INSERT INTO ctaggedvalue VALUES(316,'''white''',28,286);
+INSERT INTO ctaggedvalue VALUES(317,'Trademark',31,300);
+CREATE TABLE csignalevent (
+	id INTEGER NOT NULL, 
+	signal_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cevent (id), 
+	FOREIGN KEY(signal_id) REFERENCES csignal (id)
+);
+CREATE TABLE cguard (
+	id INTEGER NOT NULL, 
+	expression_id INTEGER NOT NULL, 
+	PRIMARY KEY (id, expression_id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	FOREIGN KEY(expression_id) REFERENCES cexpression (id)
+);
+CREATE TABLE cclass (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cdatatype (id)
+);
+INSERT INTO cclass VALUES(3);
+INSERT INTO cclass VALUES(114);
+INSERT INTO cclass VALUES(115);
+INSERT INTO cclass VALUES(116);
+INSERT INTO cclass VALUES(117);
+INSERT INTO cclass VALUES(118);
+INSERT INTO cclass VALUES(119);
+INSERT INTO cclass VALUES(120);
+INSERT INTO cclass VALUES(121);
+INSERT INTO cclass VALUES(122);
+INSERT INTO cclass VALUES(124);
+INSERT INTO cclass VALUES(126);
+INSERT INTO cclass VALUES(127);
+INSERT INTO cclass VALUES(128);
+INSERT INTO cclass VALUES(129);
+INSERT INTO cclass VALUES(130);
+INSERT INTO cclass VALUES(131);
+INSERT INTO cclass VALUES(132);
+INSERT INTO cclass VALUES(133);
+INSERT INTO cclass VALUES(134);
+INSERT INTO cclass VALUES(135);
+INSERT INTO cclass VALUES(136);
+INSERT INTO cclass VALUES(138);
+INSERT INTO cclass VALUES(139);
+INSERT INTO cclass VALUES(141);
+INSERT INTO cclass VALUES(250);
+INSERT INTO cclass VALUES(258);
+INSERT INTO cclass VALUES(264);
+CREATE TABLE stereotypes (
+	centity_id INTEGER, 
+	cstereotype_id INTEGER, 
+	FOREIGN KEY(centity_id) REFERENCES centity (id), 
+	FOREIGN KEY(cstereotype_id) REFERENCES cstereotype (id)
+);
+INSERT INTO stereotypes VALUES(63,162);
+INSERT INTO stereotypes VALUES(97,161);
+INSERT INTO stereotypes VALUES(113,39);
+INSERT INTO stereotypes VALUES(137,39);
+INSERT INTO stereotypes VALUES(140,39);
+INSERT INTO stereotypes VALUES(3,18);
+INSERT INTO stereotypes VALUES(3,19);
+INSERT INTO stereotypes VALUES(242,24);
+INSERT INTO stereotypes VALUES(250,18);
+INSERT INTO stereotypes VALUES(250,19);
+INSERT INTO stereotypes VALUES(258,19);
+INSERT INTO stereotypes VALUES(258,18);
+INSERT INTO stereotypes VALUES(264,18);
+INSERT INTO stereotypes VALUES(264,19);
+CREATE TABLE cpackage (
+	id INTEGER NOT NULL, 
+	model_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	FOREIGN KEY(model_id) REFERENCES cmodel (id)
+);
+INSERT INTO cpackage VALUES(2,1);
+INSERT INTO cpackage VALUES(113,4);
+INSERT INTO cpackage VALUES(137,4);
+INSERT INTO cpackage VALUES(140,4);
+CREATE TABLE cbooleanexpression (
+	id INTEGER NOT NULL, 
+	language VARCHAR, 
+	body TEXT, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cexpression (id)
+);
+CREATE TABLE cbasestate (
+	id INTEGER NOT NULL, 
+	statemachine_id INTEGER, 
+	state_of_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	FOREIGN KEY(statemachine_id) REFERENCES cstatemachine (id), 
+	CONSTRAINT sm_state_composition_id FOREIGN KEY(state_of_id) REFERENCES ccompositestate (id)
+);
+CREATE TABLE cfinalstate (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cbasestate (id)
+);
+CREATE TABLE ccompositestate (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cbasestate (id)
+);
+CREATE TABLE cpseudostate (
+	id INTEGER NOT NULL, 
+	kind VARCHAR, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cbasestate (id)
+);
+CREATE TABLE csimplestate (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cbasestate (id)
+);
+CREATE TABLE cmember (
+	id INTEGER NOT NULL, 
+	member_of_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	FOREIGN KEY(member_of_id) REFERENCES cclass (id)
+);
+INSERT INTO cmember VALUES(123,122);
+INSERT INTO cmember VALUES(230,3);
+INSERT INTO cmember VALUES(231,3);
+INSERT INTO cmember VALUES(232,3);
+INSERT INTO cmember VALUES(233,3);
+INSERT INTO cmember VALUES(234,3);
+INSERT INTO cmember VALUES(235,3);
+INSERT INTO cmember VALUES(236,3);
+INSERT INTO cmember VALUES(237,3);
+INSERT INTO cmember VALUES(238,3);
+INSERT INTO cmember VALUES(239,3);
+INSERT INTO cmember VALUES(240,3);
+INSERT INTO cmember VALUES(241,3);
+INSERT INTO cmember VALUES(242,3);
+INSERT INTO cmember VALUES(253,250);
+INSERT INTO cmember VALUES(261,258);
+INSERT INTO cmember VALUES(270,264);
+INSERT INTO cmember VALUES(271,264);
+INSERT INTO cmember VALUES(272,264);
+INSERT INTO cmember VALUES(286,3);
+INSERT INTO cmember VALUES(300,3);
+CREATE TABLE ctransition (
+	id INTEGER NOT NULL, 
+	statemachine_id INTEGER, 
+	state_from_id INTEGER, 
+	state_to_id INTEGER, 
+	guard_id INTEGER, 
+	effect_id INTEGER, 
+	trigger_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	FOREIGN KEY(statemachine_id) REFERENCES cstatemachine (id), 
+	FOREIGN KEY(state_from_id) REFERENCES cbasestate (id), 
+	FOREIGN KEY(state_to_id) REFERENCES cbasestate (id), 
+	FOREIGN KEY(guard_id) REFERENCES cexpression (id), 
+	FOREIGN KEY(effect_id) REFERENCES caction (id), 
+	FOREIGN KEY(trigger_id) REFERENCES cevent (id)
+);
+CREATE TABLE cenumerationliteral (
+	id INTEGER NOT NULL, 
+	enumeration_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	FOREIGN KEY(enumeration_id) REFERENCES cenumeration (id)
+);
+INSERT INTO cenumerationliteral VALUES(244,249);
+INSERT INTO cenumerationliteral VALUES(245,249);
+INSERT INTO cenumerationliteral VALUES(246,249);
+INSERT INTO cenumerationliteral VALUES(247,249);
+INSERT INTO cenumerationliteral VALUES(248,249);
+INSERT INTO cenumerationliteral VALUES(251,249);
+INSERT INTO cenumerationliteral VALUES(265,263);
+INSERT INTO cenumerationliteral VALUES(266,263);
+INSERT INTO cenumerationliteral VALUES(267,263);
+INSERT INTO cenumerationliteral VALUES(268,263);
+CREATE TABLE cattribute (
+	id INTEGER NOT NULL, 
+	datatype_id INTEGER, 
+	size INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cmember (id), 
+	FOREIGN KEY(datatype_id) REFERENCES cdatatype (id)
+);
+INSERT INTO cattribute VALUES(230,10,NULL);
+INSERT INTO cattribute VALUES(231,5,NULL);
+INSERT INTO cattribute VALUES(232,5,NULL);
+INSERT INTO cattribute VALUES(233,12,NULL);
+INSERT INTO cattribute VALUES(234,12,NULL);
+INSERT INTO cattribute VALUES(235,12,NULL);
+INSERT INTO cattribute VALUES(236,10,NULL);
+INSERT INTO cattribute VALUES(237,6,NULL);
+INSERT INTO cattribute VALUES(238,11,NULL);
+INSERT INTO cattribute VALUES(239,8,NULL);
+INSERT INTO cattribute VALUES(240,5,NULL);
+INSERT INTO cattribute VALUES(242,12,NULL);
+INSERT INTO cattribute VALUES(253,10,NULL);
+INSERT INTO cattribute VALUES(261,12,NULL);
+INSERT INTO cattribute VALUES(270,7,NULL);
+INSERT INTO cattribute VALUES(271,8,NULL);
+INSERT INTO cattribute VALUES(272,5,NULL);
+INSERT INTO cattribute VALUES(286,249,NULL);
+INSERT INTO cattribute VALUES(300,263,NULL);
+CREATE TABLE coperation (
+	id INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cmember (id)
+);
+INSERT INTO coperation VALUES(123);
+INSERT INTO coperation VALUES(241);
+CREATE TABLE ccallevent (
+	id INTEGER NOT NULL, 
+	operation_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES cevent (id), 
+	FOREIGN KEY(operation_id) REFERENCES coperation (id)
+);
+CREATE TABLE cparameter (
+	id INTEGER NOT NULL, 
+	datatype_id INTEGER, 
+	operation_id INTEGER, 
+	kind VARCHAR, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES centity (id), 
+	FOREIGN KEY(datatype_id) REFERENCES cdatatype (id), 
+	FOREIGN KEY(operation_id) REFERENCES coperation (id)
+);
+INSERT INTO cparameter VALUES(125,NULL,123,NULL);
+INSERT INTO cparameter VALUES(243,NULL,241,NULL);
+CREATE TABLE ccallaction (
+	id INTEGER NOT NULL, 
+	operation_id INTEGER, 
+	PRIMARY KEY (id), 
+	FOREIGN KEY(id) REFERENCES caction (id), 
+	FOREIGN KEY(operation_id) REFERENCES coperation (id)
+);
+COMMIT;
@@ -1,13 +1,28 @@
 import unittest
 import doctest
+import tempfile
+import shutil
 import xmi2odoo
 import logging
 
 logging.basicConfig(level=logging.CRITICAL)
 
+_snapshot_dir = xmi2odoo.model.Model.default_snapshot_dir
+
+def setUp(test):
+        # Snapshots of the profiles are not stored in the home of the user.
+        xmi2odoo.model.Model.default_snapshot_dir = tempfile.mkdtemp()
+
+def tearDown(test):
+        shutil.rmtree(xmi2odoo.model.Model.default_snapshot_dir)
+        xmi2odoo.model.Model.default_snapshot_dir = _snapshot_dir
+
 def load_tests(loader, tests, ignore):
-        tests.addTests(doctest.DocTestSuite(xmi2odoo.uml))
-        tests.addTests(doctest.DocTestSuite(xmi2odoo.model))
-        tests.addTests(doctest.DocTestSuite(xmi2odoo.builder))
+        tests.addTests(doctest.DocTestSuite(xmi2odoo.uml, setUp=setUp, tearDown=tearDown))
+        # Methods of memory are the ones of uml, tested there.
+        tests.addTests(doctest.DocTestSuite(xmi2odoo.memory, test_finder=doctest.DocTestFinder(recurse=False),
+                                            setUp=setUp, tearDown=tearDown))
+        tests.addTests(doctest.DocTestSuite(xmi2odoo.model, setUp=setUp, tearDown=tearDown))
+        tests.addTests(doctest.DocTestSuite(xmi2odoo.builder, setUp=setUp, tearDown=tearDown))
         return tests
 
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+##############################################################################
+#
+#    XMI2ODOO, XMI convesort to Odoo module
+#    Copyright (C) 2012 Coop Trab Moldeo Interactive, Grupo AdHoc S.A.
+#    (<http://www.moldeointeractive.com.ar>; <www.grupoadhoc.com.ar>).
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+##############################################################################
+import unittest
+import subprocess
+import tempfile
+import sys, os
+from xmi2odoo.test.benchmark import synthetic_xmi
+
+# Size in MB of the synthetic XMI file and maximum resident memory in MB of
+# the process loading it. Writing and loading the file takes minutes, so the
+# test runs only if a size is given, as 300.
+SIZE = int(os.environ.get('XMI2ODOO_MEMORY_TEST_SIZE', 0))
+BUDGET = int(os.environ.get('XMI2ODOO_MEMORY_TEST_BUDGET', 128))
+
+_load = """
+import sys, logging, resource
+logging.basicConfig(level=logging.CRITICAL)
+from xmi2odoo.model import Model
+Model(sys.argv[1], parser=sys.argv[2])
+print resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+"""
+
+@unittest.skipUnless(SIZE, 'Set XMI2ODOO_MEMORY_TEST_SIZE to the size in MB of the file to load.')
+class TestMemory(unittest.TestCase):
+    """Memory used to load a file must not grow with the size of the file."""
+
+    @classmethod
+    def setUpClass(cls):
+        fd, cls.infile = tempfile.mkstemp(suffix='.xmi')
+        # Each comment takes about 1200 bytes.
+        synthetic_xmi(os.fdopen(fd, 'w'), classes=50, attributes=5,
+                      comments=SIZE * 1024 * 1024 / 1200 / 50)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.infile)
+
+    def peak(self, parser):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = dict(os.environ, PYTHONPATH=root)
+        out = subprocess.check_output([sys.executable, '-c', _load, self.infile, parser], env=env)
+        return int(out) / 1024
+
+    def test_etree(self):
+        self.assertLess(self.peak('etree'), BUDGET)
+
+    def test_expat(self):
+        self.assertLess(self.peak('expat'), BUDGET)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# vim:expandtab:smartindent:tabstop=4:softtabstop=4:shiftwidth=4:
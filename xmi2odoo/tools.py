@@ -1,6 +1,10 @@
 #!/usr/bin/env python
 
-from xmi2odoo import uml
+import sys
+
+def _uml(obj):
+    """Module with the entity classes of obj, uml or memory."""
+    return sys.modules[type(obj).__module__]
 
 def tag_option(obj, name, label=None, default=None, check=True, quote='\'', negate=False, translate=False):
     if isinstance(name, list):
@@ -152,7 +156,7 @@ def ass_options(cls,obj,version=False):
         tag_option(obj,  'digits'),
         stereotype_option(obj, 'readonly'),
         stereotype_option(obj, 'required', check=(not cls.is_extended())),
-        stereotype_option(obj, 'required', check=(not cls.is_extended()) and ((eval(obj.multiplicityrange) or (0,0))[0] > 0), negate=True),
+        stereotype_option(obj, 'required', check=(not cls.is_extended()) and ((obj.lower or 0) > 0), negate=True),
         tag_option(obj,  'size'),
         tag_option(obj,  'states', quote=''),
         tag_option(obj,  'context', quote=''),
@@ -188,7 +192,7 @@ def ass_options(cls,obj,version=False):
        tag_option(obj,  'digits'),
        stereotype_option(obj, 'readonly'),
        stereotype_option(obj, 'required', check=(not cls.is_extended())),
-       stereotype_option(obj, 'required', check=(not cls.is_extended()) and ((eval(obj.multiplicityrange) or (0,0))[0] > 0), negate=True),
+       stereotype_option(obj, 'required', check=(not cls.is_extended()) and ((obj.lower or 0) > 0), negate=True),
        tag_option(obj,  'size'),
        tag_option(obj,  'states',),
        tag_option(obj,  'context',),
@@ -233,10 +237,12 @@ def view_tree_id(cls):
 def form_colors(cls):
     r = ''
     for sm in [ sm for sm in cls.get_statemachines(no_stereotypes=['extend','prototype'])]:
+        graph = sm.graph
+        exceptions = names(graph.stereotype_states('exception'))
         r = "grey:state=='cancelled';blue:state in %s;black:state in %s;red:state in %s" % (
-            repr(tuple(names(sm.initial_states()))),
-            repr(tuple(set(names(sm.middle_states()))-set(names(sm.stereotype_states('exception'))))),
-            repr(tuple(names(sm.stereotype_states('exception'))))
+            repr(tuple(names(graph.initial))),
+            repr(tuple(set(names(graph.middle))-set(exceptions))),
+            repr(tuple(exceptions))
         )
     return r
 
@@ -247,7 +253,7 @@ def wkf_name(cls, obj):
     return "%s_%s_wkf" % (cls.name, obj.name)
 
 def wkf_guard(cls, u=' and '):
-    if cls.oerp_id('-', False) != cls.oerp_id('-') and cls.has_member('type', uml.CAttribute):
+    if cls.oerp_id('-', False) != cls.oerp_id('-') and cls.has_member('type', _uml(cls).CAttribute):
         r = 'type =="%s"%s' % (model(cls), u)
     else:
         r = 'True%s' % u
@@ -257,11 +263,12 @@ def groups(obj):
     return ','.join([ '(4, ref(\'%s\'))' % (name if '.' in name else 'group_%s' % name) for name in obj.tag['groups'].split(',')])
 
 def is_related(obj):
-    return obj.relateds(uml.CClass)
+    return obj.relateds(_uml(obj).CClass)
 
 def related(obj):
-    assert list(obj.relateds(uml.CClass)) > 1, "You have more than one class related to %s.\n%s" % (obj.name, names(obj.relateds(uml.CClass)))
-    return obj.relateds(uml.CClass)[0]
+    CClass = _uml(obj).CClass
+    assert list(obj.relateds(CClass)) > 1, "You have more than one class related to %s.\n%s" % (obj.name, names(obj.relateds(CClass)))
+    return obj.relateds(CClass)[0]
 
 def walk_by_associations(CLASS, related_by):
     if related_by:
@@ -97,12 +97,15 @@ C testclass [<CAttribute(xmi_id:'a', name:'A', size=None)>, <CAttribute(xmi_id:'
 from sqlalchemy import ForeignKey
 from sqlalchemy import Column, Integer, String, Boolean, Text
 from sqlalchemy.orm import relationship, backref
+from sqlalchemy import event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.types import PickleType
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy import Sequence
-from sqlalchemy.schema import Table
+from sqlalchemy.schema import Table, Index
 import re
 import itertools
+import collections
+import json
 import time
 import logging
 
@@ -131,8 +134,59 @@ _oerp_type = {
     'HTML': 'html',
 }
 
+class TagView(dict):
+    """Read only mapping of the tags of an entity.
+
+    >>> tag = TagView({'label': 'Name'})
+    >>> tag['label']
+    'Name'
+    >>> tag['label'] = 'Other'
+    Traceback (most recent call last):
+    ...
+    TypeError: Tags are read only. Change the tagged values of the entity.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('Tags are read only. Change the tagged values of the entity.')
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+
+class Multiplicity(collections.namedtuple('Multiplicity', 'lower upper')):
+    """Range of an association end. An upper bound of -1 is unlimited.
+
+    >>> m = Multiplicity(0, -1)
+    >>> m == (0, -1), m.lower, m.upper
+    (True, 0, -1)
+    >>> m
+    (0, -1)
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+class NativeString(TypeDecorator):
+    """Text column returning str for ascii values and unicode for the others.
+
+    Values are stored as text, so they can be queried. They are read back
+    as the XML parsers give them, so generated code quotes them the same way.
+    """
+
+    impl = String
+
+    def process_bind_param(self, value, dialect):
+        return value.decode('utf-8') if type(value) is str else value
+
+    def process_result_value(self, value, dialect):
+        try:
+            return value.encode('ascii') if type(value) is unicode else value
+        except UnicodeError:
+            return value
+
 def solvmul(v, t):
-    mr = eval(v)
+    """Return 'one' or 'many' for the multiplicity v of an end with aggregation t."""
+    mr = None if v is None else tuple(v)
     if t in ['composite', 'aggregate' ]:
         if mr in [(0,1), (1,1), None]:
             return 'one'
@@ -145,6 +199,10 @@ def solvmul(v, t):
             return 'many'
     return None
 
+# Attributes where entities memoize computed values, registered next to the
+# methods using them. Entities of the memory backend have a slot for each one.
+_caches = []
+
 class CEntity(Base):
     """Abstract UML entity class.
 
@@ -160,10 +218,13 @@ class CEntity(Base):
     xmi_id = Column(String, unique=True)
     name = Column(String)
     entityclass = Column('type', String(50))
-    default_tagvalues = Column(PickleType)
-    package_id = Column(Integer, ForeignKey('cpackage.id', use_alter=True, name='ent_package_id'))
+    label = Column(NativeString)
+    default_tags = Column(Text)
+    package_id = Column(Integer, ForeignKey('cpackage.id', use_alter=True, name='ent_package_id'), index=True)
     order = Column(Integer)
 
+    __table_args__ = (Index('ix_centity_type_package_id', 'type', 'package_id'),)
+
     tagvalues = relationship('CTaggedValue',
                              primaryjoin='CTaggedValue.owner_id==CEntity.id',
                              order_by='CTaggedValue.owner_id',
@@ -183,11 +244,46 @@ class CEntity(Base):
     __normalize_name__ = False
 
     @property
-    def tag(self):
-        tagvalues = self.default_tagvalues.copy()
-        tagvalues.update(dict((i.tagdefinition.name, i.value) for i in self.tagvalues ))
+    def default_tagvalues(self):
+        """Tag values of the entity without tagged values.
+
+        The label is stored in its own column and other tags, if any, as JSON.
+        """
+        tagvalues = json.loads(self.default_tags) if self.default_tags else {}
+        tagvalues[u'label'] = self.label
         return tagvalues
 
+    @default_tagvalues.setter
+    def default_tagvalues(self, value):
+        tagvalues = dict(value)
+        self.label = tagvalues.pop(u'label', None)
+        self.default_tags = json.dumps(tagvalues) if tagvalues else None
+
+    _caches.append('_tag')
+
+    @property
+    def tag(self):
+        """Default tag values updated with the tagged values of the entity.
+
+        The mapping is computed once and forgotten when tagvalues or
+        default_tagvalues change, or a tag definition is renamed.
+
+        >>> entity = CClass('c', 'order')
+        >>> definition = CTagDefinition('d', 'documentation')
+        >>> value = CTaggedValue('v', definition, 'Sales order.', owner=entity)
+        >>> entity.tag['documentation']
+        'Sales order.'
+        >>> definition.name = 'help'
+        >>> entity.tag['help'], 'documentation' in entity.tag
+        ('Sales order.', False)
+        """
+        tag = getattr(self, '_tag', None)
+        if tag is None:
+            tagvalues = self.default_tagvalues.copy()
+            tagvalues.update((i.tagdefinition.name, i.value) for i in self.tagvalues)
+            tag = self._tag = TagView(tagvalues)
+        return tag
+
     def oerp_id(self, sep='.'):
         if self.package == None:
             package = ''
@@ -196,15 +292,26 @@ class CEntity(Base):
             package = self.package.name
         return '%s%s%s' % (package, sep, self.name)
 
+    _caches.append('_stereotype_names')
+
+    @property
+    def stereotype_names(self):
+        """Names of the stereotypes of the entity.
+
+        The set is computed once and forgotten when stereotypes change.
+        """
+        names = getattr(self, '_stereotype_names', None)
+        if names is None:
+            names = self._stereotype_names = frozenset(st.name for st in self.stereotypes)
+        return names
+
     def is_stereotype(self, *stereotypes):
         if stereotypes in (tuple(), (None,)): return True
-        st = [ st.name in stereotypes for st in self.stereotypes]
-        return any(st)
+        return not self.stereotype_names.isdisjoint(stereotypes)
 
     def not_is_stereotype(self, *stereotypes):
         if stereotypes in (tuple(), (None,)): return True
-        st = [ st.name in stereotypes for st in self.stereotypes]
-        return not any(st)
+        return self.stereotype_names.isdisjoint(stereotypes)
 
     def relateds(self, ctype=None):
         ctype = CEntity if ctype is None else ctype
@@ -218,35 +325,100 @@ class CEntity(Base):
         ctype = CEntity if ctype is None else ctype
         return [ ass.swap[0].participant for ass in self.associations if ass.swap[0].isNavigable and isinstance(ass.swap[0].participant, ctype) ]
 
-    def prev_leafs(self, ftype=None, ctype=None, i = 10, no_raise=False, remove_inherits=False):
+    def prev_leafs(self, ftype=None, ctype=None, no_raise=False, remove_inherits=False):
+        """Return the first entities of type ftype reached going back by prevs.
+
+        Entities of type ctype are followed, and each leaf is listed once.
+        Loops raise a RuntimeError, or are ignored if no_raise is set.
+
+        >>> from xmi2odoo.model import Model
+        >>> model = Model("xmi2odoo/test/data/test_005.xmi")
+        >>> orders = model['test_005:menu:orders']
+        >>> [ m.name for m in orders.prev_leafs(model.uml.CUseCase, model.uml.CUseCase) ]
+        [u'sales']
+        >>> [ a.name for a in orders.prev_leafs(model.uml.CActor) ]
+        [u'user']
+        >>> orders.prev_leafs(model.uml.CActor).append(orders)
+        >>> [ a.name for a in orders.prev_leafs(model.uml.CActor) ]
+        [u'user']
+        """
         ftype = CEntity if ftype is None else ftype
         ctype = CEntity if ctype is None else ctype
-        if i <= 0:
-            if no_raise:
-                return []
-            else:
-                raise RuntimeError, 'prev_leafs loop cant stop'
-        if len(self.prevs(ctype)) > 0:
-            r = list(itertools.chain(*[ entity.prev_leafs(ftype, ctype, i=i-1, no_raise=no_raise) for entity in self.prevs(ctype) ]))
-            if len(r) > 1 and remove_inherits:
-                r = [ p for p, c in itertools.product(r,r) if (p!=c and p.is_child_of(c.oerp_id())) ]
-            return r
-        elif isinstance(self, ftype):
-            return [ self ]
-        else:
-            return []
+        r = self._leafs('prevs', ftype, ctype, no_raise)
+        if len(r) > 1 and remove_inherits:
+            r = [ p for p, c in itertools.product(r,r) if (p!=c and p.is_child_of(c.oerp_id())) ]
+        return r
 
-    def next_leafs(self, ftype=None, ctype=None, i = 10):
+    def next_leafs(self, ftype=None, ctype=None):
+        """Return the last entities of type ftype reached going forward by nexts."""
         ftype = CEntity if ftype is None else ftype
         ctype = CEntity if ctype is None else ctype
-        if i <= 0:
-            raise RuntimeError, 'next_leafs loop cant stop'
-        if len(self.prevs(ctype)) > 0:
-            return itertools.chain(*[ entity.next_leafs(ftype, ctype, i-1) for entity in self.nexts(ctype) ])
-        elif isinstance(self, ftype):
-            return [ self ]
-        else:
-            return []
+        return self._leafs('nexts', ftype, ctype, False)
+
+    def _leafs(self, direction, ftype, ctype, no_raise):
+        """Return the leafs of the entity following the direction method, prevs or nexts.
+
+        The leafs of each entity reached are computed once and computed again
+        when the members or associations of the model change, so entities
+        shared by many paths are visited once. With no_raise, entities of the
+        path closing a loop are skipped. Leafs computed skipping an entity
+        depend on the path followed to reach them, so they are not memoized.
+        """
+        key = (direction, ftype, ctype, no_raise)
+        version = _members_version
+        leafs = self._leafs_table(version).get(key)
+        if leafs is not None:
+            return list(leafs)
+        path = set()
+        # Frames of the walk: entity, neighbours, pending neighbours, leafs
+        # of the neighbours and whether an entity was skipped below it.
+        stack = []
+        def push(entity):
+            path.add(entity)
+            neighbours = getattr(entity, direction)(ctype)
+            stack.append([ entity, neighbours, iter(neighbours), {}, False ])
+        push(self)
+        while True:
+            frame = stack[-1]
+            entity, neighbours, pending, found = frame[:4]
+            for neighbour in pending:
+                if neighbour in path:
+                    if not no_raise:
+                        raise RuntimeError, '%s loop found in %s.' % (direction, neighbour.name)
+                    frame[4] = True
+                    continue
+                leafs = neighbour._leafs_table(version).get(key)
+                if leafs is None:
+                    push(neighbour)
+                    break
+                found[neighbour] = leafs
+            else:
+                stack.pop()
+                path.discard(entity)
+                if neighbours:
+                    seen = set()
+                    leafs = [ leaf for neighbour in neighbours if neighbour in found
+                              for leaf in found[neighbour]
+                              if not (leaf in seen or seen.add(leaf)) ]
+                elif isinstance(entity, ftype):
+                    leafs = [ entity ]
+                else:
+                    leafs = []
+                if not frame[4]:
+                    entity._leafs_table(version)[key] = leafs
+                if not stack:
+                    return list(leafs)
+                stack[-1][3][entity] = leafs
+                stack[-1][4] = stack[-1][4] or frame[4]
+
+    _caches.append('_leaf_tables')
+
+    def _leafs_table(self, version):
+        """Return the dict of memoized leafs of the entity for version."""
+        tables = getattr(self, '_leaf_tables', None)
+        if tables is None or tables[0] != version:
+            tables = self._leaf_tables = (version, {})
+        return tables[1]
 
     def parent(self, package=None, pid=0):
         return self.parents(package=package)[pid]
@@ -271,9 +443,51 @@ class CEntity(Base):
     def get_statemachines(self, *args, **dargs):
         return self.statemachines if self.statemachines else itertools.chain(*[ p.get_statemachines(*args, **dargs) for p in self.parents(*args, **dargs) ])
 
+    _caches.append('_lineage')
+
+    @property
+    def lineage(self):
+        """The entity followed by its ancestors, depth first in child_of order.
+
+        Ancestors reached by more than one path are repeated, as in a recursive
+        walk over child_of. The list is computed once and computed again when
+        any generalization changes.
+
+        >>> from xmi2odoo.model import Model
+        >>> model = Model("xmi2odoo/test/data/test_006.xmi")
+        >>> [ e.oerp_id() for e in model['test_006:sale:partner'].lineage ]
+        [u'sale.partner', u'base.partner']
+        """
+        cached = getattr(self, '_lineage', None)
+        if cached is not None and cached[0] == _generalizations_version:
+            if cached[1] is None:
+                raise RuntimeError, 'Circular generalization found in %s.' % self.name
+            return cached[1]
+        self._lineage = (_generalizations_version, None)
+        lineage = [ self ]
+        try:
+            for gen in self.child_of:
+                lineage.extend(gen.parent.lineage)
+        except:
+            self._lineage = None
+            raise
+        self._lineage = (_generalizations_version, lineage)
+        return lineage
+
+    _caches.append('_ancestors')
+
+    @property
+    def ancestors(self):
+        """Ancestors of the entity in lineage order, without repetitions."""
+        cached = getattr(self, '_ancestors', None)
+        if cached is None or cached[0] != _generalizations_version:
+            seen = set([ self ])
+            ancestors = [ a for a in self.lineage if not (a in seen or seen.add(a)) ]
+            cached = self._ancestors = (_generalizations_version, ancestors)
+        return cached[1]
+
     def is_child_of(self, oerp_id):
-        oerp_ids = [ '%s.%s' % (gen.parent.package.name, gen.parent.name) for gen in self.child_of ]
-        return (oerp_id in oerp_ids) or max([ gen.parent.is_child_of(oerp_id) for gen in self.child_of ] + [False])
+        return any('%s.%s' % (a.package.name, a.name) == oerp_id for a in self.ancestors)
 
     def __init__(self, xmi_id, name, package=None, order=None, default_tagvalues={}):
         super(CEntity, self).__init__()
@@ -288,20 +502,18 @@ class CEntity(Base):
         self.xmi_id = xmi_id
         self.name = name
         self.default_tagvalues = default_tagvalues.copy()
-        self.package = package
         self.order = order
+        self.package = package
 
     def __repr__(self):
         return "<CEntity(xmi_id:'%s', name:'%s')>" % (self.xmi_id, self.name)
 
     def has_member(self, name, cclass = None):
         cclass = cclass or CMember
-        for mem in self.members:
-            if mem.name == name and type(mem) == cclass:
-                return True
-        for parent in self.parents():
-            if parent.has_member(name, cclass):
-                return True
+        for entity in [ self ] + self.ancestors:
+            for mem in entity.members:
+                if mem.name == name and type(mem) == cclass:
+                    return True
         return False
 
     def get_inhereted_attr(self, attrs):
@@ -313,16 +525,18 @@ class CEntity(Base):
         return None
 
     def iter_over_inhereted_attrs(self, attrs):
-        for value in getattr(self, attrs, []):
-            yield value
-        for parent in self.parents():
-            for item in parent.iter_over_inhereted_attrs(attrs):
-                yield item
+        for entity in [ self ] + self.ancestors:
+            for value in getattr(entity, attrs, []):
+                yield value
 
     def __getattr__(obj, name):
-        if 'is_' == name[:3]:
-            return obj.is_stereotype(name[3:])
-        raise AttributeError, 'Not found attribute %s in %s' % (name, obj.name)
+        if name.startswith('is_'):
+            return name[3:] in obj.stereotype_names
+        if name.startswith('__'):
+            raise AttributeError, name
+        # Read the name from __dict__, the mapped attribute may be missing too.
+        raise AttributeError, 'Not found attribute %s in %s' % (name,
+            obj.__dict__.get('name') if hasattr(obj, '__dict__') else obj.name)
 
     def __getitem__(self, name):
         tag = self.tag
@@ -364,12 +578,12 @@ class CUseCase(CEntity):
 
     def all_associations(self, stereotypes=[], no_stereotypes=[], parents=True, ctype=None, sort=True):
         if ctype is None: ctype = CClass
-        r = list(itertools.chain([ (ass.swap[0], ass.order) for ass in self.associations
+        r = [ (ass.swap[0], ass.order) for entity in (self.lineage if parents else [ self ])
+                             for ass in entity.associations
                              if type(ass.swap[0].participant) is ctype and (
                                  ( ass.swap[0].is_stereotype(*stereotypes) and ass.swap[0].not_is_stereotype(*no_stereotypes) ) or
                                  ( ass.swap[0].participant.is_stereotype(*stereotypes) and ass.swap[0].participant.not_is_stereotype(*no_stereotypes) )
-                             ) ],
-                            *[ gen.parent.all_associations(stereotypes, no_stereotypes, parents, ctype, sort=False) for gen in self.child_of if parents]))
+                             ) ]
         if sort:
             s = sorted(r,key=lambda k: k[1])
             return s and zip(*s)[0] or []
@@ -427,33 +641,84 @@ class CDataType(CEntity):
 
     def attribute_by_name(self, name):
         """ Return an attribute by name. """
-        r = [ i for i in self.all_attributes() if i.name == name ] + [None]
-        assert len(r) <= 2, "Not unique attribute with name %s for class %s" % (name, self.name)
-        return r[0]
+        return self._by_name('attributes', CAttribute, name)
+
+    _caches.append('_members')
+
+    def _members_tables(self):
+        """Return the dict of member tables and name indexes of the entity.
+
+        Tables are computed once and computed again when the members,
+        associations or generalizations of the model change.
+        """
+        version = (_generalizations_version, _members_version)
+        tables = getattr(self, '_members', None)
+        if tables is None or tables[0] != version:
+            tables = self._members = (version, {})
+        return tables[1]
+
+    def _members_table(self, kind, parents, ctype):
+        """Return the members of kind attributes or associations of type ctype.
+
+        The table has the (member, order) pairs in lineage order and the
+        members sorted by order.
+        """
+        tables = self._members_tables()
+        key = (kind, parents, ctype)
+        table = tables.get(key)
+        if table is None:
+            lineage = self.lineage if parents else [ self ]
+            if kind == 'attributes':
+                pairs = tuple((m, m.order) for entity in lineage for m in entity.members
+                              if type(m) is ctype)
+            else:
+                pairs = tuple((ass.swap[0], ass.order) for entity in lineage for ass in entity.associations
+                              if type(ass.swap[0].participant) is ctype)
+            members = tuple(m for m, order in sorted(pairs, key=lambda k: k[1]))
+            table = tables[key] = (pairs, members)
+        return table
+
+    def _by_name(self, kind, ctype, name):
+        """Return the inherited attribute or association with name, or None."""
+        tables = self._members_tables()
+        key = (kind, 'names', ctype)
+        index = tables.get(key)
+        if index is None:
+            names, repeated = {}, set()
+            for member in self._members_table(kind, True, ctype)[1]:
+                if member.name in names:
+                    repeated.add(member.name)
+                else:
+                    names[member.name] = member
+            index = tables[key] = (names, repeated)
+        names, repeated = index
+        assert name not in repeated, "Not unique %s with name %s for class %s" % (kind[:-1], name, self.name)
+        return names.get(name)
 
     def all_attributes(self, stereotypes=[], no_stereotypes=[], parents=True, ctype=None, sort=True):
         if ctype is None: ctype = CAttribute
-        r = list(itertools.chain([ (m, m.order) for m in self.members
-                             if type(m) is ctype and m.is_stereotype(*stereotypes) and m.not_is_stereotype(*no_stereotypes) ],
-                            *[ gen.parent.all_attributes(stereotypes, no_stereotypes, parents, ctype, sort=False) for gen in self.child_of if parents]))
+        pairs, members = self._members_table('attributes', parents, ctype)
+        if stereotypes or no_stereotypes:
+            check = lambda m: m.is_stereotype(*stereotypes) and m.not_is_stereotype(*no_stereotypes)
+            pairs = [ p for p in pairs if check(p[0]) ]
+            members = tuple(m for m in members if check(m))
         if sort:
-            s = sorted(r,key=lambda k: k[1])
-            return s and zip(*s)[0] or []
+            return members or []
         else:
-            return r
+            return list(pairs)
 
     def all_associations(self, stereotypes=[], no_stereotypes=[], parents=True, ctype=None, sort=True):
         if ctype is None: ctype = CClass
-        r = list(itertools.chain([ (ass.swap[0], ass.order) for ass in self.associations
-                             if type(ass.swap[0].participant) is ctype and (
-                                 ( ass.swap[0].is_stereotype(*stereotypes) and ass.swap[0].not_is_stereotype(*no_stereotypes) ) or
-                                 ( ass.swap[0].participant.is_stereotype(*stereotypes) and ass.swap[0].participant.not_is_stereotype(*no_stereotypes) )
-                             ) ],
-                            *[ gen.parent.all_associations(stereotypes, no_stereotypes, parents, ctype, sort=False) for gen in self.child_of if parents]))
+        pairs, members = self._members_table('associations', parents, ctype)
+        if stereotypes or no_stereotypes:
+            check = lambda e: ( ( e.is_stereotype(*stereotypes) and e.not_is_stereotype(*no_stereotypes) ) or
+                                ( e.participant.is_stereotype(*stereotypes) and e.participant.not_is_stereotype(*no_stereotypes) ) )
+            pairs = [ p for p in pairs if check(p[0]) ]
+            members = tuple(m for m in members if check(m))
         if sort:
-            s = sorted(r,key=lambda k: k[1])
-            r = s and zip(*s)[0] or []
-        return r
+            return members or []
+        else:
+            return list(pairs)
 
 class CEnumerationLiteral(CEntity):
     """CEnumerationLiteral class.
@@ -467,7 +732,7 @@ class CEnumerationLiteral(CEntity):
     __tablename__ = 'cenumerationliteral'
 
     id = Column(Integer, ForeignKey('centity.id'), primary_key=True)
-    enumeration_id = Column(Integer, ForeignKey('cenumeration.id'))
+    enumeration_id = Column(Integer, ForeignKey('cenumeration.id'), index=True)
 
     __mapper_args__ = {'polymorphic_identity': 'cenumerationliteral'}
 
@@ -544,7 +809,7 @@ class CPackage(CEntity):
     __tablename__ = 'cpackage'
 
     id = Column(Integer, ForeignKey('centity.id'), primary_key=True)
-    model_id = Column(Integer, ForeignKey('cmodel.id'))
+    model_id = Column(Integer, ForeignKey('cmodel.id'), index=True)
 
     __mapper_args__ = {
         'polymorphic_identity': 'cpackage',
@@ -589,31 +854,55 @@ class CClass(CDataType):
 
     __normalize_name__ = True
 
-    def __init__(self, xmi_id, name, order=None, package=None):
-        print xmi_id, name
-        super(CClass, self).__init__(xmi_id, name, order=order, package=package)
-
     def __repr__(self):
         return "<CClass(xmi_id:'%s', name:'%s')>" % (self.xmi_id, self.name)
 
     def member_by_name(self, name):
         """ Return a member by name.  """
-        for i in self.members:
-            if i.name == name:
-                return i
-        return None
+        tables = self._members_tables()
+        names = tables.get('members')
+        if names is None:
+            names = tables['members'] = {}
+            for i in self.members:
+                names.setdefault(i.name, i)
+        return names.get(name)
 
     def association_by_name(self, name):
-        """ Return an association by name. """
-        r = [ i for i in self.all_associations() if i.name == name ] + [None]
-        assert len(r) <= 2, "Not unique association with name %s for class %s" % (name, self.name)
-        return r[0]
+        """ Return an association by name.
+
+        >>> from xmi2odoo.model import Model
+        >>> model = Model("xmi2odoo/test/data/test_006.xmi")
+        >>> order = model['test_006:sale:order']
+        >>> order.association_by_name('partner_id').participant.name
+        u'partner'
+        >>> order.association_by_name('partner_id') is order.all_associations()[0]
+        True
+        """
+        return self._by_name('associations', CClass, name)
 
     def is_extended(self, ignore=['ir.needaction_mixin','mail.thread']):
         extensions = [ gen.is_stereotype('extend') for gen in self.child_of if gen.parent.oerp_id() not in ignore ]
         return any(extensions)
 
+    _caches.append('_oerp_ids')
+
     def oerp_id(self, sep='.', check_extend=True, return_parent=False, ignore=['ir.needaction_mixin','mail.thread']):
+        """Return the OpenERP model name of the class.
+
+        Results are stored by arguments and computed again when a tag, name,
+        stereotype or generalization of the model changes.
+        """
+        version = (_generalizations_version, _members_version, _tags_version, _stereotypes_version)
+        cached = getattr(self, '_oerp_ids', None)
+        if cached is None or cached[0] != version:
+            cached = self._oerp_ids = (version, {})
+        key = (sep, check_extend, return_parent, tuple(ignore))
+        r = cached[1].get(key)
+        if r is None:
+            r = cached[1][key] = self._oerp_id(sep, check_extend, return_parent, ignore)
+        return r
+
+    def _oerp_id(self, sep, check_extend, return_parent, ignore):
         model_name = self.tag.get('model_name', '')
         if model_name:
             return model_name
@@ -630,6 +919,13 @@ class CClass(CDataType):
                 #return sep.join([parent.package.name, parent.name])
         return sep.join([self.package.name, self.name])
 
+def oerp_ids(entities, *args, **kwargs):
+    """Return a dict with the oerp_id of each entity.
+
+    Arguments are passed to oerp_id.
+    """
+    return dict((entity, entity.oerp_id(*args, **kwargs)) for entity in entities)
+
 class CMember(CEntity):
     """Member of a class class.
 
@@ -644,7 +940,7 @@ class CMember(CEntity):
     __tablename__ = 'cmember'
 
     id = Column(Integer, ForeignKey('centity.id'), primary_key=True)
-    member_of_id = Column(Integer, ForeignKey('cclass.id'))
+    member_of_id = Column(Integer, ForeignKey('cclass.id'), index=True)
 
     __mapper_args__ = {'polymorphic_identity': 'cmember'}
 
@@ -677,7 +973,7 @@ class CAttribute(CMember):
     __tablename__ = 'cattribute'
 
     id = Column(Integer, ForeignKey('cmember.id'), primary_key=True)
-    datatype_id = Column(Integer, ForeignKey('cdatatype.id'))
+    datatype_id = Column(Integer, ForeignKey('cdatatype.id'), index=True)
     size = Column(Integer)
 
     __mapper_args__ = {'polymorphic_identity': 'cattribute'}
@@ -733,8 +1029,8 @@ class CParameter(CEntity):
     __tablename__ = 'cparameter'
 
     id = Column(Integer, ForeignKey('centity.id'), primary_key=True)
-    datatype_id = Column(Integer, ForeignKey('cdatatype.id'))
-    operation_id = Column(Integer, ForeignKey('coperation.id'))
+    datatype_id = Column(Integer, ForeignKey('cdatatype.id'), index=True)
+    operation_id = Column(Integer, ForeignKey('coperation.id'), index=True)
     kind = Column(String)
 
     __mapper_args__ = { 'polymorphic_identity': 'cparameter' }
@@ -790,8 +1086,8 @@ class CTaggedValue(CEntity):
 
     id = Column(Integer, ForeignKey('centity.id'), primary_key=True)
     value = Column(String)
-    tagdefinition_id = Column(Integer, ForeignKey('ctagdefinition.id'))
-    owner_id = Column(Integer, ForeignKey('centity.id'))
+    tagdefinition_id = Column(Integer, ForeignKey('ctagdefinition.id'), index=True)
+    owner_id = Column(Integer, ForeignKey('centity.id'), index=True)
 
     __mapper_args__ = {
         'polymorphic_identity': 'ctaggedvalue',
@@ -811,6 +1107,45 @@ class CTaggedValue(CEntity):
     def __repr__(self):
         return "<CTaggedValue(xmi_id:'%s', tag:'%s', value:'%s')>" % (self.xmi_id, self.tagdefinition.name, self.value)
 
+# Listeners of mapped attributes, as (class name, attribute, event, function
+# name), so the memory backend calls the same functions.
+_listeners = []
+
+def _listen(attr, identifier, fn, **kw):
+    _listeners.append((attr.class_.__name__, attr.key, identifier, fn.__name__))
+    event.listen(attr, identifier, fn, **kw)
+
+# Version of the tags of the model, increased each time one changes.
+_tags_version = 0
+
+def _forget_tag(target, *args):
+    global _tags_version
+    _tags_version += 1
+    if target is not None:
+        target._tag = None
+
+def _forget_owner_tag(target, *args):
+    if target.owner is not None:
+        _forget_tag(target.owner)
+
+for _event in ('append', 'remove'):
+    _listen(CEntity.tagvalues, _event, _forget_tag, propagate=True)
+for _attr in (CEntity.label, CEntity.default_tags):
+    _listen(_attr, 'set', _forget_tag, propagate=True)
+for _event in ('expire', 'refresh'):
+    event.listen(CEntity, _event, _forget_tag, propagate=True)
+_listen(CTaggedValue.value, 'set', _forget_owner_tag, propagate=True)
+_listen(CTaggedValue.tagdefinition, 'set', _forget_owner_tag, propagate=True)
+
+def _forget_definition_tags(target, *args):
+    # Called by the memory backend when any entity is renamed.
+    if isinstance(target, CTagDefinition):
+        _forget_tag(None)
+        for value in target.values:
+            _forget_owner_tag(value)
+
+_listen(CTagDefinition.name, 'set', _forget_definition_tags)
+
 class CAssociation(CEntity):
     """Association class.
 
@@ -856,11 +1191,13 @@ class CAssociationEnd(CEntity):
     __tablename__ = 'cassociationend'
 
     id = Column(Integer, ForeignKey('centity.id'), primary_key=True)
-    association_id = Column(Integer, ForeignKey('cassociation.id'))
-    participant_id = Column(Integer, ForeignKey('centity.id'))
+    association_id = Column(Integer, ForeignKey('cassociation.id'), index=True)
+    participant_id = Column(Integer, ForeignKey('centity.id'), index=True)
     isNavigable = Column(Boolean)
     aggregation = Column(String)
-    multiplicityrange = Column(String)
+    lower = Column(Integer)
+    upper = Column(Integer)
+    cardinality = Column(String)
 
     __mapper_args__ = {
         'polymorphic_identity': 'cassociationend',
@@ -882,6 +1219,18 @@ class CAssociationEnd(CEntity):
     def __repr__(self):
         return "<CAssociationEnd(xmi_id:'%s', name:'%s')>" % (self.xmi_id, self.name)
 
+    @property
+    def multiplicityrange(self):
+        """Multiplicity of the end or None if it is not defined."""
+        if self.lower is None:
+            return None
+        return Multiplicity(self.lower, self.upper)
+
+    @multiplicityrange.setter
+    def multiplicityrange(self, value):
+        self.lower, self.upper = (None, None) if value is None else value
+        self.cardinality = solvmul(value, self.aggregation)
+
     @property
     def swap(self):
         return [ e for e in self.association.ends if e.xmi_id != self.xmi_id ]
@@ -892,8 +1241,8 @@ class CAssociationEnd(CEntity):
             if not 'related_by' in self.tag.keys():
                 raise RuntimeError, "Attribute %s.%s is a relation without path. Please set related_by tag." % (self.swap[0].participant.name, self.name)
             return 'related'
-        my_mul = solvmul(self.multiplicityrange, self.aggregation)
-        hi_mul = solvmul(self.swap[0].multiplicityrange, self.swap[0].aggregation)
+        my_mul = self.cardinality
+        hi_mul = self.swap[0].cardinality
         if my_mul is None or hi_mul is None:
             logging.warning("Multiplicity: Unsupported range %s, %s, %s, %s, %s, %s." (
                 self.participant.name, self.name, my_situation,
@@ -918,8 +1267,8 @@ class CGeneralization(CEntity):
     __tablename__ = 'cgeneralization'
 
     id = Column(Integer, ForeignKey('centity.id'), primary_key=True)
-    parent_id = Column(Integer, ForeignKey('centity.id'))
-    child_id = Column(Integer, ForeignKey('centity.id'))
+    parent_id = Column(Integer, ForeignKey('centity.id'), index=True)
+    child_id = Column(Integer, ForeignKey('centity.id'), index=True)
 
     parent = relationship('CEntity',
                           primaryjoin=(parent_id==CEntity.id),
@@ -941,10 +1290,39 @@ class CGeneralization(CEntity):
     def __repr__(self):
         return "<CGeneralization(xmi_id:'%s', parent:'%s', child: '%s')>" % (self.xmi_id, self.parent.name, self.child.name)
 
+# Version of the generalizations, increased each time one changes.
+_generalizations_version = 0
+
+def _forget_lineage(*args):
+    global _generalizations_version
+    _generalizations_version += 1
+
+for _attr in (CGeneralization.parent, CGeneralization.child):
+    _listen(_attr, 'set', _forget_lineage)
+
+# Version of the members and associations, increased each time one changes.
+_members_version = 0
+
+def _forget_members(*args):
+    global _members_version
+    _members_version += 1
+
+for _attr in (CMember.member_of, CAssociationEnd.participant, CAssociationEnd.isNavigable):
+    _listen(_attr, 'set', _forget_members, propagate=True)
+for _event in ('append', 'remove'):
+    _listen(CAssociation.ends, _event, _forget_members)
+for _attr in (CEntity.name, CEntity.order, CEntity.package):
+    _listen(_attr, 'set', _forget_members, propagate=True)
+
+def _update_cardinality(target, value, oldvalue, initiator):
+    target.cardinality = solvmul(target.multiplicityrange, value)
+
+_listen(CAssociationEnd.aggregation, 'set', _update_cardinality)
+
 stereotypes = Table(
     'stereotypes', Base.metadata,
-    Column('centity_id', Integer, ForeignKey('centity.id')),
-    Column('cstereotype_id', Integer, ForeignKey('cstereotype.id'))
+    Column('centity_id', Integer, ForeignKey('centity.id'), index=True),
+    Column('cstereotype_id', Integer, ForeignKey('cstereotype.id'), index=True)
     )
 
 class CStereotype(CEntity):
@@ -970,6 +1348,31 @@ class CStereotype(CEntity):
     def __repr__(self):
         return "<CStereotype(xmi_id:'%s', name:'%s')>" % (self.xmi_id, self.name)
 
+# Version of the stereotypes of the model, increased each time one changes.
+_stereotypes_version = 0
+
+def _forget_stereotypes(target, *args):
+    global _stereotypes_version
+    _stereotypes_version += 1
+    if target is not None:
+        target._stereotype_names = None
+
+def _forget_entity_stereotypes(target, value, *args):
+    _forget_stereotypes(value)
+
+for _event in ('append', 'remove'):
+    _listen(CStereotype.entities, _event, _forget_entity_stereotypes)
+for _event in ('expire', 'refresh'):
+    event.listen(CEntity, _event, _forget_stereotypes, propagate=True)
+
+def _is_initial(in_transitions):
+    """Return whether a state with in_transitions is reached from an initial pseudostate."""
+    return any(getattr(t.state_from, 'kind', '') == 'initial' for t in in_transitions)
+
+def _is_final(out_transitions):
+    """Return whether a state with out_transitions reaches a final state."""
+    return any(type(t.state_to) is CFinalState for t in out_transitions)
+
 class CStateMachine(CEntity):
     """StateMachine class.
 
@@ -979,7 +1382,7 @@ class CStateMachine(CEntity):
     __tablename__ = 'cstatemachine'
 
     id = Column(Integer, ForeignKey('centity.id'), primary_key=True)
-    context_id = Column(Integer, ForeignKey('centity.id', use_alter=True, name='sm_context_id'))
+    context_id = Column(Integer, ForeignKey('centity.id', use_alter=True, name='sm_context_id'), index=True)
 
     context = relationship('CEntity',
                            primaryjoin=context_id==CEntity.id,
@@ -999,6 +1402,123 @@ class CStateMachine(CEntity):
     def __repr__(self):
         return "<CStateMachine(xmi_id:'%s', name:'%s')>" % (self.xmi_id, self.name)
 
+    class Graph(object):
+        """States and transitions of a state machine, compiled once.
+
+        Transitions are kept in adjacency lists by state, and the simple
+        states are classified as initial, middle and final.
+
+        >>> from xmi2odoo.model import Model
+        >>> model = Model("xmi2odoo/test/data/test_005.xmi")
+        >>> sm = model['test_005:workflow']
+        >>> graph = sm.graph
+        >>> [ s.name for s in graph.initial ], [ s.name for s in graph.middle ], [ s.name for s in graph.final ]
+        ([u'draft'], [u'failed'], [u'confirmed'])
+        >>> [ s.name for s in graph.ordered ], graph.position[model['test_005:confirmed']]
+        ([u'draft', u'failed', u'confirmed'], 2)
+        >>> sm.graph is graph
+        True
+        """
+
+        def __init__(self, statemachine):
+            self.statemachine = statemachine
+            self.states = list(statemachine.list_states())
+            self._outgoing = {}
+            self._incoming = {}
+            self._defaults = {}
+            self.initial = [ s for s in self.states if self.is_initial(s) ]
+            self.final = [ s for s in self.states if self.is_final(s) ]
+            self.middle = [ s for s in self.states if not self.is_final(s) and not self.is_initial(s) ]
+            self.ordered = self._order(self.initial + self.middle + self.final)
+            self.position = dict((s, i) for i, s in enumerate(self.ordered))
+
+        def outgoing(self, state):
+            """Transitions leaving state."""
+            transitions = self._outgoing.get(state)
+            if transitions is None:
+                transitions = self._outgoing[state] = list(state.out_transitions)
+            return transitions
+
+        def incoming(self, state):
+            """Transitions reaching state."""
+            transitions = self._incoming.get(state)
+            if transitions is None:
+                transitions = self._incoming[state] = list(state.in_transitions)
+            return transitions
+
+        def defaults(self, state):
+            """States reached from state by default transitions, sorted by name."""
+            states = self._defaults.get(state)
+            if states is None:
+                states = self._defaults[state] = sorted((t.state_to for t in self.outgoing(state)
+                                                         if t.is_stereotype('default')),
+                                                        key=lambda a: a.name)
+            return states
+
+        def is_initial(self, state):
+            """As CBaseState.is_initial."""
+            return _is_initial(self.incoming(state))
+
+        def is_final(self, state):
+            """As CBaseState.is_final."""
+            return _is_final(self.outgoing(state))
+
+        def stereotype_states(self, stereotype):
+            return [ s for s in self.states if s.is_stereotype(stereotype) ]
+
+        def _order(self, states):
+            """Return states ordered giving priority to the default ones.
+
+            States are taken from a queue. The states reached by default
+            transitions from the taken one are moved to the front of the queue,
+            even if they were taken before. The result has each state at the
+            position of the last time it was taken. The queue is a stack with
+            the front at the end; moved states leave stale items behind.
+            """
+            taken = collections.OrderedDict()
+            queued = {}
+            stack = [ (s, 0) for s in reversed(states) ]
+            for s in states:
+                queued[s] = 0
+            step = 0
+            again = 0
+            while stack:
+                s, pushed = stack.pop()
+                if queued.get(s) != pushed:
+                    continue
+                del queued[s]
+                if s in taken:
+                    # Taken states only come back right after their queueing.
+                    if pushed != step:
+                        continue
+                    again += 1
+                    if again > len(taken):
+                        raise RuntimeError, 'Circular default transitions found in %s.' % self.statemachine.name
+                    del taken[s]
+                else:
+                    again = 0
+                taken[s] = True
+                step += 1
+                for n in reversed(self.defaults(s)):
+                    stack.append((n, step))
+                    queued[n] = step
+            return list(taken)
+
+    _caches.append('_graph')
+
+    @property
+    def graph(self):
+        """The compiled Graph of the state machine.
+
+        The graph is computed again when the states, transitions, names or
+        stereotypes of the model change.
+        """
+        version = (_statemachines_version, _stereotypes_version)
+        cached = getattr(self, '_graph', None)
+        if cached is None or cached[0] != version:
+            cached = self._graph = (version, CStateMachine.Graph(self))
+        return cached[1]
+
     def list_states(self, ctype=None):
         ctype = ctype or CSimpleState
         for s in self.states:
@@ -1006,31 +1526,19 @@ class CStateMachine(CEntity):
                 yield s
 
     def list_ordered_states(self, ctype=None):
-        def take(S, D=[]):
-            """
-            Ordena estados en general, priorizando los por defecto.
-            """
-            if S == []:
-                return D
-            else:
-                s = S.pop(0)
-                N = sorted(s.next_states(stereotypes=['default']), key=lambda a: a.name)
-                return take(N + filter(lambda ns: ns not in N + D,S),
-                            filter(lambda ns: ns != s, D) + [s])
-
-        return take(self.initial_states() + self.middle_states() + self.final_states())
+        return list(self.graph.ordered)
 
     def initial_states(self):
-        return [ s for s in self.list_states() if s.is_initial() ]
+        return list(self.graph.initial)
 
     def final_states(self):
-        return [ s for s in self.list_states() if s.is_final() ]
+        return list(self.graph.final)
 
     def middle_states(self):
-        return [ s for s in self.list_states() if not s.is_final() and not s.is_initial() ]
+        return list(self.graph.middle)
 
     def stereotype_states(self, stereotype):
-        return [ s for s in self.list_states() if s.is_stereotype(stereotype) ]
+        return self.graph.stereotype_states(stereotype)
 
     def middle_transitions(self):
         for t in self.transitions:
@@ -1045,8 +1553,8 @@ class CStateMachine(CEntity):
             yield tt
 
     def list_ordered_triggers(self):
-        S = self.list_ordered_states()
-        ST = sorted([ t for t in self.transitions if t.trigger is not None ], key=lambda t: S.index(t.state_to)*S.index(t.state_from))
+        position = self.graph.position
+        ST = sorted([ t for t in self.transitions if t.trigger is not None ], key=lambda t: position[t.state_to]*position[t.state_from])
         seen = set()
         seen_add = seen.add
         TT = [ x.trigger for x in reversed(ST) if x.trigger.name not in seen and not seen_add(x.trigger.name)]
@@ -1061,8 +1569,8 @@ class CBaseState(CEntity):
     __tablename__ = 'cbasestate'
 
     id = Column(Integer, ForeignKey('centity.id'), primary_key=True)
-    statemachine_id = Column(Integer, ForeignKey('cstatemachine.id'))
-    state_of_id = Column(Integer, ForeignKey('ccompositestate.id', use_alter=True, name='sm_state_composition_id'))
+    statemachine_id = Column(Integer, ForeignKey('cstatemachine.id'), index=True)
+    state_of_id = Column(Integer, ForeignKey('ccompositestate.id', use_alter=True, name='sm_state_composition_id'), index=True)
 
     statemachine = relationship('CStateMachine',
                              primaryjoin='CBaseState.statemachine_id==CStateMachine.id',
@@ -1094,14 +1602,6 @@ class CBaseState(CEntity):
         for t in self.out_transitions:
             yield t.state_to
 
-    def is_initial(self):
-        return max([ getattr(s, 'kind', '') == 'initial'
-                    for s in self.prev_states() ] + [ False ])
-    
-    def is_final(self):
-        return max([ type(s) is CFinalState
-                    for s in self.next_states() ] + [ False ])
-
     def is_default(self):
         return any(t.is_stereotype('default') for t in self.transition_in)
 
@@ -1116,12 +1616,10 @@ class CBaseState(CEntity):
                 yield t.state_to
 
     def is_initial(self):
-        return max([ getattr(s, 'kind', '') == 'initial'
-                    for s in self.prev_states() ] + [ False ])
-    
+        return _is_initial(self.in_transitions)
+
     def is_final(self):
-        return max([ type(s) is CFinalState
-                    for s in self.next_states() ] + [ False ])
+        return _is_final(self.out_transitions)
 
     class BFS:
         def __init__(self, begin_states, final_states):
@@ -1361,7 +1859,7 @@ class CCallAction(CAction):
     __tablename__ = 'ccallaction'
 
     id = Column(Integer, ForeignKey('caction.id'), primary_key=True)
-    operation_id = Column(Integer, ForeignKey('coperation.id'))
+    operation_id = Column(Integer, ForeignKey('coperation.id'), index=True)
 
     operation = relationship('COperation',
                             primaryjoin=(operation_id==COperation.id),
@@ -1430,7 +1928,7 @@ class CCallEvent(CEvent):
     __tablename__ = 'ccallevent'
 
     id = Column(Integer, ForeignKey('cevent.id'), primary_key=True)
-    operation_id = Column(Integer, ForeignKey('coperation.id'))
+    operation_id = Column(Integer, ForeignKey('coperation.id'), index=True)
 
     operation = relationship('COperation',
                             primaryjoin=(operation_id==COperation.id),
@@ -1482,7 +1980,7 @@ class CSignalEvent(CEvent):
     __tablename__ = 'csignalevent'
 
     id = Column(Integer, ForeignKey('cevent.id'), primary_key=True)
-    signal_id = Column(Integer, ForeignKey('csignal.id'))
+    signal_id = Column(Integer, ForeignKey('csignal.id'), index=True)
 
     signal = relationship('CSignal',
                             primaryjoin=(signal_id==CSignal.id),
@@ -1513,12 +2011,12 @@ class CTransition(CEntity):
     __tablename__ = 'ctransition'
 
     id = Column(Integer, ForeignKey('centity.id'), primary_key=True)
-    statemachine_id = Column(Integer, ForeignKey('cstatemachine.id'))
-    state_from_id = Column(Integer, ForeignKey('cbasestate.id'))
-    state_to_id = Column(Integer, ForeignKey('cbasestate.id'))
-    guard_id = Column(Integer, ForeignKey('cexpression.id'))
-    effect_id = Column(Integer, ForeignKey('caction.id'))
-    trigger_id = Column(Integer, ForeignKey('cevent.id'))
+    statemachine_id = Column(Integer, ForeignKey('cstatemachine.id'), index=True)
+    state_from_id = Column(Integer, ForeignKey('cbasestate.id'), index=True)
+    state_to_id = Column(Integer, ForeignKey('cbasestate.id'), index=True)
+    guard_id = Column(Integer, ForeignKey('cexpression.id'), index=True)
+    effect_id = Column(Integer, ForeignKey('caction.id'), index=True)
+    trigger_id = Column(Integer, ForeignKey('cevent.id'), index=True)
 
     statemachine = relationship('CStateMachine',
                              primaryjoin=statemachine_id==CStateMachine.id,
@@ -1556,4 +2054,16 @@ class CTransition(CEntity):
     def __repr__(self):
         return "<CTransition(xmi_id:'%s', name:'%s')>" % (self.xmi_id, self.name)
 
+# Version of the state machines, increased each time a state or transition changes.
+_statemachines_version = 0
+
+def _forget_graph(*args):
+    global _statemachines_version
+    _statemachines_version += 1
+
+for _attr in (CBaseState.statemachine, CTransition.statemachine, CTransition.state_from, CTransition.state_to):
+    _listen(_attr, 'set', _forget_graph, propagate=True)
+for _attr in (CPseudostate.kind, CEntity.name):
+    _listen(_attr, 'set', _forget_graph, propagate=True)
+
 # vim:expandtab:smartindent:tabstop=4:softtabstop=4:shiftwidth=4:
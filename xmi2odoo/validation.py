@@ -34,7 +34,7 @@ class Validator():
 
     def check_duplicated_attributes(self):
         r = True
-        for c in self.model.session.query(CClass):
+        for c in self.model.iterentities(CClass):
             all_attributes = c.all_attributes()
             uni_attributes = set(all_attributes)
             if len(all_attributes) != len(uni_attributes):
@@ -46,7 +46,7 @@ class Validator():
 
     def check_duplicated_associations(self):
         r = True
-        for c in self.model.session.query(CClass):
+        for c in self.model.iterentities(CClass):
             all_associations = [ a.name for a in c.all_associations() if a.name is not None ]
             uni_associations = set(all_associations)
             if len(all_associations) != len(uni_associations):
@@ -58,7 +58,7 @@ class Validator():
 
     def check_state_machines(self):
         r = True
-        for sm in self.model.session.query(CStateMachine):
+        for sm in self.model.iterentities(CStateMachine):
             # Must have name
             if sm.name is None:
                 logging.error('Statemachine xmi_id=%s must have name' % (sm.xmi_id))